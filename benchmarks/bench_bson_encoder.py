@@ -0,0 +1,78 @@
+"""
+Benchmark: DataFrame -> MongoDB documents.
+
+Compares, on the output of convert_types():
+- to_dict(orient="records")          (the previous writer path)
+- encoder.to_documents()             (column-wise conversion)
+each followed by BSON encoding, which is what insert_many does with them.
+to_dict's documents hold pd.NA / NaT that BSON cannot encode, so for that
+path only the conversion time is reported when encoding fails.
+
+Run from the repository root:
+    python -m benchmarks.bench_bson_encoder --rows 500000
+"""
+
+import argparse
+import time
+
+import bson
+import numpy as np
+import pandas as pd
+
+from etl.load.encoder import to_documents, to_raw_bson
+from etl.transform_layer.converters import convert_types
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "id": rng.integers(0, 1_000_000, rows).astype(str),
+        "age": rng.integers(18, 90, rows).astype(object),
+        "price": rng.random(rows) * 100,
+        "is_active": rng.choice(["yes", "no", "maybe"], rows),
+        "name": rng.choice(["alice", "bob", "carol"], rows),
+        "status": rng.choice(["active", "inactive", None], rows),
+        "created_at": rng.choice(["2024-01-05", "2023-11-30", "not a date"], rows),
+        "note": rng.choice(["x", "y"], rows),
+    })
+    df.loc[df.sample(frac=0.1, random_state=0).index, "age"] = None
+    return convert_types(df)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def encode_all(docs):
+    for doc in docs:
+        bson.encode(doc)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the DataFrame -> BSON document encoder")
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    print(f"{args.rows} rows, dtypes: {', '.join(f'{c}={t}' for c, t in df.dtypes.items())}\n")
+    print(f"{'path':<24} {'convert s':>10} {'bson s':>10} {'total s':>10}")
+
+    docs, convert_s = timed(lambda: df.to_dict(orient="records"))
+    try:
+        _, encode_s = timed(lambda: encode_all(docs))
+        print(f"{'to_dict(records)':<24} {convert_s:10.3f} {encode_s:10.3f} {convert_s + encode_s:10.3f}")
+    except Exception as e:
+        print(f"{'to_dict(records)':<24} {convert_s:10.3f} {'fails':>10}  ({type(e).__name__}: {e})")
+
+    docs, convert_s = timed(lambda: to_documents(df))
+    _, encode_s = timed(lambda: encode_all(docs))
+    print(f"{'encoder.to_documents':<24} {convert_s:10.3f} {encode_s:10.3f} {convert_s + encode_s:10.3f}")
+
+    _, raw_s = timed(lambda: to_raw_bson(df))
+    print(f"{'encoder.to_raw_bson':<24} {'':>10} {'':>10} {raw_s:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
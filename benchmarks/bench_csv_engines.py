@@ -0,0 +1,95 @@
+"""
+Benchmark: delimited-file throughput for each reader engine.
+
+Compares read_delimited() with
+- engine="pandas"  (C parser, single core)
+- engine="pyarrow" (multithreaded Arrow CSV reader)
+- engine="pyarrow", dtype_backend="pyarrow" (Arrow-backed string columns)
+on a tall file (many rows, few columns) and a wide file (many columns).
+
+Run from the repository root:
+    python -m benchmarks.bench_csv_engines --tall-rows 2000000 --wide-cols 500
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from etl.extract.file_handlers import read_delimited, iter_delimited_chunks
+
+CASES = [
+    ("pandas", None),
+    ("pandas", "pyarrow"),
+    ("pyarrow", None),
+    ("pyarrow", "pyarrow"),
+]
+
+
+def make_tall(path, rows):
+    rng = np.random.default_rng(0)
+    pd.DataFrame({
+        "id": np.arange(rows),
+        "name": rng.choice(["alice", "bob", "carol", "dave"], rows),
+        "city": rng.choice(["Pune", "Chennai", "Jaipur", "Kolkata"], rows),
+        "age": rng.integers(18, 90, rows),
+        "price": rng.random(rows) * 100,
+        "amount": rng.random(rows) * 1000,
+        "country_code": rng.choice(["US", "IN", "DE", "FR"], rows),
+        "status": rng.choice(["active", "inactive"], rows),
+    }).to_csv(path, index=False)
+
+
+def make_wide(path, rows, cols):
+    rng = np.random.default_rng(1)
+    data = {}
+    for i in range(cols):
+        if i % 3 == 0:
+            data[f"text_{i}"] = rng.choice(["a", "bb", "ccc"], rows)
+        else:
+            data[f"num_{i}"] = rng.random(rows)
+    pd.DataFrame(data).to_csv(path, index=False)
+
+
+def run_case(path, engine, dtype_backend, chunksize=None):
+    start = time.perf_counter()
+    if chunksize:
+        rows = sum(len(c) for c in iter_delimited_chunks(path, chunksize, engine=engine, dtype_backend=dtype_backend))
+    else:
+        rows = len(read_delimited(path, engine=engine, dtype_backend=dtype_backend))
+    return rows, time.perf_counter() - start
+
+
+def bench(label, path, chunksize):
+    size_mb = os.path.getsize(path) / 1e6
+    print(f"\n{label}: {size_mb:.1f} MB")
+    print(f"{'engine':<10} {'dtype_backend':<14} {'mode':<8} {'seconds':>8} {'MB/s':>8}")
+    for engine, dtype_backend in CASES:
+        for mode, size in (("full", None), ("chunked", chunksize)):
+            rows, seconds = run_case(path, engine, dtype_backend, size)
+            print(f"{engine:<10} {str(dtype_backend):<14} {mode:<8} {seconds:8.3f} {size_mb / seconds:8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CSV reader engines")
+    parser.add_argument("--tall-rows", type=int, default=1_000_000)
+    parser.add_argument("--wide-rows", type=int, default=20_000)
+    parser.add_argument("--wide-cols", type=int, default=500)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tall = os.path.join(tmp, "tall.csv")
+        wide = os.path.join(tmp, "wide.csv")
+        make_tall(tall, args.tall_rows)
+        make_wide(wide, args.wide_rows, args.wide_cols)
+
+        bench(f"tall ({args.tall_rows} x 8)", tall, args.chunksize)
+        bench(f"wide ({args.wide_rows} x {args.wide_cols})", wide, args.chunksize)
+
+
+if __name__ == "__main__":
+    main()
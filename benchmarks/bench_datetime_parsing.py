@@ -0,0 +1,67 @@
+"""
+Benchmark: pd.to_datetime(errors="coerce") vs datetimes.parse_datetimes.
+
+Columns:
+- iso            high-cardinality ISO timestamps
+- bad_first      day-first timestamps whose first value is unparseable
+                 (pandas then parses every row with dateutil)
+- mixed          ISO timestamps with 2% of the rows in another format
+- low_card       a few hundred distinct "05 Jan 2024" dates across the rows
+For each column the number of rows parsed (non-NaT) is reported too; the
+formatless pd.to_datetime turns rows in a second format into NaT.
+
+Run from the repository root:
+    python -m benchmarks.bench_datetime_parsing --rows 200000
+"""
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from etl.transform_layer.datetimes import parse_datetimes
+
+
+def make_columns(rows):
+    rng = np.random.default_rng(0)
+    stamps = pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 5 * 365 * 86400, rows), unit="s")
+    iso = stamps.strftime("%Y-%m-%d %H:%M:%S").to_numpy(dtype=object)
+
+    bad_first = stamps.strftime("%d/%m/%Y %H:%M").to_numpy(dtype=object)
+    bad_first[0] = "not a date"
+
+    mixed = iso.copy()
+    odd = rng.random(rows) < 0.02
+    mixed[odd] = stamps[odd].strftime("%d %b %Y %H:%M")
+
+    days = pd.date_range("2023-01-01", periods=300).strftime("%d %b %Y").to_numpy(dtype=object)
+    low_card = rng.choice(days, rows)
+
+    return {"iso": iso, "bad_first": bad_first, "mixed": mixed, "low_card": low_card}
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark datetime parsing")
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore", UserWarning)
+
+    print(f"{args.rows} rows\n")
+    print(f"{'column':<10} {'to_datetime s':>14} {'parsed':>9} {'parse_datetimes s':>18} {'parsed':>9} {'speedup':>8}")
+    for name, values in make_columns(args.rows).items():
+        series = pd.Series(values)
+        old, old_s = timed(lambda: pd.to_datetime(series, errors="coerce"))
+        new, new_s = timed(lambda: parse_datetimes(series))
+        print(f"{name:<10} {old_s:14.3f} {old.notna().sum():9d} {new_s:18.3f} {new.notna().sum():9d} {old_s / new_s:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
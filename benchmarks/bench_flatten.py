@@ -0,0 +1,64 @@
+"""
+Benchmark: row-wise flatten_json() + pd.DataFrame(list_of_dicts)
+versus the columnar ColumnarFlattener.
+
+Run from the repository root:
+    python -m benchmarks.bench_flatten --records 200000 --depth 4
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+from etl.extract.extractor import flatten_json
+from etl.extract.flattener import flatten_records
+
+
+def make_record(i, depth, fanout):
+    """Nested API-style record with dicts, lists and a few missing keys."""
+    def node(level):
+        if level == depth:
+            return {"value": i * level, "label": f"item-{i}", "flag": i % 2 == 0}
+        out = {f"k{j}": node(level + 1) for j in range(fanout)}
+        out["tags"] = [f"t{j}" for j in range(i % 3)]
+        return out
+
+    record = {"id": i, "payload": node(1)}
+    if i % 7:
+        record["optional"] = {"note": "x" * (i % 5)}
+    return record
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    duration = time.perf_counter() - start
+    print(f"{label:<28} {duration:8.3f}s")
+    return result, duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON flattening strategies")
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=2)
+    args = parser.parse_args()
+
+    random.seed(0)
+    records = [make_record(i, args.depth, args.fanout) for i in range(args.records)]
+    print(f"{args.records} records, depth={args.depth}, fanout={args.fanout}\n")
+
+    df_old, t_old = timed("row-wise (flatten_json)", lambda: pd.DataFrame([flatten_json(r) for r in records]))
+    df_new, t_new = timed("columnar -> DataFrame", lambda: flatten_records(records))
+    table, t_arrow = timed("columnar -> Arrow table", lambda: flatten_records(records, output="arrow"))
+
+    pd.testing.assert_frame_equal(df_old, df_new, check_index_type=False, check_column_type=False)
+    print(f"\ncolumns: {df_new.shape[1]}, arrow columns: {table.num_columns}")
+    print(f"speedup (DataFrame): {t_old / t_new:.2f}x")
+    print(f"speedup (Arrow):     {t_old / t_arrow:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
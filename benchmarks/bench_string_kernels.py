@@ -0,0 +1,88 @@
+"""
+Benchmark: string normalization / bool parsing, pandas accessors vs Arrow kernels.
+
+Compares the previous implementations (astype("string") + .str accessors,
+and a Python lambda mapped per element for booleans) with the
+arrow_strings kernels used by normalization and converters now:
+- text    strip + collapse whitespace + lower   (standardize_string_columns)
+- code    strip + upper                         (normalize_code_fields)
+- string  astype                                (convert_to_string)
+- bool    lower + vocabulary membership         (convert_to_bool)
+The input is an object column, as extracted. Values are checked to match.
+
+Run from the repository root:
+    python -m benchmarks.bench_string_kernels --rows 10000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from etl.transform_layer import arrow_strings
+from etl.transform_layer.converters import FALSE_VALUES, TRUE_VALUES
+
+
+def make_columns(rows):
+    rng = np.random.default_rng(0)
+    text = np.array(["  Alice  Smith ", "BOB\tjones", "carol  ", " Dave Brown", "eve"], dtype=object)
+    codes = np.array([" us", "in ", "De", "fr", "gb "], dtype=object)
+    flags = np.array(["Yes", "no", "TRUE", "0", "maybe", "y"], dtype=object)
+    return {
+        "text": pd.Series(rng.choice(text, rows)),
+        "code": pd.Series(rng.choice(codes, rows)),
+        "string": pd.Series(rng.choice(codes, rows)),
+        "bool": pd.Series(rng.choice(flags, rows)),
+    }
+
+
+def previous(kind, s):
+    if kind == "text":
+        return s.astype("string").str.strip().str.replace(r"\s+", " ", regex=True).str.lower()
+    if kind == "code":
+        return s.astype("string").str.strip().str.upper()
+    if kind == "string":
+        return s.astype("string")
+    true_values, false_values = set(TRUE_VALUES), set(FALSE_VALUES)
+    return (
+        s.astype("string")
+        .str.lower()
+        .map(lambda v: True if v in true_values else False if v in false_values else pd.NA)
+        .astype("boolean")
+    )
+
+
+def arrow(kind, s):
+    if kind == "text":
+        return arrow_strings.standardize_text(s)
+    if kind == "code":
+        return arrow_strings.normalize_code(s)
+    if kind == "string":
+        return arrow_strings.to_arrow_string(s)
+    return arrow_strings.parse_bool(s, TRUE_VALUES, FALSE_VALUES)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Arrow string kernels")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"{args.rows} rows\n")
+    print(f"{'kernel':<8} {'pandas s':>9} {'arrow s':>9} {'speedup':>8} {'Mrows/s':>8}  values")
+    for kind, series in make_columns(args.rows).items():
+        old, old_s = timed(lambda: previous(kind, series))
+        new, new_s = timed(lambda: arrow(kind, series))
+        same = old.astype(object).equals(new.astype(object))
+        print(f"{kind:<8} {old_s:9.3f} {new_s:9.3f} {old_s / new_s:7.1f}x {args.rows / new_s / 1e6:8.1f}  "
+              f"{'same' if same else 'DIFFER'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: peak memory and wall time of run_transform_pipeline with and
+without copy-free mode (pandas Copy-on-Write + shallow step copies).
+
+Each mode runs in its own subprocess so peak RSS is not shared. The frame
+carries the columns the pipeline touches plus many passthrough columns,
+which the default mode deep-copies in every step.
+
+Run from the repository root:
+    python -m benchmarks.bench_transform_memory --rows 1000000 --extra-cols 40
+"""
+
+import argparse
+import logging
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+MODES = ("default", "copy_free")
+
+
+def make_frame(rows, extra_cols):
+    rng = np.random.default_rng(0)
+    data = {
+        "First Name": rng.choice(["Alice", "Bob", "Carol"], rows),
+        "Last Name": rng.choice(["Smith", "Jones"], rows),
+        "Age": rng.integers(1, 90, rows),
+        "Price": rng.random(rows) * 100,
+        "Country Code": rng.choice(["us", "in", "de"], rows),
+        "Updated At": rng.choice(["2024-01-05", "2025-06-30"], rows),
+        "Status": rng.choice(["active", "inactive"], rows),
+    }
+    for i in range(extra_cols):
+        data[f"metric_{i}"] = rng.random(rows)
+    return pd.DataFrame(data)
+
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def run_mode(mode, rows, extra_cols):
+    """Child process: build the frame, transform it, print the numbers."""
+    logging.disable(logging.CRITICAL)
+    from etl.transform_layer import run_transform_pipeline
+
+    df = make_frame(rows, extra_cols)
+    base = peak_rss_mb()
+    start = time.perf_counter()
+    out = run_transform_pipeline(df, copy_free=(mode == "copy_free"))
+    seconds = time.perf_counter() - start
+    peak = peak_rss_mb()
+    print(f"{mode} {seconds:.3f} {base:.1f} {peak:.1f} {pd.util.hash_pandas_object(out).sum()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transform peak memory (copy-free mode)")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--extra-cols", type=int, default=30)
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_mode(args.child, args.rows, args.extra_cols)
+        return
+
+    print(f"{args.rows} rows x {7 + args.extra_cols} columns\n")
+    print(f"{'mode':<10} {'seconds':>8} {'input MB':>9} {'peak MB':>8} {'+MB':>8}")
+    checksums = set()
+    for mode in MODES:
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_transform_memory", "--child", mode,
+             "--rows", str(args.rows), "--extra-cols", str(args.extra_cols)],
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        _, seconds, base, peak, checksum = out
+        checksums.add(checksum)
+        print(f"{mode:<10} {float(seconds):8.3f} {float(base):9.1f} {float(peak):8.1f} {float(peak) - float(base):8.1f}")
+
+    print("\noutputs identical" if len(checksums) == 1 else "\nWARNING: outputs differ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# etl/extract/cache.py
+"""
+On-disk cache for extracted DataFrames.
+
+Entries are keyed by the file's content hash, the extractor version and the
+extraction options, and stored as Parquet. Re-running the pipeline on the
+same file (e.g. after a transform or load failure) is then a Parquet read
+instead of a full xlsx/html/xml parse.
+
+Missing values in object columns come back as None (Parquet has a single
+null), which the transform layer treats the same as NaN.
+
+Least-recently-used entries are evicted once the cache grows past its size
+limit; a hit refreshes the entry's mtime, which is what LRU order uses.
+
+Configuration (environment):
+    ETL_CACHE_DIR     cache directory (default: .etl_cache)
+    ETL_CACHE_MAX_MB  size limit in MB (default: 1024)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".etl_cache"
+DEFAULT_MAX_MB = 1024
+_SUFFIX = ".parquet"
+
+
+def file_digest(path, block_size=1 << 20):
+    """Content hash of a file, read in blocks."""
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ExtractCache:
+    def __init__(self, directory=None, max_bytes=None):
+        self.directory = directory or os.getenv("ETL_CACHE_DIR", DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("ETL_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+
+    # ---------------------------------------------------------
+    # Keys
+    # ---------------------------------------------------------
+    def key(self, file_path, version, options=None):
+        options = json.dumps(options or {}, sort_keys=True, default=str)
+        h = hashlib.blake2b(digest_size=20)
+        h.update(file_digest(file_path).encode())
+        h.update(str(version).encode())
+        h.update(options.encode())
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    # ---------------------------------------------------------
+    # Get / Put
+    # ---------------------------------------------------------
+    def get(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            df = pd.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        os.utime(path)  # mark as recently used
+        return df
+
+    def put(self, key, df):
+        """
+        Store a frame. Frames Parquet cannot represent (non-string column
+        names, mixed-type object columns, ...) are simply not cached.
+        Returns True when the entry was written.
+        """
+        if not all(isinstance(col, str) for col in df.columns):
+            # Parquet would stringify the names and the frame would not round-trip
+            logger.debug("Frame not cacheable: non-string column names")
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_path, index=True)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            logger.debug(f"Frame not cacheable as Parquet: {e}")
+            self._remove(tmp_path)
+            return False
+
+        self.evict()
+        return True
+
+    # ---------------------------------------------------------
+    # Maintenance
+    # ---------------------------------------------------------
+    def _entries(self):
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """Remove least-recently-used entries until under the size limit."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"Extract cache: evicted {removed} entries ({total / 1e6:.1f} MB kept)")
+        return removed
+
+    def clear(self):
+        entries = self._entries()
+        for _, _, path in entries:
+            self._remove(path)
+        logger.info(f"Extract cache cleared ({len(entries)} entries) in {self.directory}")
+        return len(entries)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def get_cache():
+    """Cache configured from the environment."""
+    return ExtractCache()
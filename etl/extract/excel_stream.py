@@ -0,0 +1,241 @@
+# etl/extract/excel_stream.py
+"""
+Excel readers for the extract layer.
+
+.xlsx is read with openpyxl in read-only mode, so rows are pulled lazily
+from the worksheet XML and the full cell model is never built. .xls goes
+through xlrd.
+
+Cells keep the type Excel stored (number, date, bool, text). Each column
+is then narrowed with infer_objects(), so a column only becomes numeric or
+datetime when every value in it already is one. Text that merely looks
+numeric ("00123") stays text.
+
+Sheet selection (sheets=):
+    None            first sheet only, no tag column (previous behaviour)
+    "all" / "*"     every sheet
+    [names/indices] the listed sheets
+With an explicit selection every row is tagged with its sheet name in
+SHEET_COLUMN. Multi-sheet reads run one sheet per worker process.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+logger = logging.getLogger(__name__)
+
+SHEET_COLUMN = "sheet_name"
+ALL_SHEETS = ("all", "*")
+
+
+# ============================================================
+# Rows -> DataFrame
+# ============================================================
+def _trim(row):
+    """Drop trailing empty cells (read-only sheets often report a padded width)."""
+    end = len(row)
+    while end and (row[end - 1] is None or row[end - 1] == ""):
+        end -= 1
+    return row[:end]
+
+
+def rows_to_frame(header, rows):
+    """
+    Build a frame from typed cell rows. Header handling (Unnamed: n,
+    duplicate names) follows pd.read_excel; values are never re-parsed
+    from text.
+    """
+    width = max([len(header)] + [len(row) for row in rows])
+    header = ["" if name is None else name for name in header]
+    data = [header + [""] * (width - len(header))]
+    data.extend(list(row) + [None] * (width - len(row)) for row in rows)
+    return TextParser(data, header=0, dtype=object).read().infer_objects()
+
+
+# ============================================================
+# .xlsx (openpyxl read-only)
+# ============================================================
+class _Workbook:
+    """Read-only openpyxl workbook over a file object (openpyxl rejects paths without an Excel extension)."""
+
+    def __init__(self, path):
+        from openpyxl import load_workbook
+
+        self._file = open(path, "rb")
+        try:
+            self.wb = load_workbook(self._file, read_only=True, data_only=True)
+        except Exception:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self.wb
+
+    def __exit__(self, *exc):
+        self.wb.close()
+        self._file.close()
+
+
+def _xlsx_rows(ws):
+    """Non-blank, trimmed rows of a read-only worksheet, read lazily."""
+    for row in ws.iter_rows(values_only=True):
+        row = _trim(row)
+        if row:
+            yield row
+
+
+def _xlsx_sheet(wb, sheet):
+    return wb.worksheets[sheet] if isinstance(sheet, int) else wb[sheet]
+
+
+def read_xlsx_sheet(path, sheet=0):
+    with _Workbook(path) as wb:
+        rows = _xlsx_rows(_xlsx_sheet(wb, sheet))
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        return rows_to_frame(header, list(rows))
+
+
+# ============================================================
+# .xls (xlrd)
+# ============================================================
+def read_xls_sheet(path, sheet=0):
+    # dtype=object: keep xlrd's cell values instead of re-parsing them as text
+    df = pd.read_excel(path, engine="xlrd", sheet_name=sheet, dtype=object)
+    return df.infer_objects()
+
+
+def _xls_sheet_names(path):
+    import xlrd
+
+    book = xlrd.open_workbook(path, on_demand=True)
+    try:
+        return book.sheet_names()
+    finally:
+        book.release_resources()
+
+
+def _xlsx_sheet_names(path):
+    with _Workbook(path) as wb:
+        return wb.sheetnames
+
+
+_SHEET_READERS = {"xlsx": read_xlsx_sheet, "xls": read_xls_sheet}
+_SHEET_NAMES = {"xlsx": _xlsx_sheet_names, "xls": _xls_sheet_names}
+
+
+# ============================================================
+# Sheet selection
+# ============================================================
+def resolve_sheets(names, sheets=None):
+    """Map a sheets= selection onto the workbook's sheet names."""
+    if not names:
+        return []
+    if sheets is None:
+        return names[:1]
+    if isinstance(sheets, str):
+        if sheets.lower() in ALL_SHEETS:
+            return list(names)
+        sheets = [sheets]
+    elif isinstance(sheets, int):
+        sheets = [sheets]
+
+    selected = []
+    for sheet in sheets:
+        if isinstance(sheet, int):
+            if not -len(names) <= sheet < len(names):
+                raise ValueError(f"Sheet index {sheet} out of range ({len(names)} sheets)")
+            sheet = names[sheet]
+        elif sheet not in names:
+            raise ValueError(f"Worksheet '{sheet}' not found (available: {', '.join(names)})")
+        if sheet not in selected:
+            selected.append(sheet)
+    return selected
+
+
+def _read_tagged(job):
+    # top-level so it can be pickled into worker processes
+    file_type, path, sheet = job
+    df = _SHEET_READERS[file_type](path, sheet)
+    df[SHEET_COLUMN] = sheet
+    return df
+
+
+def read_excel_sheets(path, file_type="xlsx", sheets=None, workers=None):
+    """
+    Read the selected sheets of an .xlsx/.xls workbook into one frame.
+    workers caps the worker processes (default: one per sheet, up to the CPU count).
+    """
+    if sheets is None:
+        return _SHEET_READERS[file_type](path, 0)
+
+    names = resolve_sheets(_SHEET_NAMES[file_type](path), sheets)
+    if not names:
+        return pd.DataFrame()
+
+    start = time.perf_counter()
+    jobs = [(file_type, path, name) for name in names]
+    workers = max(1, min(len(jobs), workers or os.cpu_count() or 1))
+    if workers == 1:
+        frames = [_read_tagged(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = list(pool.map(_read_tagged, jobs))
+
+    logger.info(
+        f"Read {len(names)} sheets from {path} with {workers} worker(s) "
+        f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+    )
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_xlsx(path, sheets=None, workers=None):
+    return read_excel_sheets(path, "xlsx", sheets, workers)
+
+
+def read_xls(path, sheets=None, workers=None):
+    return read_excel_sheets(path, "xls", sheets, workers)
+
+
+# ============================================================
+# Chunked mode (sheets are streamed one after another)
+# ============================================================
+def _tag(df, sheet, sheets):
+    if sheets is not None:
+        df[SHEET_COLUMN] = sheet
+    return df
+
+
+def iter_xlsx_chunks(path, chunksize, sheets=None):
+    """
+    Stream rows of the selected sheets in read-only mode.
+    The first row of each sheet is used as its header.
+    """
+    with _Workbook(path) as wb:
+        for name in resolve_sheets(wb.sheetnames, sheets):
+            rows = _xlsx_rows(wb[name])
+            header = next(rows, None)
+            if header is None:
+                continue
+
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= chunksize:
+                    yield _tag(rows_to_frame(header, batch), name, sheets)
+                    batch = []
+            if batch:
+                yield _tag(rows_to_frame(header, batch), name, sheets)
+
+
+def iter_xls_chunks(path, chunksize, sheets=None):
+    for name in resolve_sheets(_xls_sheet_names(path), sheets):
+        df = _tag(read_xls_sheet(path, name), name, sheets)
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize].reset_index(drop=True)
@@ -37,14 +37,17 @@ class ExtractUI:
         file_path = filedialog.askopenfilename(
             title="Select a File",
             filetypes=[
-                ("All Supported", "*.json *.csv *.txt *.html *.xlsx *.xls *.tsv *.xml"),
+                ("All Supported", "*.json *.jsonl *.ndjson *.csv *.txt *.html *.xlsx *.xls *.tsv *.xml "
+                                  "*.parquet *.arrow *.feather *.ipc"),
                 ("JSON files", "*.json"),
+                ("JSON Lines files", "*.jsonl *.ndjson"),
                 ("CSV files", "*.csv"),
                 ("Text files", "*.txt"),
                 ("HTML files", "*.html"),
                 ("Excel files", "*.xlsx *.xls"),
                 ("TSV files", "*.tsv"),
                 ("XML files", "*.xml"),
+                ("Parquet / Arrow files", "*.parquet *.arrow *.feather *.ipc"),
             ]
         )
 
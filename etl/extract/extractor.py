@@ -1,9 +1,15 @@
 #extractor.py
 import os
 import time
-import json
+import numpy as np
 import pandas as pd
-from .file_handlers import READERS
+from .file_handlers import READERS, STREAM_READERS
+from .json_stream import iter_json_items, LINE_DELIMITED_TYPES
+from .flattener import ColumnarFlattener, flatten_records
+from .sniffer import sniff_file_type
+from .cache import get_cache
+from .excel_stream import SHEET_COLUMN
+from .projection import make_projection
 
 
 # ============================================================
@@ -39,80 +45,133 @@ def flatten_json(data, prefix=""):
 # ============================================================
 # 🔥 2. Smart JSON Extractor — handles ANY JSON file
 # ============================================================
-def extract_json_safely(filepath):
+def _is_line_delimited(filepath):
+    return detect_file_type(filepath) in LINE_DELIMITED_TYPES
+
+
+def _json_items(filepath):
+    return iter_json_items(filepath, lines=_is_line_delimited(filepath))
+
+
+def extract_json_safely(filepath, keep=None):
     """
     Handles:
     - root is LIST
     - root is DICT
-    - DICT contains arrays of dicts
+    - DICT contains arrays of dicts (largest list becomes the rows)
     - DICT contains mixed data
     - flattening AND row-expansion
+    - NDJSON / JSON Lines
+    Items are decoded one at a time and flattened straight into columns.
+    keep (a column-name predicate) skips storing unwanted leaves.
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    items, context = _json_items(filepath)
+    return flatten_records(items, context, keep=keep)
 
-    rows = []
 
-    # --------------------------------------------------------
-    # CASE 1: JSON = LIST at top-level
-    # --------------------------------------------------------
-    if isinstance(data, list):
-        return pd.DataFrame([flatten_json(item) for item in data])
+# ============================================================
+# 🔥 2b. Chunked JSON Extractor (streaming mode)
+# ============================================================
+def extract_json_chunks(filepath, chunksize, keep=None):
+    """
+    Streaming counterpart of extract_json_safely().
+    """
+    items, context = _json_items(filepath)
 
-    # --------------------------------------------------------
-    # CASE 2: JSON = DICT at root
-    # --------------------------------------------------------
-    if isinstance(data, dict):
+    flattener = ColumnarFlattener(keep=keep)
+    for item in items:
+        flattener.append(item, context)
+        if flattener.n_rows >= chunksize:
+            yield flattener.to_frame()
+            flattener = ColumnarFlattener(keep=keep)
 
-        # Find all lists inside dictionary
-        candidate_lists = [(key, v) for key, v in data.items() if isinstance(v, list)]
+    if flattener.n_rows:
+        yield flattener.to_frame()
 
-        if candidate_lists:
-            # Choose the largest list as the "rows"
-            root_key, largest_list = max(candidate_lists, key=lambda x: len(x[1]))
 
-            for item in largest_list:
-                flat = flatten_json(item)
+# ============================================================
+# 🔥 3. Patch-2: Make list columns rectangular
+# ============================================================
+LIST_MODES = ("pad", "explode")
 
-                # include non-list root fields as context
-                for k, v in data.items():
-                    if not isinstance(v, list):
-                        flat[k] = v
 
-                rows.append(flat)
+def _list_lengths(values):
+    """Single pass over a column: list length per cell, -1 for non-lists."""
+    return np.fromiter(
+        (len(x) if isinstance(x, list) else -1 for x in values),
+        dtype=np.int64,
+        count=len(values),
+    )
 
-            return pd.DataFrame(rows)
 
-        # --------------------------------------------------------
-        # If no lists found: flatten entire dictionary as ONE row
-        # --------------------------------------------------------
-        return pd.DataFrame([flatten_json(data)])
+def _find_list_columns(df):
+    """
+    Positions of columns that hold at least one list, with their cell lengths.
+    Lists can only live in object columns, so every other dtype is skipped.
+    """
+    found = {}
+    for pos, dtype in enumerate(df.dtypes):
+        if dtype != object:
+            continue
+        lengths = _list_lengths(df.iloc[:, pos])
+        if len(lengths) and lengths.max() >= 0:
+            found[pos] = lengths
+    return found
 
-    # --------------------------------------------------------
-    # CASE 3: Primitive types (string/number/null at root)
-    # --------------------------------------------------------
-    return pd.DataFrame([{"value": data}])
 
+def _pad_cells(values, lengths, targets):
+    """Pad lists (and wrap scalars as 1-element lists) to the target length."""
+    return [
+        x + [None] * (t - n) if n >= 0 else [x] + [None] * (t - 1)
+        for x, n, t in zip(values, lengths, targets)
+    ]
 
-# ============================================================
-# 🔥 3. Patch-2: Make list columns rectangular
-# ============================================================
-def normalize_list_columns(df):
+
+def explode_list_columns(df, list_columns=None):
+    """
+    Turn list cells into rows. Within a row, every list column is padded to
+    the longest list of that row so they explode side by side; scalar cells
+    count as 1-element lists and other columns are repeated.
+    """
+    list_columns = list_columns if list_columns is not None else _find_list_columns(df)
+    if not list_columns:
+        return df
+
+    # rows needed per source row (an empty list still keeps its row)
+    targets = np.maximum.reduce([np.maximum(lengths, 1) for lengths in list_columns.values()])
+
+    df = df.copy()
+    for pos, lengths in list_columns.items():
+        padded = _pad_cells(df.iloc[:, pos], lengths, targets)
+        df.isetitem(pos, pd.Series(padded, index=df.index, dtype=object))
+
+    names = [df.columns[pos] for pos in list_columns]
+    return df.explode(names, ignore_index=True).infer_objects()
+
+
+def normalize_list_columns(df, mode="pad"):
     """
     Ensures lists inside columns have equal length.
+
+    mode="pad"     -> pad every list to the longest list of its column (default)
+    mode="explode" -> explode list cells into rows (see explode_list_columns)
     """
-    for col in df.columns:
-        series = df[col]
+    if mode not in LIST_MODES:
+        raise ValueError(f"Unknown list mode '{mode}', expected one of {LIST_MODES}")
+
+    list_columns = _find_list_columns(df)
+    if not list_columns:
+        return df
 
-        if series.apply(lambda x: isinstance(x, list)).any():
-            max_len = series.apply(lambda x: len(x) if isinstance(x, list) else 1).max()
+    if mode == "explode":
+        return explode_list_columns(df, list_columns)
 
-            df[col] = series.apply(
-                lambda x:
-                    x + [None] * (max_len - len(x))
-                    if isinstance(x, list)
-                    else [x] + [None] * (max_len - 1)
-            )
+    for pos, lengths in list_columns.items():
+        # scalars are wrapped into 1-element lists
+        max_len = int(np.where(lengths < 0, 1, lengths).max())
+        targets = np.full(len(lengths), max_len)
+        padded = _pad_cells(df.iloc[:, pos], lengths, targets)
+        df.isetitem(pos, pd.Series(padded, index=df.index, dtype=object))
 
     return df
 
@@ -120,14 +179,142 @@ def normalize_list_columns(df):
 # ============================================================
 # 🔥 4. Main extract_data() – with smart JSON handling
 # ============================================================
-def detect_file_type(file_path):
-    return os.path.splitext(file_path)[1].lower().replace(".", "")
+# Bump whenever extraction output changes, so cached frames are invalidated.
+EXTRACTOR_VERSION = "3"
+
+JSON_TYPES = {"json"} | LINE_DELIMITED_TYPES
+
+
+DELIMITED_TYPES = {"csv", "tsv", "txt"}
+EXCEL_TYPES = {"xlsx", "xls"}
 
+# Already columnar and memory-mapped: hashing them for the cache key would
+# read every page, which costs more than the mapped read itself.
+UNCACHED_TYPES = {"parquet", "arrow", "feather", "ipc"}
 
-def extract_data(file_path):
+
+def detect_file_type(file_path, sniff=True):
+    """
+    File type used to pick a reader.
+
+    The extension is only a hint: when the file exists its first few KB are
+    sniffed (magic bytes, JSON vs NDJSON, XML/HTML markers), and the content
+    wins over a wrong extension. Delimited text keeps its extension so the
+    separator fallback (csv -> ",", tsv -> "\\t") still applies, and plain
+    text that is not recognised keeps a JSON extension.
+    """
+    ext = os.path.splitext(file_path)[1].lower().replace(".", "")
+    if not sniff or not os.path.isfile(file_path):
+        return ext
+
+    sniffed = sniff_file_type(file_path)
+    if sniffed is None:
+        return ext
+    if sniffed == "txt" and ext in DELIMITED_TYPES | JSON_TYPES:
+        return ext
+    if sniffed == "ndjson" and ext in LINE_DELIMITED_TYPES:
+        return ext
+    if sniffed in ("arrow", "ipc") and ext in UNCACHED_TYPES:
+        return ext
+    return sniffed
+
+
+def _iter_chunks(file_path, file_type, chunksize, list_mode="pad", reader_options=None, projection=None):
+    """
+    Generator behind extract_data(chunksize=...).
+    Errors raised mid-stream are reported and re-raised so callers
+    never mistake a truncated stream for a complete one.
+    """
+    start_time = time.time()
+    total = 0
+
+    try:
+        if file_type in JSON_TYPES:
+            chunks = extract_json_chunks(file_path, chunksize, keep=projection)
+        else:
+            reader = STREAM_READERS.get(file_type)
+            if not reader:
+                raise ValueError(f"Unsupported file type: {file_type}")
+            chunks = reader(file_path, chunksize, **(reader_options or {}))
+
+        for i, chunk in enumerate(chunks):
+            chunk = _apply_projection(chunk, projection)
+            chunk = normalize_list_columns(chunk, mode=list_mode)
+            total += len(chunk)
+            print(f"📦 Chunk {i + 1}: {len(chunk)} rows")
+            yield chunk
+
+    except Exception as e:
+        print(f"❌ Extraction error after {total} rows: {e}")
+        raise
+
+    duration = time.time() - start_time
+    print(f"✅ Extracted {total} rows from {file_path} in {duration:.2f}s (chunked)")
+
+
+def _reader_options(file_type, csv_engine, dtype_backend, projection, html_table, xml_record=None, sheets=None):
+    """Extra keyword arguments for the reader of this file type."""
+    if file_type in EXCEL_TYPES and sheets is not None:
+        return {"sheets": sheets}
+    if file_type == "html" and html_table is not None:
+        return {"match": html_table} if isinstance(html_table, str) else {"index": html_table}
+    if file_type == "xml" and xml_record is not None:
+        return {"record_path": xml_record}
+    if file_type in DELIMITED_TYPES:
+        return {"engine": csv_engine, "dtype_backend": dtype_backend, "columns": projection}
+    if file_type in UNCACHED_TYPES:
+        return {"columns": projection}
+    return {}
+
+
+def _apply_projection(df, projection):
+    """Drop unprojected columns for readers without pushdown (xlsx, xml, html)."""
+    if projection is None:
+        return df
+    keep = [pos for pos, col in enumerate(df.columns) if projection(col)]
+    return df if len(keep) == df.shape[1] else df.iloc[:, keep]
+
+
+def extract_data(file_path, chunksize=None, list_mode="pad", csv_engine="pandas", dtype_backend=None,
+                 use_cache=True, columns=None, html_table=None, xml_record=None, sheets=None,
+                 sheet_workers=None, raise_errors=False):
     """
     Universal extraction for CSV, JSON, Excel, HTML, XML, TSV, TXT...
     JSON uses smart recursive flattening.
+
+    With chunksize set, returns an iterator of DataFrames of at most
+    chunksize rows instead of a single DataFrame, so memory depends on
+    the chunk size rather than the file size.
+
+    list_mode controls columns holding lists: "pad" (equal-length lists)
+    or "explode" (one row per list element).
+
+    csv_engine ("pandas" | "pyarrow") and dtype_backend (None | "pyarrow")
+    select the parser for delimited files (csv/tsv/txt).
+
+    use_cache serves a previous extraction of the same file content from the
+    on-disk cache (see etl/extract/cache.py). Chunked mode is never cached.
+
+    columns projects the extraction onto the given names (matched after
+    standardization, e.g. "First Name" -> "first_name"); readers that
+    support it skip the other columns entirely.
+
+    html_table picks the HTML table to extract: an index (default 0) or a
+    regex the table text must match.
+
+    xml_record selects the XML record elements: a tag name ("item") or a
+    streamable XPath ("/feed/items/item", "//item"). Default: the root's
+    children, like pd.read_xml.
+
+    sheets selects Excel worksheets: None (first sheet), "all", or a list
+    of names/indices. Rows are then tagged with their sheet name (kept by
+    any columns projection), and in non-chunked mode sheets are read in up
+    to sheet_workers processes.
+
+    Errors (missing, unsupported or unreadable files) are printed and give
+    an empty result, or are raised with raise_errors=True so callers can
+    tell a broken file from an empty one. In chunked mode errors raised
+    while reading the chunks always propagate.
     """
     try:
         if not os.path.exists(file_path):
@@ -136,20 +323,56 @@ def extract_data(file_path):
         file_type = detect_file_type(file_path)
         print(f"\n📂 Detected file type: {file_type.upper()}")
 
+        projection = make_projection(columns)
+        if projection is not None and file_type in EXCEL_TYPES and sheets is not None:
+            # rows are tagged with their sheet name; the tag survives any projection
+            projection = make_projection([*projection.columns, SHEET_COLUMN])
+        reader_options = _reader_options(file_type, csv_engine, dtype_backend, projection, html_table, xml_record, sheets)
+
+        if chunksize:
+            return _iter_chunks(file_path, file_type, chunksize, list_mode, reader_options, projection)
+
+        if file_type in EXCEL_TYPES and sheet_workers:
+            reader_options["workers"] = sheet_workers
+
         start_time = time.time()
 
+        # ---- Cached extraction of the same content ----
+        cache = get_cache() if use_cache and file_type not in UNCACHED_TYPES else None
+        if cache:
+            options = {
+                "file_type": file_type,
+                "list_mode": list_mode,
+                "csv_engine": csv_engine,
+                "dtype_backend": dtype_backend,
+                "columns": sorted(projection.columns) if projection else None,
+                "html_table": html_table,
+                "xml_record": xml_record,
+                "sheets": sheets,
+            }
+            cache_key = cache.key(file_path, EXTRACTOR_VERSION, options)
+            df = cache.get(cache_key)
+            if df is not None:
+                duration = time.time() - start_time
+                print(f"⚡ Cache hit: {len(df)} rows from {file_path} in {duration:.2f}s")
+                return df
+
         # ---- JSON gets special handling ----
-        if file_type == "json":
-            df = extract_json_safely(file_path)
+        if file_type in JSON_TYPES:
+            df = extract_json_safely(file_path, keep=projection)
         else:
             reader = READERS.get(file_type)
             if not reader:
-                print(f"⚠️ Unsupported file type: {file_type}")
-                return pd.DataFrame()
-            df = reader(file_path)
+                raise ValueError(f"Unsupported file type: {file_type}")
+            df = reader(file_path, **reader_options)
+
+        df = _apply_projection(df, projection)
 
         # ---- Patch-2 for list columns ----
-        df = normalize_list_columns(df)
+        df = normalize_list_columns(df, mode=list_mode)
+
+        if cache:
+            cache.put(cache_key, df)
 
         duration = time.time() - start_time
         print(f"✅ Extracted {len(df)} rows from {file_path} in {duration:.2f}s")
@@ -158,4 +381,6 @@ def extract_data(file_path):
 
     except Exception as e:
         print(f"❌ Extraction error: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        if raise_errors:
+            raise
+        return iter(()) if chunksize else pd.DataFrame()
\ No newline at end of file
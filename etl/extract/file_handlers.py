@@ -1,60 +1,316 @@
 # etl/extract/file_handlers.py
-import json
+import csv
+import re
+import time
 import pandas as pd
 import logging
+from .sniffer import sniff_delimiter, default_delimiter
+from .xml_stream import read_xml_streaming, iter_xml_chunks
+from .excel_stream import read_xlsx, read_xls, iter_xlsx_chunks, iter_xls_chunks
 
 logger = logging.getLogger(__name__)
 
-def read_json(path):
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return pd.DataFrame(data)
+CSV_ENGINES = ("pandas", "pyarrow")
 
-def read_html_safely(path):
+
+def _arrow_strings(df):
     """
-    Try multiple engines/parsers for read_html and return the first table found.
+    dtype_backend="pyarrow": store text columns as string[pyarrow].
+    Numeric/temporal columns keep numpy dtypes so the transform layer
+    (fillna(""), to_numeric, ...) behaves exactly as before.
     """
-    try:
-        # preferred: use lxml parser (fast)
-        tables = pd.read_html(path, flavor="bs4", parser="lxml")
-        if tables:
-            return tables[0]
-    except Exception as e:
-        logger.debug(f"read_html with lxml failed: {e}")
+    for pos, dtype in enumerate(df.dtypes):
+        if dtype == object and pd.api.types.infer_dtype(df.iloc[:, pos], skipna=True) == "string":
+            df.isetitem(pos, df.iloc[:, pos].astype("string[pyarrow]"))
+    return df
+
+
+def _arrow_to_pandas(table, dtype_backend=None):
+    import pyarrow as pa
+
+    if dtype_backend != "pyarrow":
+        return table.to_pandas()
+
+    string_dtype = pd.StringDtype("pyarrow")
+    mapping = {pa.string(): string_dtype, pa.large_string(): string_dtype}
+    return table.to_pandas(types_mapper=mapping.get)
+
+
+def _csv_header(path, sep):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return next(csv.reader(f, delimiter=sep), [])
+
+
+def _arrow_csv_options(path, sep, columns=None):
+    import pyarrow.csv as pa_csv
+
+    options = {
+        "read_options": pa_csv.ReadOptions(use_threads=True),
+        "parse_options": pa_csv.ParseOptions(delimiter=sep),
+    }
+    if columns is not None:
+        include = columns.select(_csv_header(path, sep))
+        options["convert_options"] = pa_csv.ConvertOptions(include_columns=include)
+    return options
+
+
+def _check_engine(engine):
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unknown CSV engine '{engine}', expected one of {CSV_ENGINES}")
+
+
+def read_delimited(path, sep=None, engine="pandas", dtype_backend=None, columns=None, **kwargs):
+    """
+    CSV/TSV/TXT reader. The separator is sniffed from the content (the
+    extension only provides the fallback), so the fast C engine can be used
+    instead of the pure-Python one.
+
+    engine="pyarrow" parses with pyarrow's multithreaded CSV reader.
+    dtype_backend="pyarrow" keeps text columns Arrow-backed (string[pyarrow]).
+    columns (a projection.Projection) limits parsing to the matching columns.
+    """
+    _check_engine(engine)
+    if sep is None:
+        sep = sniff_delimiter(path, default=default_delimiter(path))
+    logger.debug(f"Reading delimited file {path} with sep={sep!r}, engine={engine}")
+
+    if engine == "pyarrow":
+        if kwargs:
+            raise ValueError(f"Options not supported by the pyarrow engine: {sorted(kwargs)}")
+        import pyarrow.csv as pa_csv
+
+        table = pa_csv.read_csv(path, **_arrow_csv_options(path, sep, columns))
+        return _arrow_to_pandas(table, dtype_backend)
+
+    df = pd.read_csv(path, sep=sep, engine="c", usecols=columns, **kwargs)
+    return _arrow_strings(df) if dtype_backend == "pyarrow" else df
+
+
+def iter_delimited_chunks(path, chunksize, engine="pandas", dtype_backend=None, columns=None):
+    """
+    Chunked counterpart of read_delimited(). The pyarrow engine streams
+    record batches and re-slices them into chunks of exactly chunksize rows.
+    Note: pyarrow infers column types from the first block only.
+    """
+    _check_engine(engine)
+    sep = sniff_delimiter(path, default=default_delimiter(path))
+
+    if engine == "pandas":
+        for chunk in pd.read_csv(path, sep=sep, engine="c", usecols=columns, chunksize=chunksize):
+            yield _arrow_strings(chunk) if dtype_backend == "pyarrow" else chunk
+        return
+
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    pending, pending_rows = [], 0
+    for batch in pa_csv.open_csv(path, **_arrow_csv_options(path, sep, columns)):
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        while pending_rows >= chunksize:
+            table = pa.Table.from_batches(pending)
+            yield _arrow_to_pandas(table.slice(0, chunksize), dtype_backend)
+            rest = table.slice(chunksize)
+            pending, pending_rows = rest.to_batches(), rest.num_rows
+
+    if pending_rows:
+        yield _arrow_to_pandas(pa.Table.from_batches(pending), dtype_backend)
+
+
+def _select_html_table(path, index=0, match=None):
+    """
+    Single streaming lxml pass that stops as soon as the wanted table is
+    complete: the index-th <table> in document order, or the first table
+    (in closing order) whose text matches the regex `match`. Tables that can no
+    longer be selected are cleared as the parse moves on.
+    Returns the <table> element, or None when no table qualifies.
+    """
+    from lxml import etree
+
+    started = 0         # <table> start tags seen, i.e. document-order index
+    open_tables = []    # stack of currently open tables
+    target = None
+
+    for event, elem in etree.iterparse(path, events=("start", "end"), tag="table", html=True):
+        if event == "start":
+            if match is None and started == index:
+                target = elem
+            started += 1
+            open_tables.append(elem)
+            continue
+
+        open_tables.pop()
+
+        if match is None:
+            if elem is target:
+                return elem
+            if target is None:
+                elem.clear()     # ended before the target even started
+        else:
+            if re.search(match, elem.xpath("string()")):
+                return elem
+            if not open_tables:
+                elem.clear()     # top-level table without a match
 
+    return None
+
+
+def read_html_safely(path, index=0, match=None):
+    """
+    Return one table from an HTML document (by index, or the first one
+    whose text matches the regex `match`, as in pd.read_html).
+
+    1. lxml: one streaming pass, stops after the selected table and hands
+       only that table to pandas.
+    2. html5lib (via bs4): only if lxml could not parse the document or
+       found no qualifying table (typically malformed markup).
+
+    Raises ValueError if neither finds the table.
+    """
+    from io import StringIO
+    from lxml import etree
+
+    start = time.perf_counter()
     try:
-        # fallback to html5lib if installed
-        tables = pd.read_html(path, flavor="bs4", parser="html5lib")
-        if tables:
-            return tables[0]
+        table = _select_html_table(path, index=index, match=match)
+        if table is not None:
+            html = etree.tostring(table, encoding="unicode", method="html")
+            df = pd.read_html(StringIO(html), flavor="lxml")[0]
+            logger.info(f"read_html strategy=lxml-stream took {(time.perf_counter() - start) * 1000:.1f} ms")
+            return df
+        logger.info(f"read_html strategy=lxml-stream found no table ({(time.perf_counter() - start) * 1000:.1f} ms)")
     except Exception as e:
-        logger.debug(f"read_html with html5lib failed: {e}")
+        logger.info(f"read_html strategy=lxml-stream failed after {(time.perf_counter() - start) * 1000:.1f} ms: {e}")
 
-    # last resort: try pandas default (may still raise)
+    start = time.perf_counter()
     try:
-        tables = pd.read_html(path)
-        if tables:
-            return tables[0]
+        tables = pd.read_html(path, flavor="bs4", match=match or ".+")
+        logger.info(f"read_html strategy=html5lib took {(time.perf_counter() - start) * 1000:.1f} ms")
     except Exception as e:
         logger.warning(f"All read_html attempts failed for {path}: {e}")
-        return pd.DataFrame()
+        raise
+    position = index if match is None else 0
+    if len(tables) <= position:
+        raise ValueError(f"{path} has {len(tables)} matching table(s), no table at index {position}")
+    return tables[position]
+
+def read_xml_safely(path, record_path=None):
+    """
+    Streaming XML reader (see xml_stream.py). record_path is a record tag
+    or a streamable XPath; defaults to the root's children like pd.read_xml.
+    Parse errors are raised instead of returning an empty frame.
+    """
+    return read_xml_streaming(path, record_path)
 
-def read_xml_safely(path):
+# ============================================================
+# Columnar inputs (memory-mapped)
+# ============================================================
+def _open_arrow_table(path):
+    """
+    Read an Arrow IPC file/stream or Feather file through a memory map.
+    Buffers point into the mapped file, so pages are only faulted in when
+    a column is actually touched.
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    source = pa.memory_map(path, "r")
     try:
-        df = pd.read_xml(path)
-        return df
-    except Exception as e:
-        logger.warning(f"pd.read_xml failed: {e}")
-        return pd.DataFrame()
+        return pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        pass
+
+    source.seek(0)
+    try:
+        return pa.ipc.open_stream(source).read_all()
+    except pa.ArrowInvalid:
+        # legacy Feather v1 is not an IPC container
+        return feather.read_table(path, memory_map=True)
+
+
+def _project_table(table, columns):
+    # unselected columns of a mapped table are never paged in
+    return table if columns is None else table.select(columns.select(table.column_names))
+
 
+def read_arrow_ipc(path, columns=None):
+    # split_blocks avoids consolidating columns into new 2D blocks,
+    # so null-free numeric columns stay zero-copy views of the map
+    return _project_table(_open_arrow_table(path), columns).to_pandas(split_blocks=True)
+
+
+def _parquet_columns(path, columns):
+    if columns is None:
+        return None
+    import pyarrow.parquet as pq
+
+    return columns.select(pq.read_schema(path, memory_map=True).names)
+
+
+def read_parquet_mapped(path, columns=None):
+    return pd.read_parquet(
+        path, engine="pyarrow", memory_map=True, columns=_parquet_columns(path, columns)
+    )
+
+
+# JSON / NDJSON are read by extractor.extract_json_safely (they need the flattener).
 READERS = {
-    "json": read_json,
-    "csv": pd.read_csv,
-    "txt": lambda path: pd.read_csv(path, sep=",", engine="python"),
+    "csv": read_delimited,
+    "txt": read_delimited,
     "html": read_html_safely,
-    "xlsx": lambda path: pd.read_excel(path, engine="openpyxl"),
-    "xls": lambda path: pd.read_excel(path, engine="xlrd", dtype=str),
-    "tsv": lambda path: pd.read_csv(path, sep="\t"),
+    "xlsx": read_xlsx,
+    "xls": read_xls,
+    "tsv": read_delimited,
     "xml": read_xml_safely,
-    "parquet": pd.read_parquet,
-}
\ No newline at end of file
+    "parquet": read_parquet_mapped,
+    "arrow": read_arrow_ipc,
+    "feather": read_arrow_ipc,
+    "ipc": read_arrow_ipc,
+}
+
+
+# ============================================================
+# Streaming readers (chunked mode)
+# ============================================================
+def _slice_frame(df, chunksize):
+    """Fallback for formats without incremental parsing."""
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize].reset_index(drop=True)
+
+
+def iter_parquet_chunks(path, chunksize, columns=None):
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path, memory_map=True)
+    selected = _parquet_columns(path, columns)
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=selected):
+        yield batch.to_pandas()
+
+
+def iter_arrow_chunks(path, chunksize, columns=None):
+    table = _project_table(_open_arrow_table(path), columns)
+    for start in range(0, table.num_rows, chunksize):
+        yield table.slice(start, chunksize).to_pandas(split_blocks=True)
+
+
+def iter_html_chunks(path, chunksize, index=0, match=None):
+    yield from _slice_frame(read_html_safely(path, index=index, match=match), chunksize)
+
+
+# Each entry takes (path, chunksize) and yields DataFrames of at most chunksize rows.
+# Delimited and columnar entries also accept columns= (a projection.Projection),
+# Excel entries accept sheets= (see excel_stream.py).
+# JSON / NDJSON are streamed by extractor.extract_json_chunks (they need the flattener).
+STREAM_READERS = {
+    "csv": iter_delimited_chunks,
+    "txt": iter_delimited_chunks,
+    "tsv": iter_delimited_chunks,
+    "html": iter_html_chunks,
+    "xlsx": iter_xlsx_chunks,
+    "xls": iter_xls_chunks,
+    "xml": iter_xml_chunks,
+    "parquet": iter_parquet_chunks,
+    "arrow": iter_arrow_chunks,
+    "feather": iter_arrow_chunks,
+    "ipc": iter_arrow_chunks,
+}
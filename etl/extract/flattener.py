@@ -0,0 +1,191 @@
+# etl/extract/flattener.py
+"""
+Columnar JSON flattener.
+
+Produces the same columns as extractor.flatten_json(), but:
+- walks each record with an explicit stack (no recursion)
+- interns key paths, so "a_b_0_c" is built once per distinct path, not per leaf
+- appends leaf values straight into per-column buffers, so no per-record
+  dict is created and pandas does not have to pivot rows into columns
+
+Usage:
+    flattener = ColumnarFlattener()
+    for record in records:
+        flattener.append(record)
+    df = flattener.to_frame()        # or flattener.to_arrow()
+"""
+
+import numpy as np
+import pandas as pd
+
+# Filler for keys a record does not have. pandas uses NaN for missing keys
+# when building from a list of dicts, while explicit JSON nulls stay None.
+_MISSING = np.nan
+
+# Buffer marker for columns dropped by the projection
+_DROPPED = ()
+
+
+class _PathNode:
+    """One interned key path: child nodes by key, output name and column buffer."""
+
+    __slots__ = ("children", "name", "buf")
+
+    def __init__(self, name):
+        self.children = {}
+        self.name = name
+        self.buf = None
+
+
+class ColumnarFlattener:
+    """
+    keep: optional predicate on the flattened column name; leaves whose
+    column is not kept are walked but never stored.
+    """
+
+    def __init__(self, keep=None):
+        self.columns = {}
+        self.n_rows = 0
+        self.keep = keep
+        self._root = _PathNode("")
+
+    # ---------------------------------------------------------
+    # Key path interning
+    # ---------------------------------------------------------
+    def _child(self, node, key):
+        # same naming rule as flatten_json: "<prefix>_<key>"
+        name = f"{node.name}_{key}" if node is not self._root else f"{key}"
+        child = node.children[key] = _PathNode(name)
+        return child
+
+    def _buffer(self, node):
+        node.buf = self._column(node.name)
+        return node.buf
+
+    def _column(self, name):
+        # distinct paths may flatten to the same name ("a_b" vs a -> b)
+        buf = self.columns.get(name)
+        if buf is None:
+            if self.keep is not None and not self.keep(name):
+                return _DROPPED
+            buf = self.columns[name] = [_MISSING] * self.n_rows
+        return buf
+
+    # ---------------------------------------------------------
+    # Buffers
+    # ---------------------------------------------------------
+    def _put(self, buf, value, row):
+        n = len(buf)
+        if n == row:
+            buf.append(value)
+        elif n < row:
+            buf.extend([_MISSING] * (row - n))
+            buf.append(value)
+        else:
+            # same flattened key twice in one record: last value wins
+            buf[row] = value
+
+    def append(self, record, context=None):
+        """
+        Flatten one record into the column buffers.
+        context (root-level fields) is attached as-is, overriding record keys.
+        """
+        row = self.n_rows
+        root = self._root
+
+        if isinstance(record, dict):
+            stack = [(iter(record.items()), root)]
+        elif isinstance(record, list):
+            stack = [(enumerate(record), root)]
+        else:
+            stack = []
+            buf = root.buf if root.buf is not None else self._buffer(root)
+            if buf is not _DROPPED:
+                self._put(buf, record, row)
+
+        # Depth-first walk with one iterator per open container, so keys
+        # come out in document order without recursion.
+        while stack:
+            items, node = stack[-1]
+            children = node.children
+
+            for key, value in items:
+                child = children.get(key) or self._child(node, key)
+
+                if isinstance(value, dict):
+                    stack.append((iter(value.items()), child))
+                    break
+                if isinstance(value, list):
+                    stack.append((enumerate(value), child))
+                    break
+
+                buf = child.buf
+                if buf is None:
+                    buf = self._buffer(child)
+                if buf is _DROPPED:
+                    continue
+
+                n = len(buf)
+                if n == row:
+                    buf.append(value)
+                else:
+                    self._put(buf, value, row)
+            else:
+                stack.pop()
+
+        if context:
+            for k, v in context.items():
+                buf = self._column(k)
+                if buf is not _DROPPED:
+                    self._put(buf, v, row)
+
+        self.n_rows += 1
+
+    def _padded(self):
+        for buf in self.columns.values():
+            if len(buf) < self.n_rows:
+                buf.extend([_MISSING] * (self.n_rows - len(buf)))
+        return self.columns
+
+    # ---------------------------------------------------------
+    # Output
+    # ---------------------------------------------------------
+    def to_frame(self) -> pd.DataFrame:
+        # Hand pandas ready-made object arrays and infer dtypes once per
+        # column; cheaper than letting the constructor sanitize each list.
+        arrays = {}
+        for name, buf in self._padded().items():
+            arr = np.empty(self.n_rows, dtype=object)
+            arr[:] = buf
+            arrays[name] = arr
+        df = pd.DataFrame(arrays, index=pd.RangeIndex(self.n_rows), copy=False)
+        return df.infer_objects()
+
+    def to_arrow(self):
+        """
+        Build a pyarrow.Table. Columns Arrow cannot type (mixed scalars,
+        nested context values) are stored as strings.
+        """
+        import pyarrow as pa
+
+        arrays = {}
+        for name, buf in self._padded().items():
+            try:
+                arrays[name] = pa.array(buf, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arrays[name] = pa.array(
+                    [None if v is None or v is _MISSING else str(v) for v in buf],
+                    type=pa.string(),
+                )
+        return pa.table(arrays)
+
+
+def flatten_records(records, context=None, output="pandas", keep=None):
+    """
+    Flatten an iterable of JSON records into a DataFrame
+    (output="pandas") or a pyarrow.Table (output="arrow").
+    """
+    flattener = ColumnarFlattener(keep=keep)
+    for record in records:
+        flattener.append(record, context)
+    return flattener.to_arrow() if output == "arrow" else flattener.to_frame()
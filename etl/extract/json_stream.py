@@ -0,0 +1,236 @@
+# etl/extract/json_stream.py
+"""
+Incremental JSON readers for the extract layer.
+
+The whole document is never held in memory: values are decoded one at a
+time from a growing text buffer, so only the current record (plus the
+root-level context fields) is alive at once.
+
+Supported layouts (same rules as extractor.extract_json_safely):
+- top-level LIST      -> one row per item
+- top-level DICT      -> one row per item of its largest list,
+                         non-list root fields attached as context
+- DICT without lists  -> the whole dict as ONE row
+- primitive root      -> {"value": ...}
+- NDJSON / JSON Lines -> one row per line
+"""
+
+import json
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+LINE_DELIMITED_TYPES = {"jsonl", "ndjson"}
+
+
+class JsonStream:
+    """
+    Minimal pull parser on top of json.JSONDecoder.raw_decode().
+    Containers we want to walk (root object / arrays) are tokenized by hand,
+    everything else is decoded as a complete value.
+    """
+
+    def __init__(self, f, block_size=1 << 16):
+        self.f = f
+        self.block_size = block_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        """Append more text to the buffer. Returns False at end of file."""
+        if self.eof:
+            return False
+        # grow geometrically so a huge single value is not re-decoded per block
+        more = self.f.read(max(self.block_size, len(self.buf) - self.pos))
+        if not more:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + more
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character (not consumed), or None at EOF."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return None
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON: expected '{char}', found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode one complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                val, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+
+            # a number at the very end of the buffer may be cut in half
+            if end == len(self.buf) and self._fill():
+                continue
+
+            self.pos = end
+            return val
+
+    def iter_array(self):
+        """Yield the items of the array starting at the current position."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+
+        while True:
+            yield self.value()
+            sep = self.peek()
+            self.pos += 1
+            if sep == "]":
+                return
+            if sep != ",":
+                raise ValueError(f"Malformed JSON array: unexpected {sep!r}")
+
+    def iter_object(self):
+        """
+        Yield the keys of the object starting at the current position.
+        The caller must consume each member's value before resuming.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            sep = self.peek()
+            self.pos += 1
+            if sep == "}":
+                return
+            if sep != ",":
+                raise ValueError(f"Malformed JSON object: unexpected {sep!r}")
+
+    def expect_end(self):
+        """Only whitespace may follow the root value."""
+        found = self.peek()
+        if found is not None:
+            raise ValueError(f"Malformed JSON: extra data after the root value, found {found!r}")
+
+    def skip_array(self):
+        """Walk an array without keeping its items. Returns the item count."""
+        count = 0
+        for _ in self.iter_array():
+            count += 1
+        return count
+
+
+# ============================================================
+# Layout detection
+# ============================================================
+def _scan_root(path):
+    """
+    First pass over the document.
+
+    Returns (kind, payload, context):
+    - ("list", None, {})
+    - ("dict", key_of_largest_list, non_list_root_fields)
+    - ("dict", None, whole_root_dict)   when the root has no lists
+    - ("scalar", value, {})
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        stream = JsonStream(f)
+        head = stream.peek()
+
+        if head == "[":
+            return "list", None, {}
+
+        if head != "{":
+            value = stream.value()
+            stream.expect_end()
+            return "scalar", value, {}
+
+        context = {}
+        list_sizes = {}
+        for key in stream.iter_object():
+            if stream.peek() == "[":
+                list_sizes[key] = stream.skip_array()
+            else:
+                context[key] = stream.value()
+        stream.expect_end()
+
+    if not list_sizes:
+        return "dict", None, context
+
+    # Choose the largest list as the "rows" (first one wins on ties)
+    root_key = max(list_sizes, key=list_sizes.get)
+    return "dict", root_key, context
+
+
+def _iter_root_list(path, root_key=None):
+    """Second pass: stream the items of the root list (or root[root_key])."""
+    with open(path, "r", encoding="utf-8") as f:
+        stream = JsonStream(f)
+
+        if root_key is None:
+            yield from stream.iter_array()
+            stream.expect_end()
+            return
+
+        for key in stream.iter_object():
+            is_list = stream.peek() == "["
+            if key == root_key and is_list:
+                yield from stream.iter_array()
+                return
+            if is_list:
+                stream.skip_array()
+            else:
+                stream.value()
+
+
+def iter_ndjson(path):
+    """Yield one decoded value per non-blank line."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_no}: {e}") from e
+
+
+def iter_json_items(path, lines=False):
+    """
+    Returns (items, context).
+
+    items   -> iterator over the raw values that become rows
+    context -> root-level non-list fields to attach to every row
+    """
+    if lines:
+        return iter_ndjson(path), {}
+
+    kind, payload, context = _scan_root(path)
+
+    if kind == "list":
+        return _iter_root_list(path), {}
+
+    if kind == "scalar":
+        return iter([{"value": payload}]), {}
+
+    if payload is None:
+        # no lists found: the entire dictionary is ONE row
+        return iter([context]), {}
+
+    return _iter_root_list(path, payload), context
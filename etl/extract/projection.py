@@ -0,0 +1,55 @@
+# etl/extract/projection.py
+"""
+Column projection for the extract layer.
+
+A projection is a set of column names the pipeline actually needs. Readers
+use it to skip everything else (usecols for csv/tsv, columns for
+parquet/feather, selective capture in the JSON flattener).
+
+Raw files carry raw headers ("First Name"), while the transform layer works
+on standardized ones ("first_name"), so matching is done on the
+standardized form of each raw name.
+"""
+
+import re
+
+_WHITESPACE = re.compile(r"\s+")
+_INVALID = re.compile(r"[^a-z0-9_]")
+_UNDERSCORES = re.compile(r"_+")
+
+
+def standardize_name(name):
+    """
+    The column-name rule (lowercase snake_case), shared by the cleaning
+    step, projections and upsert key lookup.
+    """
+    name = str(name).strip().lower()
+    name = _WHITESPACE.sub("_", name)
+    name = _INVALID.sub("_", name)
+    name = _UNDERSCORES.sub("_", name)
+    return name.strip("_")
+
+
+class Projection:
+    """Callable filter: Projection(columns)(raw_name) -> keep?"""
+
+    def __init__(self, columns):
+        self.columns = frozenset(standardize_name(c) for c in columns)
+        self._seen = {}
+
+    def __call__(self, name):
+        keep = self._seen.get(name)
+        if keep is None:
+            keep = self._seen[name] = standardize_name(name) in self.columns
+        return keep
+
+    def select(self, names):
+        """Names (in their original order) that survive the projection."""
+        return [name for name in names if self(name)]
+
+
+def make_projection(columns):
+    """None -> no projection; otherwise a Projection over the given names."""
+    if columns is None or isinstance(columns, Projection):
+        return columns
+    return Projection(columns)
@@ -0,0 +1,164 @@
+# etl/extract/sniffer.py
+"""
+Content sniffing for the extract layer.
+
+Looks at the first few KB of a file to decide what it really is, so a
+mislabelled export (.txt that is JSON, .csv that is tab-separated, .xls
+that is HTML, ...) still reaches the right — and fastest — reader.
+
+Main public functions:
+    sniff_file_type(path) -> str | None
+    sniff_delimiter(path, default=",") -> str
+"""
+
+import csv
+import io
+import json
+import os
+import zipfile
+
+SNIFF_BYTES = 64 * 1024
+DELIMITER_CANDIDATES = [",", "\t", ";", "|"]
+DEFAULT_DELIMITERS = {"csv": ",", "tsv": "\t", "txt": ","}
+
+_MAGIC = [
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "xls"),  # OLE2 (legacy Excel)
+    (b"PAR1", "parquet"),
+    (b"ARROW1", "arrow"),                          # Arrow IPC file / Feather v2
+    (b"FEA1", "feather"),                          # Feather v1
+    (b"\xff\xff\xff\xff", "ipc"),                  # Arrow IPC stream
+]
+_BOMS = [b"\xef\xbb\xbf"]
+
+
+def read_head(path, size=SNIFF_BYTES):
+    with open(path, "rb") as f:
+        return f.read(size)
+
+
+def _decode(head):
+    for bom in _BOMS:
+        if head.startswith(bom):
+            head = head[len(bom):]
+    return head.decode("utf-8", errors="replace")
+
+
+def _complete_lines(text, truncated):
+    """Split into lines, dropping the last one if the sample cut it off."""
+    lines = text.splitlines()
+    if truncated and lines and not text.endswith(("\n", "\r")):
+        lines = lines[:-1]
+    return lines
+
+
+def _is_ndjson(lines):
+    """At least two non-blank lines, each a complete JSON object/array."""
+    records = [line.strip() for line in lines if line.strip()]
+    if len(records) < 2:
+        return False
+    for line in records[:20]:
+        if line[0] not in "{[":
+            return False
+        try:
+            json.loads(line)
+        except ValueError:
+            return False
+    return True
+
+
+def _is_json(text):
+    try:
+        json.loads(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _sniff_zip(path):
+    try:
+        with zipfile.ZipFile(path) as zf:
+            names = zf.namelist()
+    except zipfile.BadZipFile:
+        return None
+    if any(name.startswith("xl/") for name in names):
+        return "xlsx"
+    return None
+
+
+def sniff_file_type(path):
+    """
+    Guess the file type from its content.
+    Returns a READERS key, "json" / "ndjson", or None when the content is not recognised.
+    """
+    head = read_head(path)
+    if not head:
+        return None
+
+    if head.startswith(b"PK\x03\x04"):
+        return _sniff_zip(path)
+    for magic, file_type in _MAGIC:
+        if head.startswith(magic):
+            return file_type
+
+    if b"\x00" in head[:1024]:
+        # unknown binary format: trust the extension
+        return None
+
+    text = _decode(head).lstrip()
+    if not text:
+        return None
+    truncated = len(head) == SNIFF_BYTES
+
+    if text[0] in "{[":
+        return "ndjson" if _is_ndjson(_complete_lines(text, truncated)) else "json"
+
+    if text[0] == "<":
+        lowered = text[:4096].lower()
+        if "<html" in lowered or "<!doctype html" in lowered:
+            return "html"
+        # a bare <table> fragment is HTML, but an XML feed may have <table> elements too
+        if "<table" in lowered and not lowered.startswith("<?xml"):
+            return "html"
+        return "xml"
+
+    if not truncated and _is_json(text):
+        # scalar root (42, "hello", true): JSON, not a one-cell CSV
+        return "json"
+
+    # plain text: treat as delimited (the reader sniffs the separator)
+    return "txt"
+
+
+def sniff_delimiter(path, default=","):
+    """
+    Pick the separator that splits the sample into a consistent number
+    (> 1) of fields per line. Quotes are honoured via the csv module.
+    Falls back to `default` when nothing is clearly better.
+    """
+    head = read_head(path)
+    text = _decode(head)
+    lines = [line for line in _complete_lines(text, len(head) == SNIFF_BYTES) if line.strip()][:50]
+    if not lines:
+        return default
+
+    best, best_width = default, 0
+    candidates = [default] + [d for d in DELIMITER_CANDIDATES if d != default]
+    for delimiter in candidates:
+        try:
+            widths = {len(row) for row in csv.reader(io.StringIO("\n".join(lines)), delimiter=delimiter)}
+        except csv.Error:
+            continue
+        # consistent and actually splitting; first candidate (the default) wins ties
+        if len(widths) == 1:
+            width = widths.pop()
+            if width > best_width and width > 1:
+                best, best_width = delimiter, width
+                if delimiter == default:
+                    break
+
+    return best
+
+
+def default_delimiter(path):
+    ext = os.path.splitext(path)[1].lower().replace(".", "")
+    return DEFAULT_DELIMITERS.get(ext, ",")
@@ -0,0 +1,166 @@
+# etl/extract/xml_stream.py
+"""
+Streaming XML reader for the extract layer (lxml.etree.iterparse).
+
+Rows are emitted as record elements complete, and every finished record
+(plus the siblings before it) is cleared, so memory stays flat no matter
+how large the document is.
+
+Records are selected by a tag name or a streamable XPath subset:
+    "./*"          children of the root (pd.read_xml's default)
+    "/feed/items/item"
+    "//item", "item", "//items/item"
+    "*" wildcards per step, namespace prefixes are ignored
+Predicates, axes and functions cannot be evaluated while streaming and
+raise ValueError.
+
+Each record is flattened like pd.read_xml does: attributes, the element's
+own text, then the text of its direct children.
+"""
+
+import logging
+
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECORD_PATH = "./*"
+_UNSUPPORTED = ("[", "(", "@", "::", "|")
+
+
+def _local(tag):
+    # "{namespace}name" -> "name"
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else None
+
+
+class RecordPath:
+    """Compiled record path, matched against the stack of open element names."""
+
+    def __init__(self, path=None):
+        path = (path or DEFAULT_RECORD_PATH).strip()
+        if any(token in path for token in _UNSUPPORTED):
+            raise ValueError(f"XPath '{path}' is not streamable (no predicates, axes or functions)")
+
+        if path.startswith("//"):
+            self.mode, rest = "descendant", path[2:]
+        elif path.startswith("./"):
+            self.mode, rest = "relative", path[2:]
+        elif path.startswith("/"):
+            self.mode, rest = "absolute", path[1:]
+        else:
+            self.mode, rest = "descendant", path
+
+        self.steps = [step.split(":")[-1] for step in rest.split("/")]
+        if not rest or "" in self.steps:
+            raise ValueError(f"Unsupported record path '{path}'")
+        self.path = path
+
+    @property
+    def single_tag(self):
+        """Tag name when the path is just "name" / "//name" (tag-filtered fast path)."""
+        if self.mode == "descendant" and len(self.steps) == 1 and self.steps[0] != "*":
+            return self.steps[0]
+        return None
+
+    def matches(self, stack):
+        steps = self.steps
+        if self.mode == "absolute":
+            names = stack
+            if len(names) != len(steps):
+                return False
+        elif self.mode == "relative":
+            names = stack[1:]
+            if len(names) != len(steps):
+                return False
+        else:
+            if len(stack) < len(steps):
+                return False
+            names = stack[len(stack) - len(steps):]
+
+        return all(step == "*" or step == name for step, name in zip(steps, names))
+
+
+def xml_record(elem):
+    """Flatten one record element the way pd.read_xml does."""
+    record = dict(elem.attrib)
+    if elem.text and not elem.text.isspace():
+        record[_local(elem.tag)] = elem.text
+    for child in elem:
+        name = _local(child.tag)
+        if name is None:  # comments / processing instructions
+            continue
+        record[name] = child.text or None
+    return record
+
+
+def _release(elem):
+    """Free a finished record and everything parsed before it."""
+    elem.clear()
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def iter_xml_records(path, record_path=None):
+    """Yield one flattened dict per record element, in document order."""
+    from lxml import etree
+
+    matcher = RecordPath(record_path)
+    tag = matcher.single_tag
+
+    if tag is not None:
+        for _, elem in etree.iterparse(path, events=("end",), tag=("{*}" + tag, tag)):
+            yield xml_record(elem)
+            _release(elem)
+        return
+
+    stack = []
+    for event, elem in etree.iterparse(path, events=("start", "end")):
+        if event == "start":
+            stack.append(_local(elem.tag))
+            continue
+
+        if matcher.matches(stack):
+            yield xml_record(elem)
+            _release(elem)
+        stack.pop()
+
+
+def records_to_frame(rows):
+    """
+    Build a DataFrame from record dicts, inferring dtypes the same way
+    pandas' text readers (and pd.read_xml) do.
+    """
+    columns = {}
+    for row in rows:
+        for key in row:
+            columns.setdefault(key, None)
+    names = list(columns)
+    if not rows:
+        return pd.DataFrame(columns=names)
+    return TextParser([[row.get(c) for c in names] for row in rows], names=names).read()
+
+
+def iter_xml_chunks(path, chunksize, record_path=None):
+    rows = []
+    for row in iter_xml_records(path, record_path):
+        rows.append(row)
+        if len(rows) >= chunksize:
+            yield records_to_frame(rows)
+            rows = []
+    if rows:
+        yield records_to_frame(rows)
+
+
+def read_xml_streaming(path, record_path=None):
+    """
+    Whole-file read through the streaming parser. Parse errors propagate
+    (with the record path in the message) instead of yielding an empty frame.
+    """
+    try:
+        return records_to_frame(list(iter_xml_records(path, record_path)))
+    except Exception as e:
+        logger.error(f"XML extraction failed for {path} (record path {record_path or DEFAULT_RECORD_PATH!r}): {e}")
+        raise
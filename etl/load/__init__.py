@@ -1,11 +1,17 @@
-from .loader import load_data
+from .loader import load_data, OverlappedLoad, IncompleteLoadError
 from . import writer_processed
 from . import writer_raw
 from . import schema_tracker
+from . import bulk
+from . import encoder
 
 __all__ = [
     "load_data",
+    "OverlappedLoad",
+    "IncompleteLoadError",
     "writer_processed",
     "writer_raw",
     "schema_tracker",
+    "bulk",
+    "encoder",
 ]
@@ -0,0 +1,254 @@
+"""
+Batched bulk inserts shared by the raw and processed writers.
+
+Documents are built from the frame one batch at a time, so only
+batch_size dicts are alive at once instead of a copy of the whole frame.
+Each batch is an unordered insert_many: a bad document (e.g. a duplicate
+key) does not stop the rest of the batch, and earlier batches stay
+written if a later one fails. Rejected documents are counted; once every
+batch has been written, RejectedDocumentsError reports them together with
+the number of documents that did make it.
+
+Upsert mode (bulk_upsert) makes loads idempotent. Each row is keyed by a
+natural key (e.g. "id") or, without one, by a deterministic hash of the
+row stored in ROW_HASH_FIELD. A unique index is created on the key once
+per process; it is partial (documents lacking the key are not indexed),
+so insert-mode and upsert-mode runs can share a collection. An older
+index on the same key with other options is only rebuilt on request
+(rebuild_index=True); otherwise the conflict is raised. Natural keys
+replace the stored document, so values can change. Rows without a value
+for the natural key cannot be matched and are rejected. Row hashes only
+insert unseen rows ($setOnInsert). Replaying a file therefore leaves the
+collection size unchanged.
+
+Configuration (environment):
+    ETL_WRITE_BATCH_SIZE  documents per insert_many / bulk_write (default: 10000)
+"""
+
+import logging
+import os
+import time
+
+import pandas as pd
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from etl.extract.projection import standardize_name
+from etl.transform_layer.utils import hashable
+from .encoder import to_documents
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 10_000
+LOAD_MODES = ("insert", "upsert")
+ROW_HASH_FIELD = "_row_hash"
+INDEX_CONFLICT_CODES = (85, 86)  # IndexOptionsConflict, IndexKeySpecsConflict
+
+_indexed = set()  # (database, collection, key) with an ensured unique index
+
+
+class RejectedDocumentsError(Exception):
+    """Some documents of a write were rejected by the server (the rest were written)."""
+
+    def __init__(self, collection, written, rejected, first_error=None):
+        self.collection = collection
+        self.written = written
+        self.rejected = rejected
+        self.first_error = first_error
+        super().__init__(f"{rejected} documents rejected by '{collection}', {written} written ({first_error})")
+
+
+def batch_size_from_env():
+    return int(os.getenv("ETL_WRITE_BATCH_SIZE", DEFAULT_BATCH_SIZE))
+
+
+def iter_record_batches(df, batch_size):
+    """Lists of BSON-ready record dicts (see encoder.py), batch_size rows at a time."""
+    for start in range(0, len(df), batch_size):
+        yield to_documents(df.iloc[start:start + batch_size])
+
+
+def bulk_insert(df, collection, batch_size=None, label="records"):
+    """
+    Insert the frame into collection in unordered batches.
+    Returns the number of documents inserted. Rejected documents do not
+    stop the load; they are raised as RejectedDocumentsError at the end.
+    """
+    batch_size = batch_size or batch_size_from_env()
+    start = time.perf_counter()
+    inserted = failed = 0
+    first_error = None
+
+    for batch_no, docs in enumerate(iter_record_batches(df, batch_size), start=1):
+        batch_start = time.perf_counter()
+        try:
+            count = len(collection.insert_many(docs, ordered=False).inserted_ids)
+        except BulkWriteError as e:
+            count = e.details.get("nInserted", 0)
+            errors = e.details.get("writeErrors", [])
+            rejected = len(docs) - count
+            failed += rejected
+            first = errors[0].get("errmsg") if errors else e
+            first_error = first_error or first
+            logger.warning(f"Batch {batch_no}: {rejected} {label} rejected by '{collection.name}' ({first})")
+        except Exception:
+            logger.error(f"Batch {batch_no} failed after {inserted} {label} were inserted into '{collection.name}'")
+            raise
+
+        inserted += count
+        elapsed = time.perf_counter() - batch_start
+        logger.info(
+            f"Batch {batch_no}: {count}/{len(docs)} {label} into '{collection.name}' "
+            f"({count / elapsed if elapsed else 0:,.0f} docs/s)"
+        )
+
+    elapsed = time.perf_counter() - start
+    logger.debug(f"bulk_insert: {inserted} {label} in {elapsed:.2f}s")
+    if failed:
+        logger.error(f"{failed} {label} could not be inserted into '{collection.name}'")
+        raise RejectedDocumentsError(collection.name, inserted, failed, first_error)
+    return inserted
+
+
+# ============================================================
+# Upserts
+# ============================================================
+def resolve_key(df, key):
+    """
+    Map natural-key names onto the frame's columns. Exact names win, then
+    standardized ones, so key "id" also finds the raw column "Id".
+    """
+    if isinstance(key, str):
+        key = [key]
+    by_standard = {standardize_name(col): col for col in df.columns}
+    resolved = []
+    for name in key:
+        if name in df.columns:
+            resolved.append(name)
+        elif standardize_name(name) in by_standard:
+            resolved.append(by_standard[standardize_name(name)])
+        else:
+            raise ValueError(f"Upsert key column '{name}' not found in {list(df.columns)}")
+    return resolved
+
+
+def row_hashes(df):
+    """Deterministic per-row content hash (hex), independent of the index."""
+    try:
+        hashed = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        safe = df.copy(deep=False)
+        for pos, dtype in enumerate(df.dtypes):
+            if dtype == object:
+                safe.isetitem(pos, df.iloc[:, pos].map(hashable))
+        hashed = pd.util.hash_pandas_object(safe, index=False)
+    return [f"{h:016x}" for h in hashed.to_numpy()]
+
+
+def ensure_unique_index(collection, key, rebuild=False):
+    """
+    Unique index on the upsert key, covering only documents that have it.
+    Documents written in insert mode carry no key (or no _row_hash) and
+    must not count as duplicate nulls, before or after the index exists.
+    An existing index on the key with other options is dropped and
+    recreated only when rebuild is True.
+    """
+    marker = (collection.database.name, collection.name, tuple(key))
+    if marker in _indexed:
+        return
+    fields = [str(name) for name in key]
+    spec = [(name, 1) for name in fields]
+    options = {"unique": True, "partialFilterExpression": {name: {"$exists": True} for name in fields}}
+    try:
+        collection.create_index(spec, **options)
+    except OperationFailure as e:
+        if e.code not in INDEX_CONFLICT_CODES:
+            raise
+        # same key indexed with other options (e.g. an earlier non-partial index)
+        name = "_".join(f"{field}_1" for field in fields)
+        if not rebuild:
+            logger.error(
+                f"Index '{name}' on '{collection.name}' exists with other options; "
+                f"drop it or pass rebuild_index=True to recreate it as a partial unique index"
+            )
+            raise
+        logger.warning(f"Recreating index '{name}' on '{collection.name}' as a partial unique index")
+        collection.drop_index(name)
+        collection.create_index(spec, **options)
+    _indexed.add(marker)
+
+
+def bulk_upsert(df, collection, key=None, batch_size=None, label="records", rebuild_index=False):
+    """
+    Idempotent load: upsert the frame keyed by key (column names) or, when
+    key is None, by a row hash. Returns the number of rows applied
+    (inserted + already present); rejected rows, including rows with a
+    null natural key, raise RejectedDocumentsError after the last batch.
+    """
+    batch_size = batch_size or batch_size_from_env()
+    failed = 0
+    first_error = None
+    if key:
+        key = resolve_key(df, key)
+        # a null key would filter on {"id": None}, which also matches documents lacking it
+        null_key = df[key].isna().any(axis=1).to_numpy()
+        if null_key.any():
+            failed = int(null_key.sum())
+            first_error = f"null upsert key {key}"
+            logger.warning(f"{failed} {label} have no value for upsert key {key} and are skipped")
+            df = df[~null_key]
+    else:
+        df = df.assign(**{ROW_HASH_FIELD: row_hashes(df)})
+        key = [ROW_HASH_FIELD]
+    ensure_unique_index(collection, key, rebuild=rebuild_index)
+    fields = [str(name) for name in key]  # document keys are strings
+
+    start = time.perf_counter()
+    upserted = matched = modified = 0
+    for batch_no, docs in enumerate(iter_record_batches(df, batch_size), start=1):
+        if key == [ROW_HASH_FIELD]:
+            ops = [UpdateOne({ROW_HASH_FIELD: doc[ROW_HASH_FIELD]}, {"$setOnInsert": doc}, upsert=True)
+                   for doc in docs]
+        else:
+            ops = [ReplaceOne({name: doc[name] for name in fields}, doc, upsert=True) for doc in docs]
+
+        batch_start = time.perf_counter()
+        try:
+            result = collection.bulk_write(ops, ordered=False).bulk_api_result
+        except BulkWriteError as e:
+            result = e.details
+            errors = result.get("writeErrors", [])
+            failed += len(errors)
+            first = errors[0].get("errmsg") if errors else e
+            first_error = first_error or first
+            logger.warning(f"Batch {batch_no}: {len(errors)} {label} rejected by '{collection.name}' ({first})")
+        except Exception:
+            logger.error(f"Batch {batch_no} failed after {upserted + matched} {label} were applied to '{collection.name}'")
+            raise
+
+        upserted += result.get("nUpserted", 0)
+        matched += result.get("nMatched", 0)
+        modified += result.get("nModified", 0)
+        elapsed = time.perf_counter() - batch_start
+        logger.info(
+            f"Batch {batch_no}: {len(ops)} {label} upserted into '{collection.name}' "
+            f"({len(ops) / elapsed if elapsed else 0:,.0f} docs/s)"
+        )
+
+    logger.info(
+        f"Upsert into '{collection.name}' on {key}: {upserted} new, {modified} updated, "
+        f"{matched - modified} unchanged in {time.perf_counter() - start:.2f}s"
+    )
+    if failed:
+        logger.error(f"{failed} {label} could not be upserted into '{collection.name}'")
+        raise RejectedDocumentsError(collection.name, upserted + matched, failed, first_error)
+    return upserted + matched
+
+
+def write_frame(df, collection, mode="insert", key=None, batch_size=None, label="records", rebuild_index=False):
+    """Dispatch to bulk_insert / bulk_upsert by load mode."""
+    if mode == "insert":
+        return bulk_insert(df, collection, batch_size, label)
+    if mode == "upsert":
+        return bulk_upsert(df, collection, key, batch_size, label, rebuild_index)
+    raise ValueError(f"Unknown load mode '{mode}' (expected one of {LOAD_MODES})")
@@ -1,17 +1,120 @@
+"""
+MongoDB connection for the load layer.
+
+One MongoClient per process, created on first use and shared by every
+writer and the schema tracker (MongoClient is thread-safe and pools its
+connections). It is closed at interpreter exit. A forked child, e.g. a
+batch worker, never reuses its parent's client: it builds its own on
+first use.
+
+Configuration (environment / .env, read on first use):
+    MONGO_URI                          connection string (required)
+    MONGO_DB                           database name (required)
+    MONGO_MAX_POOL_SIZE                max connections per server (default: 50)
+    MONGO_MIN_POOL_SIZE                connections kept open (default: 0)
+    MONGO_CONNECT_TIMEOUT_MS           default: 10000
+    MONGO_SERVER_SELECTION_TIMEOUT_MS  default: 10000
+    MONGO_SOCKET_TIMEOUT_MS            default: none
+    MONGO_WRITE_CONCERN                w: a number or "majority" (default: server default)
+    MONGO_JOURNAL                      "true" to wait for the journal (j=True)
+"""
+
+import atexit
+import logging
 import os
+import threading
+
 from dotenv import load_dotenv
 from pymongo import MongoClient
 
-load_dotenv()  # Load environment variables from .env
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_pid = None
+_lock = threading.Lock()
+_env_loaded = False
+
+
+def _load_env():
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()  # Load environment variables from .env
+        _env_loaded = True
+
+
+def _int_env(name, default=None):
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def client_options():
+    """MongoClient keyword arguments built from the environment."""
+    _load_env()
+    options = {
+        "maxPoolSize": _int_env("MONGO_MAX_POOL_SIZE", 50),
+        "minPoolSize": _int_env("MONGO_MIN_POOL_SIZE", 0),
+        "connectTimeoutMS": _int_env("MONGO_CONNECT_TIMEOUT_MS", 10000),
+        "serverSelectionTimeoutMS": _int_env("MONGO_SERVER_SELECTION_TIMEOUT_MS", 10000),
+        "socketTimeoutMS": _int_env("MONGO_SOCKET_TIMEOUT_MS"),
+    }
+
+    w = os.getenv("MONGO_WRITE_CONCERN")
+    if w:
+        options["w"] = int(w) if w.isdigit() else w
+    if os.getenv("MONGO_JOURNAL", "").lower() in ("1", "true", "yes"):
+        options["journal"] = True
+    return options
+
+
+def get_client():
+    """The process-wide MongoClient (created lazily, rebuilt after fork)."""
+    global _client, _client_pid
+    pid = os.getpid()
+    if _client is not None and _client_pid == pid:
+        return _client
+
+    with _lock:
+        if _client is None or _client_pid != pid:
+            _load_env()
+            uri = os.getenv("MONGO_URI")
+            if not uri:
+                raise ValueError("MONGO_URI not set in environment")
+            # a client inherited through fork is unusable here; just drop it
+            _client = MongoClient(uri, **client_options())
+            _client_pid = pid
+            logger.info(f"MongoDB client created (pid {pid})")
+    return _client
 
-MONGO_URI = os.getenv("MONGO_URI")
-DATABASE_NAME = os.getenv("MONGO_DB")
 
 def get_db_client():
     """
-    Returns a connected MongoClient instance.
+    Returns the database handle on the shared client.
     """
-    if not MONGO_URI:
-        raise ValueError("MONGO_URI not set in environment")
-    client = MongoClient(MONGO_URI)
-    return client[DATABASE_NAME]
+    client = get_client()
+    database = os.getenv("MONGO_DB")
+    if not database:
+        raise ValueError("MONGO_DB not set in environment")
+    return client[database]
+
+
+def close_client():
+    """Close this process' client (registered with atexit)."""
+    global _client, _client_pid
+    with _lock:
+        if _client is not None and _client_pid == os.getpid():
+            _client.close()
+        _client = None
+        _client_pid = None
+
+
+def _forget_after_fork():
+    # the child must not touch the parent's sockets, not even to close them
+    global _client, _client_pid, _lock
+    _client = None
+    _client_pid = None
+    _lock = threading.Lock()
+
+
+atexit.register(close_client)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_after_fork)
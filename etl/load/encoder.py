@@ -0,0 +1,123 @@
+"""
+Column-wise DataFrame -> BSON-ready document encoder for the writers.
+
+to_dict(orient="records") hands pandas/numpy scalars to pymongo value by
+value: numpy ints and floats, Timestamps, NaT, pd.NA (Int64 / boolean),
+categoricals. Some of these cannot be encoded at all (pd.NA, NaT); the
+rest go through slow per-value paths.
+
+Here every column is converted once to plain Python values:
+    bool / int / float     -> bool / int / float (NaN -> None)
+    Int64 / boolean / ...  -> int / bool, NA -> None
+    datetime64 (tz or not) -> datetime.datetime, NaT -> None
+    timedelta64            -> seconds (float), NaT -> None
+    category               -> encoded categories taken by code, NA -> None
+    string                 -> str, NA -> None
+    object                 -> NA -> None, numpy scalars / Timestamps unwrapped
+Documents are then assembled row-wise with zip. Column names become
+strings, because BSON keys must be strings.
+
+Main public functions:
+    encode_column(series) -> list
+    to_documents(df) -> list[dict]
+    to_raw_bson(df) -> list[RawBSONDocument]
+"""
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_extension_array_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_string_dtype,
+    is_timedelta64_dtype,
+)
+
+# object columns of these inferred kinds hold plain Python values already
+_PLAIN_KINDS = {"string", "bytes", "boolean", "empty"}
+
+
+def _with_nulls(values, mask):
+    """values as a list with the masked positions set to None."""
+    values = np.asarray(values, dtype=object)
+    if mask.any():
+        values[mask] = None
+    return values.tolist()
+
+
+def _scalar(value):
+    """One object-column value -> BSON-friendly Python value."""
+    if value is None or value is pd.NA or value is pd.NaT:
+        return None
+    kind = type(value)
+    if kind is str or kind is bool or kind is int or kind is dt.datetime:
+        return value
+    if kind is float:
+        return None if value != value else value
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, np.datetime64):
+        return None if np.isnat(value) else pd.Timestamp(value).to_pydatetime()
+    if isinstance(value, np.generic):
+        value = value.item()
+        return None if isinstance(value, float) and value != value else value
+    if isinstance(value, dict):
+        return {str(k): _scalar(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_scalar(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return [_scalar(v) for v in value.tolist()]
+    if isinstance(value, (pd.Timedelta, dt.timedelta)):
+        return value.total_seconds()
+    return value
+
+
+def encode_column(series):
+    """Convert one column to a list of BSON-friendly Python values."""
+    dtype = series.dtype
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = np.asarray(encode_column(pd.Series(series.cat.categories)) + [None], dtype=object)
+        codes = series.cat.codes.to_numpy()  # -1 (missing) picks the trailing None
+        return categories[codes].tolist()
+
+    if is_datetime64_any_dtype(dtype):
+        return _with_nulls(series.array.to_pydatetime(), series.isna().to_numpy())
+
+    if is_timedelta64_dtype(dtype):
+        return _with_nulls(series.dt.total_seconds().to_numpy(), series.isna().to_numpy())
+
+    if is_extension_array_dtype(dtype):
+        # Int64 / Float64 / boolean / string[python|pyarrow] / arrow-backed
+        return series.to_numpy(dtype=object, na_value=None).tolist()
+
+    if is_bool_dtype(dtype) or is_integer_dtype(dtype):
+        return series.to_numpy().tolist()
+
+    if is_float_dtype(dtype):
+        values = series.to_numpy()
+        return _with_nulls(values.tolist(), np.isnan(values))
+
+    values = series.to_numpy(dtype=object)
+    if is_string_dtype(dtype) and pd.api.types.infer_dtype(values, skipna=True) in _PLAIN_KINDS:
+        return _with_nulls(values, pd.isna(values))
+    return [_scalar(v) for v in values]
+
+
+def to_documents(df):
+    """Records of the frame as plain dicts (one column conversion per column)."""
+    names = [str(col) for col in df.columns]
+    columns = [encode_column(df.iloc[:, pos]) for pos in range(df.shape[1])]
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def to_raw_bson(df):
+    """Records pre-encoded as RawBSONDocument (e.g. to encode off the writer thread)."""
+    import bson
+    from bson.raw_bson import RawBSONDocument
+
+    return [RawBSONDocument(bson.encode(doc)) for doc in to_documents(df)]
@@ -1,38 +1,143 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from .db_config import get_db_client
 from .writer_raw import write_raw
 from .writer_processed import write_processed
 from .schema_tracker import save_schema
+from .bulk import RejectedDocumentsError
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-def load_data(raw_df, processed_df, raw_collection="raw_data", processed_collection="processed_data"):
+
+class IncompleteLoadError(Exception):
+    """
+    The load finished but some documents were rejected. raw_count and
+    processed_count are the documents that were written.
+    """
+
+    def __init__(self, raw_count, processed_count, errors):
+        self.raw_count = raw_count
+        self.processed_count = processed_count
+        self.errors = errors
+        self.rejected = sum(e.rejected for e in errors)
+        super().__init__("; ".join(str(e) for e in errors))
+
+
+def _written(write, *args, errors, **kwargs):
+    """Run a writer; rejected documents are collected into errors instead of raised."""
+    try:
+        return write(*args, **kwargs)
+    except RejectedDocumentsError as e:
+        errors.append(e)
+        return e.written
+
+
+def load_data(raw_df, processed_df, raw_collection="raw_data", processed_collection="processed_data", db=None,
+              mode="insert", key=None):
     """
     Load data into database:
     1. Save raw data
     2. Save processed data
     3. Track schema versions
+
+    Pass db to reuse an open database handle instead of connecting.
+    mode="upsert" makes reruns idempotent: rows are keyed on key (natural
+    key columns, e.g. ["id"]) or on a row hash when key is None.
+    Raises IncompleteLoadError (with the written counts) after both writes
+    and the schemas if any documents were rejected.
     """
-    db = get_db_client()
+    if db is None:
+        db = get_db_client()
+    errors = []
 
     # Save raw data
     logger.info("Loading raw data...")
-    raw_count = write_raw(raw_df, db, raw_collection)
+    raw_count = _written(write_raw, raw_df, db, raw_collection, mode=mode, key=key, errors=errors)
 
     # Save processed data
     logger.info("Loading processed data...")
-    processed_count = write_processed(processed_df, db, processed_collection)
+    processed_count = _written(write_processed, processed_df, db, processed_collection, mode=mode, key=key,
+                               errors=errors)
 
     # Save schemas
     logger.info("Saving schema for raw and processed data...")
     save_schema(db, raw_collection, raw_df)
     save_schema(db, processed_collection, processed_df)
 
+    if errors:
+        raise IncompleteLoadError(raw_count, processed_count, errors)
     logger.info(f"Load complete: {raw_count} raw rows, {processed_count} processed rows")
     return raw_count, processed_count
 
 
+class OverlappedLoad:
+    """
+    Concurrent load stage that overlaps with the transform:
+
+        with OverlappedLoad() as load:
+            load.start_raw(df_raw)                  # raw write + raw schema start now
+            df = run_transform_pipeline(df_raw)     # ... while this runs
+            raw_count, processed_count = load.finish(df)
+
+    finish() runs the processed write and schema logging on the same thread
+    pool and waits for everything. Per-task durations end up in .timings.
+    Rejected documents raise IncompleteLoadError from finish(), as in load_data.
+    """
+
+    def __init__(self, raw_collection="raw_data", processed_collection="processed_data", db=None,
+                 mode="insert", key=None):
+        self.db = db if db is not None else get_db_client()
+        self.mode = mode
+        self.key = key
+        self.raw_collection = raw_collection
+        self.processed_collection = processed_collection
+        self.timings = {}
+        self._futures = {}
+        self._errors = []
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="etl-load")
+
+    def _submit(self, name, fn, *args, **kwargs):
+        def timed():
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.timings[name] = time.perf_counter() - start
+
+        self._futures[name] = self._pool.submit(timed)
+
+    def start_raw(self, raw_df):
+        logger.info("Loading raw data (overlapped with transform)...")
+        self._submit("raw_write", _written, write_raw, raw_df, self.db, self.raw_collection,
+                     mode=self.mode, key=self.key, errors=self._errors)
+        self._submit("raw_schema", save_schema, self.db, self.raw_collection, raw_df)
+
+    def finish(self, processed_df):
+        logger.info("Loading processed data...")
+        self._submit("processed_write", _written, write_processed, processed_df, self.db,
+                     self.processed_collection, mode=self.mode, key=self.key, errors=self._errors)
+        self._submit("processed_schema", save_schema, self.db, self.processed_collection, processed_df)
+
+        results = {name: future.result() for name, future in self._futures.items()}
+        raw_count, processed_count = results["raw_write"], results["processed_write"]
+        if self._errors:
+            raise IncompleteLoadError(raw_count, processed_count, self._errors)
+        logger.info(f"Load complete: {raw_count} raw rows, {processed_count} processed rows")
+        return raw_count, processed_count
+
+    def close(self):
+        """Wait for any write still running (e.g. the raw write after a failed transform)."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 # Optional CLI test
 if __name__ == "__main__":
     import pandas as pd
@@ -3,25 +3,71 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_indexed = set()
+
+
+def ensure_schema_index(db):
+    """Index for the "latest schema of a collection" lookup (created once per process)."""
+    if db.name in _indexed:
+        return
+    db.schema_logs.create_index([("collection_name", 1), ("timestamp", -1)])
+    _indexed.add(db.name)
+
+
 def get_previous_schema(db, collection_name):
     """
     Get the most recent schema saved for a collection/file.
     """
+    ensure_schema_index(db)
     return db.schema_logs.find_one(
         {"collection_name": collection_name},
         sort=[("timestamp", -1)]
     )
 
+
+def diff_schemas(old, new):
+    """Columns added, removed and retyped between two {column: dtype} schemas."""
+    old = old or {}
+    return {
+        "added": {col: dtype for col, dtype in new.items() if col not in old},
+        "removed": {col: dtype for col, dtype in old.items() if col not in new},
+        "retyped": {col: [old[col], dtype] for col, dtype in new.items() if col in old and old[col] != dtype},
+    }
+
+
 def save_schema(db, collection_name, df):
     """
-    Save the current schema of a DataFrame to schema_logs.
+    Save the schema of a DataFrame to schema_logs, but only when it differs
+    from the last saved one. The record carries the full schema plus a diff
+    against the previous version. Returns the record, or None if unchanged.
+
+    The previous schema is always read from schema_logs (one indexed
+    lookup), never from a per-process cache, so batch workers running in
+    separate processes see each other's changes.
     """
-    schema = {col: str(dtype) for col, dtype in df.dtypes.items()}
+    schema = {str(col): str(dtype) for col, dtype in df.dtypes.items()}
+
+    record = get_previous_schema(db, collection_name)
+    previous = record["schema"] if record else None
+    if previous == schema:
+        logger.info(f"Schema unchanged for '{collection_name}', nothing saved.")
+        return None
+
     record = {
         "collection_name": collection_name,
         "schema": schema,
+        "diff": diff_schemas(previous, schema) if previous is not None else None,
         "row_count": len(df),
         "timestamp": datetime.utcnow()
     }
     db.schema_logs.insert_one(record)
-    logger.info(f"Schema saved for '{collection_name}' with {len(df)} rows.")
+
+    if record["diff"]:
+        diff = record["diff"]
+        logger.info(
+            f"Schema changed for '{collection_name}': +{len(diff['added'])} "
+            f"-{len(diff['removed'])} ~{len(diff['retyped'])} columns."
+        )
+    else:
+        logger.info(f"Schema saved for '{collection_name}' with {len(df)} rows.")
+    return record
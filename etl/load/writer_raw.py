@@ -1,16 +1,25 @@
 import logging
+import time
+
+from .bulk import write_frame
 
 logger = logging.getLogger(__name__)
 
-def write_raw(df, db, collection_name):
+def write_raw(df, db, collection_name, batch_size=None, mode="insert", key=None):
     """
     Save raw extracted DataFrame to MongoDB collection.
+    Documents are built and inserted in unordered batches (see bulk.py).
+    mode="upsert" makes the write idempotent on key (or a row hash).
     """
     if df.empty:
         logger.warning("Empty DataFrame received, skipping raw write.")
         return 0
 
-    records = df.to_dict(orient="records")
-    result = db[collection_name].insert_many(records)
-    logger.info(f"Inserted {len(result.inserted_ids)} raw records into '{collection_name}'")
-    return len(result.inserted_ids)
+    start = time.perf_counter()
+    inserted = write_frame(df, db[collection_name], mode, key, batch_size, label="raw records")
+    duration = time.perf_counter() - start
+    logger.info(
+        f"Wrote {inserted} raw records into '{collection_name}' "
+        f"in {duration:.2f}s ({inserted / duration if duration else 0:,.0f} docs/s)"
+    )
+    return inserted
@@ -5,11 +5,18 @@ Run the full ETL pipeline:
 3. Load raw and processed data into the database
 """
 
+import glob
 import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import pandas as pd
 from etl.extract import extract_data, detect_file_type
-from etl.transform_layer import run_transform_pipeline
-from etl.load import load_data
+from etl.extract.cache import get_cache
+from etl.transform_layer import run_transform_pipeline, projection_columns
+from etl.load import load_data, OverlappedLoad, IncompleteLoadError
+from etl.load.db_config import get_db_client
 
 # ---------------------------------------------------------
 # Logging configuration
@@ -24,11 +31,200 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------
 # ETL Runner
 # ---------------------------------------------------------
-def run_etl(file_path: str):
+def _new_result(file_path):
+    """Per-file outcome returned by run_etl (used for the batch summary)."""
+    return {
+        "file": file_path,
+        "status": "failed",
+        "stage": None,
+        "raw_rows": 0,
+        "processed_rows": 0,
+        "rejected_rows": 0,
+        "duration": 0.0,
+        "stage_times": {},
+        "error": None,
+    }
+
+
+def _finish(result, started, status, stage=None, error=None):
+    result.update(status=status, stage=stage, duration=time.perf_counter() - started)
+    if error is not None:
+        result["error"] = f"{type(error).__name__}: {error}"
+    return result
+
+
+def _finish_incomplete_load(result, started, error):
+    """Rows were rejected on load: keep the written counts, report the file as failed."""
+    result.update(raw_rows=error.raw_count, processed_rows=error.processed_count, rejected_rows=error.rejected)
+    logger.error(f"Load incomplete, {error.rejected} rows rejected: {error}")
+    return _finish(result, started, "failed", "Load", error)
+
+
+def run_etl_chunked(file_path: str, chunksize: int, db=None, load_options=None, transform_options=None,
+                    **extract_options):
+    """
+    Streaming ETL: every extracted chunk goes through transform and load
+    before the next one is read, so peak memory follows the chunk size.
+
+    Note: duplicate removal in the cleaning step only sees one chunk at a time.
+    Chunks with rejected rows do not stop the run; the file is reported as
+    failed (stage Load) once every chunk has been loaded.
+    """
+    logger.info(f"Starting chunked ETL for file: {file_path} (chunksize={chunksize})")
+    started = time.perf_counter()
+    result = _new_result(file_path)
+
+    raw_total = processed_total = extracted = 0
+    chunk_no = 0
+    stage = "Extraction"
+    rejected = []
+
+    try:
+        for df_raw in extract_data(file_path, chunksize=chunksize, raise_errors=True, **extract_options):
+            chunk_no += 1
+            if df_raw.empty:
+                continue
+            extracted += len(df_raw)
+
+            stage = "Transformation"
+            df_transformed = run_transform_pipeline(df_raw, **(transform_options or {}))
+
+            stage = "Load"
+            try:
+                raw_count, processed_count = load_data(
+                    raw_df=df_raw,
+                    processed_df=df_transformed,
+                    raw_collection="raw_data",
+                    processed_collection="processed_data",
+                    db=db,
+                    **(load_options or {}),
+                )
+            except IncompleteLoadError as e:
+                logger.error(f"Chunk {chunk_no}: {e.rejected} rows rejected on load")
+                raw_count, processed_count = e.raw_count, e.processed_count
+                rejected.extend(e.errors)
+            raw_total += raw_count
+            processed_total += processed_count
+            result.update(raw_rows=raw_total, processed_rows=processed_total)
+            logger.info(f"Chunk {chunk_no} loaded: {raw_count} raw rows, {processed_count} processed rows")
+
+            stage = "Extraction"
+    except Exception as e:
+        logger.exception(f"{stage} failed on chunk {chunk_no}: {e}")
+        return _finish(result, started, "failed", stage, e)
+
+    if extracted == 0:
+        logger.warning("No data extracted. ETL aborted.")
+        return _finish(result, started, "empty", "Extraction")
+    if rejected:
+        return _finish_incomplete_load(result, started, IncompleteLoadError(raw_total, processed_total, rejected))
+
+    logger.info(f"Load complete: {raw_total} raw rows, {processed_total} processed rows in {chunk_no} chunks")
+    logger.info("ETL pipeline finished successfully!")
+    return _finish(result, started, "ok")
+
+
+def _log_timings(result):
+    """Wall time next to the summed stage times (the difference is the overlap win)."""
+    stage_times = result["stage_times"]
+    summed = sum(stage_times.values())
+    details = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in stage_times.items())
+    logger.info(f"Wall time {result['duration']:.2f}s vs {summed:.2f}s summed stage time ({details})")
+
+
+def _transform_and_load_overlapped(df_raw, result, started, db=None, load_options=None, transform_options=None):
+    """
+    Concurrent load: the raw write starts right after extraction and runs
+    next to the transform; the processed write and both schema logs then
+    run together on the load thread pool.
+    """
+    stage_times = result["stage_times"]
+    try:
+        load = OverlappedLoad("raw_data", "processed_data", db=db, **(load_options or {}))
+    except Exception as e:
+        logger.exception(f"Load failed: {e}")
+        return _finish(result, started, "failed", "Load", e)
+
+    with load:
+        load.start_raw(df_raw)
+
+        # ----------------------
+        # 2. TRANSFORM (raw write in flight)
+        # ----------------------
+        stage_start = time.perf_counter()
+        try:
+            df_transformed = run_transform_pipeline(df_raw, **(transform_options or {}))
+            logger.info(f"Transformation complete. {len(df_transformed)} rows after transform")
+        except Exception as e:
+            logger.exception(f"Transformation failed: {e}")
+            return _finish(result, started, "failed", "Transformation", e)
+        finally:
+            stage_times["transform"] = time.perf_counter() - stage_start
+
+        # ----------------------
+        # 3. LOAD (processed write + schemas)
+        # ----------------------
+        try:
+            raw_count, processed_count = load.finish(df_transformed)
+            result.update(raw_rows=raw_count, processed_rows=processed_count)
+        except IncompleteLoadError as e:
+            return _finish_incomplete_load(result, started, e)
+        except Exception as e:
+            logger.exception(f"Load failed: {e}")
+            return _finish(result, started, "failed", "Load", e)
+        finally:
+            stage_times.update(load.timings)
+
+    logger.info("ETL pipeline finished successfully!")
+    _finish(result, started, "ok")
+    _log_timings(result)
+    return result
+
+
+def run_etl(file_path: str, chunksize: int = None, db=None, concurrent_load: bool = False,
+            load_options=None, transform_options=None, project: bool = False, keep_columns=None,
+            **extract_options):
     """
     Executes full ETL for a single input file.
+    Pass chunksize to stream the file through the pipeline in chunks.
+    db reuses an open database handle instead of connecting per load.
+    concurrent_load overlaps the raw write with the transform and runs the
+    remaining load tasks in parallel (whole-file runs only); note that the
+    raw data is then written even if the transform fails.
+    load_options are forwarded to load_data (mode="upsert", key=[...]),
+    transform_options to run_transform_pipeline (copy_free=True, schema=..., dedupe_on=[...]);
+    the file name stem is passed as the source, which picks a per-source
+    schema (e.g. schemas/day5.toml) when one exists.
+    project extracts only the columns that schema types and enrichment reads,
+    plus keep_columns; the column set is computed per file, from its schema.
+    extract_options are forwarded to extract_data (list_mode, csv_engine, ...);
+    unreadable files fail at stage Extraction instead of being reported as empty.
+
+    Returns a result dict: status ("ok" | "empty" | "failed"), the failing
+    stage, raw/processed row counts, duration, per-stage times and error.
+    Rows rejected by the database (e.g. duplicate keys) fail the file at
+    stage Load; the counts are the rows written and rejected_rows the rest.
     """
+    transform_options = {"source": os.path.splitext(os.path.basename(file_path))[0], **(transform_options or {})}
+    if project:
+        try:
+            extract_options["columns"] = projection_columns(
+                keep_columns, schema=transform_options.get("schema"), source=transform_options["source"]
+            )
+        except Exception as e:
+            logger.exception(f"Extraction failed: {e}")
+            return _finish(_new_result(file_path), time.perf_counter(), "failed", "Extraction", e)
+
+    if chunksize:
+        if concurrent_load:
+            logger.warning("concurrent_load is ignored in chunked mode")
+        return run_etl_chunked(file_path, chunksize, db=db, load_options=load_options,
+                               transform_options=transform_options, **extract_options)
+
     logger.info(f"Starting ETL for file: {file_path}")
+    started = time.perf_counter()
+    result = _new_result(file_path)
+    stage_times = result["stage_times"]
 
     # ----------------------
     # 1. EXTRACT
@@ -36,28 +232,36 @@ def run_etl(file_path: str):
     try:
         file_type = detect_file_type(file_path)
         logger.info(f"Detected file type: {file_type}")
-        df_raw = extract_data(file_path)
+        df_raw = extract_data(file_path, raise_errors=True, **extract_options)
+        stage_times["extract"] = time.perf_counter() - started
         if df_raw.empty:
             logger.warning("No data extracted. ETL aborted.")
-            return
+            return _finish(result, started, "empty", "Extraction")
         logger.info(f"Extracted {len(df_raw)} rows")
     except Exception as e:
         logger.exception(f"Extraction failed: {e}")
-        return
+        return _finish(result, started, "failed", "Extraction", e)
+
+    if concurrent_load:
+        return _transform_and_load_overlapped(df_raw, result, started, db=db, load_options=load_options,
+                                              transform_options=transform_options)
 
     # ----------------------
     # 2. TRANSFORM
     # ----------------------
+    stage_start = time.perf_counter()
     try:
-        df_transformed = run_transform_pipeline(df_raw)
+        df_transformed = run_transform_pipeline(df_raw, **(transform_options or {}))
         logger.info(f"Transformation complete. {len(df_transformed)} rows after transform")
     except Exception as e:
         logger.exception(f"Transformation failed: {e}")
-        return
+        return _finish(result, started, "failed", "Transformation", e)
+    stage_times["transform"] = time.perf_counter() - stage_start
 
     # ----------------------
     # 3. LOAD
     # ----------------------
+    stage_start = time.perf_counter()
     try:
         raw_collection = "raw_data"
         processed_collection = "processed_data"
@@ -65,14 +269,100 @@ def run_etl(file_path: str):
             raw_df=df_raw,
             processed_df=df_transformed,
             raw_collection=raw_collection,
-            processed_collection=processed_collection
+            processed_collection=processed_collection,
+            db=db,
+            **(load_options or {}),
         )
+        result.update(raw_rows=raw_count, processed_rows=processed_count)
         logger.info(f"Load complete: {raw_count} raw rows, {processed_count} processed rows")
+    except IncompleteLoadError as e:
+        return _finish_incomplete_load(result, started, e)
     except Exception as e:
         logger.exception(f"Load failed: {e}")
-        return
+        return _finish(result, started, "failed", "Load", e)
+    stage_times["load"] = time.perf_counter() - stage_start
 
     logger.info("ETL pipeline finished successfully!")
+    _finish(result, started, "ok")
+    _log_timings(result)
+    return result
+
+
+# ---------------------------------------------------------
+# Batch Runner
+# ---------------------------------------------------------
+def _run_batch_file(job):
+    file_path, chunksize, extract_options = job
+    try:
+        # process-wide pooled client: one per worker, rebuilt after fork
+        db = get_db_client()
+    except Exception as e:
+        logger.error(f"Database connection failed: {e}")
+        return _finish(_new_result(file_path), time.perf_counter(), "failed", "Connect", e)
+    return run_etl(file_path, chunksize=chunksize, db=db, **extract_options)
+
+
+def discover_files(directory: str, pattern: str = "*"):
+    """Files in directory matching the glob pattern, sorted by name."""
+    paths = glob.glob(os.path.join(directory, pattern), recursive=True)
+    return sorted(path for path in paths if os.path.isfile(path))
+
+
+def run_batch(files, workers: int = None, chunksize: int = None, **extract_options):
+    """
+    Run the ETL over many files in a process pool.
+    Each worker reuses its process-wide database client for all its files.
+    Returns the per-file results in input order.
+    """
+    files = list(files)
+    if not files:
+        return []
+
+    workers = max(1, min(len(files), workers or os.cpu_count() or 1))
+    jobs = [(path, chunksize, extract_options) for path in files]
+    logger.info(f"Starting batch ETL: {len(files)} files, {workers} worker(s)")
+    started = time.perf_counter()
+
+    if workers == 1:
+        results = [_run_batch_file(job) for job in jobs]
+    else:
+        results = [None] * len(jobs)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_batch_file, job): pos for pos, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                pos = futures[future]
+                try:
+                    results[pos] = future.result()
+                except Exception as e:  # worker crashed / result not picklable
+                    logger.error(f"Worker failed on {files[pos]}: {e}")
+                    results[pos] = _finish(_new_result(files[pos]), started, "failed", "Worker", e)
+
+    print_batch_summary(results, time.perf_counter() - started, workers)
+    return results
+
+
+def print_batch_summary(results, wall_time: float, workers: int = 1):
+    width = max([len("FILE")] + [len(os.path.basename(r["file"])) for r in results])
+    print(f"\n📊 Batch summary: {len(results)} files, {workers} worker(s), {wall_time:.2f}s wall time")
+    print(f"{'FILE':<{width}}  {'STATUS':<7}  {'STAGE':<14}  {'RAW':>8}  {'PROCESSED':>9}  {'TIME':>7}")
+    for r in results:
+        print(
+            f"{os.path.basename(r['file']):<{width}}  {r['status']:<7}  {r['stage'] or '-':<14}  "
+            f"{r['raw_rows']:>8}  {r['processed_rows']:>9}  {r['duration']:>6.2f}s"
+        )
+        if r["error"]:
+            print(f"{'':<{width}}  ↳ {r['error']}")
+
+    failed = sum(r["status"] == "failed" for r in results)
+    total = sum(r["duration"] for r in results)
+    print(f"✅ {len(results) - failed} ok/empty, ❌ {failed} failed ({total:.2f}s summed per-file time)")
+
+
+def parse_sheets(value):
+    """--sheets: None, "all", or comma-separated sheet names / indices."""
+    if not value or value.lower() in ("all", "*"):
+        return value or None
+    return [int(s) if s.strip().lstrip("-").isdigit() else s.strip() for s in value.split(",") if s.strip()]
 
 
 # ---------------------------------------------------------
@@ -81,8 +371,109 @@ def run_etl(file_path: str):
 if __name__ == "__main__":
     import argparse
 
-    parser = argparse.ArgumentParser(description="Run ETL pipeline on a single file")
-    parser.add_argument("file_path", type=str, help="Path to the input file (json, csv, txt, etc.)")
+    parser = argparse.ArgumentParser(description="Run ETL pipeline on a file or a directory of files")
+    parser.add_argument("file_path", type=str, nargs="?",
+                        help="Path to the input file (json, csv, txt, etc.)")
+    parser.add_argument("--dir", type=str, default=None,
+                        help="Process every file in this directory (batch mode)")
+    parser.add_argument("--glob", type=str, default="*",
+                        help="File pattern inside --dir, e.g. '*.csv' or '**/*.json'")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes in batch mode (default: CPU count)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and ingest new or changed files in --dir")
+    parser.add_argument("--manifest", type=str, default=None,
+                        help="Processed-file manifest for --watch (default: $ETL_MANIFEST or .etl_manifest.json)")
+    parser.add_argument("--debounce", type=float, default=2.0,
+                        help="Seconds a file must stay unchanged before --watch picks it up")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="Stream the file in chunks of this many rows")
+    parser.add_argument("--list-mode", choices=["pad", "explode"], default="pad",
+                        help="Pad list-valued cells to equal length or explode them into rows")
+    parser.add_argument("--csv-engine", choices=["pandas", "pyarrow"], default="pandas",
+                        help="Parser for csv/tsv/txt files")
+    parser.add_argument("--dtype-backend", choices=["pyarrow"], default=None,
+                        help="Keep text columns Arrow-backed (string[pyarrow])")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the extraction cache")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Empty the extraction cache before running")
+    parser.add_argument("--project", action="store_true",
+                        help="Only extract the columns the transform layer uses")
+    parser.add_argument("--keep-columns", type=str, default="",
+                        help="Comma-separated passthrough columns to keep with --project")
+    parser.add_argument("--xml-record", type=str, default=None,
+                        help="XML record tag or streamable XPath (e.g. //item)")
+    parser.add_argument("--sheets", type=str, default=None,
+                        help="Excel sheets to extract: 'all' or comma-separated names/indices")
+    parser.add_argument("--sheet-workers", type=int, default=None,
+                        help="Worker processes for multi-sheet Excel extraction")
+    parser.add_argument("--concurrent-load", action="store_true",
+                        help="Write raw data while transforming and run load tasks in parallel")
+    parser.add_argument("--upsert", action="store_true",
+                        help="Idempotent load: upsert on --upsert-key, or on a row hash")
+    parser.add_argument("--upsert-key", type=str, default="",
+                        help="Comma-separated natural key columns for --upsert (e.g. id)")
+    parser.add_argument("--copy-free", action="store_true",
+                        help="Run the transform under pandas Copy-on-Write (fewer copies, same output)")
+    parser.add_argument("--dedupe-on", type=str, default="",
+                        help="Comma-separated key columns for duplicate removal (default: whole row)")
+    parser.add_argument("--schema", type=str, default=None,
+                        help="Column type schema name or path (default: per-source schema or schemas/default.toml)")
     args = parser.parse_args()
 
-    run_etl(args.file_path)
+    if args.clear_cache:
+        get_cache().clear()
+    if args.file_path and args.dir:
+        parser.error("pass either file_path or --dir, not both")
+    if not args.file_path and not args.dir:
+        if not args.clear_cache:
+            parser.error("file_path or --dir is required")
+        raise SystemExit(0)
+
+    options = dict(
+        chunksize=args.chunksize,
+        list_mode=args.list_mode,
+        csv_engine=args.csv_engine,
+        dtype_backend=args.dtype_backend,
+        use_cache=not args.no_cache,
+        project=args.project,
+        keep_columns=[c.strip() for c in args.keep_columns.split(",") if c.strip()],
+        xml_record=args.xml_record,
+        sheets=parse_sheets(args.sheets),
+        sheet_workers=args.sheet_workers,
+        concurrent_load=args.concurrent_load,
+        load_options={
+            "mode": "upsert" if args.upsert or args.upsert_key else "insert",
+            "key": [k.strip() for k in args.upsert_key.split(",") if k.strip()] or None,
+        },
+        transform_options={
+            "copy_free": args.copy_free,
+            "schema": args.schema,
+            "dedupe_on": [c.strip() for c in args.dedupe_on.split(",") if c.strip()] or None,
+        },
+    )
+
+    if args.watch:
+        if not args.dir:
+            parser.error("--watch requires --dir")
+        from etl.watch import watch_directory
+
+        watch_directory(
+            args.dir,
+            runner=lambda files: run_batch(files, workers=args.workers, **options),
+            pattern=args.glob,
+            manifest=args.manifest,
+            debounce=args.debounce,
+        )
+        raise SystemExit(0)
+
+    if args.dir:
+        files = discover_files(args.dir, args.glob)
+        if not files:
+            parser.error(f"no files match {args.glob!r} in {args.dir}")
+        results = run_batch(files, workers=args.workers, **options)
+        raise SystemExit(1 if any(r["status"] == "failed" for r in results) else 0)
+
+    result = run_etl(args.file_path, **options)
+    raise SystemExit(1 if result["status"] == "failed" else 0)
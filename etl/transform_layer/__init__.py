@@ -9,29 +9,39 @@ Modules included:
 - normalization: Standardizes types & formatting
 - enrichment: Adds derived/lookup/enhanced data
 - converters: Final authoritative type conversions
+- schema_registry: Per-source column types compiled into conversion plans
+- datetimes: Format-inferring datetime parsing
+- arrow_strings: Arrow compute kernels for string / bool columns
 - utils: Common shared helpers
 
 Usage:
     from transform_layer import run_transform_pipeline
 """
 
-from .transform_main import run_transform_pipeline
+from .transform_main import run_transform_pipeline, projection_columns
 from . import cleaning
 from . import validators
 from . import normalization
 from . import enrichment
 from . import converters
+from . import schema_registry
+from . import datetimes
+from . import arrow_strings
 from . import utils
 
 __version__ = "1.0.0"
 
 __all__ = [
     "run_transform_pipeline",
+    "projection_columns",
     "cleaning",
     "validators",
     "normalization",
     "enrichment",
     "converters",
+    "schema_registry",
+    "datetimes",
+    "arrow_strings",
     "utils",
     "__version__",
 ]
@@ -0,0 +1,67 @@
+"""
+Arrow compute kernels for string normalization and boolean parsing.
+
+Columns are cast once to string[pyarrow] and then stay in Arrow memory:
+strip / lower / upper / regex replace / membership run as pyarrow.compute
+kernels over the whole column instead of Python calls per element.
+Results are returned as string[pyarrow] (or nullable boolean) Series.
+
+Differences from the Python str methods: Arrow maps case one code point to
+one code point, so "ß".upper() stays "ß" (Python: "SS") and "İ".lower() is
+"i". Whitespace matches Python's str.isspace() set.
+
+Main public functions:
+    standardize_text(series) -> pd.Series     strip, collapse spaces, lowercase
+    normalize_code(series) -> pd.Series       strip, uppercase
+    to_arrow_string(series) -> pd.Series
+    parse_bool(series, true_values, false_values) -> pd.Series
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+ARROW_STRING = pd.StringDtype("pyarrow")
+
+# RE2's \s is ASCII only; this is the set Python's str.isspace() accepts
+WHITESPACE_RUN = r"[\s\v\p{Z}\x{1c}-\x{1f}\x{85}]+"
+
+
+def _arrow(series: pd.Series) -> pa.Array:
+    """The column as an Arrow string array (cast once; no copy if already string[pyarrow])."""
+    if series.dtype != ARROW_STRING:
+        series = series.astype(ARROW_STRING)
+    return pa.array(series.array)
+
+
+def _series(values, like: pd.Series) -> pd.Series:
+    return pd.Series(pd.arrays.ArrowStringArray(values), index=like.index, name=like.name)
+
+
+def to_arrow_string(series: pd.Series) -> pd.Series:
+    """Same values as astype("string"), stored in Arrow memory."""
+    return series.astype(ARROW_STRING)
+
+
+def standardize_text(series: pd.Series) -> pd.Series:
+    """strip, collapse whitespace runs to one space, lowercase."""
+    values = pc.utf8_trim_whitespace(_arrow(series))
+    values = pc.replace_substring_regex(values, pattern=WHITESPACE_RUN, replacement=" ")
+    return _series(pc.utf8_lower(values), series)
+
+
+def normalize_code(series: pd.Series) -> pd.Series:
+    """strip, uppercase (country / postal codes)."""
+    return _series(pc.utf8_upper(pc.utf8_trim_whitespace(_arrow(series))), series)
+
+
+def parse_bool(series: pd.Series, true_values, false_values) -> pd.Series:
+    """
+    Lowercased text in true_values -> True, in false_values -> False,
+    anything else (and missing) -> <NA>. Returns a nullable boolean Series.
+    """
+    values = pc.utf8_lower(_arrow(series))
+    is_true = pc.is_in(values, value_set=pa.array(sorted(true_values), pa.string()))
+    is_false = pc.is_in(values, value_set=pa.array(sorted(false_values), pa.string()))
+    result = pc.if_else(is_true, True, pc.if_else(is_false, False, pa.scalar(None, pa.bool_())))
+    return pd.Series(pd.BooleanDtype().__from_arrow__(result), index=series.index, name=series.name)
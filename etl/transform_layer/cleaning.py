@@ -2,7 +2,9 @@
 import logging
 import pandas as pd
 import numpy as np
-import json
+
+from etl.extract.projection import standardize_name
+from .utils import hashable
 
 logger = logging.getLogger(__name__)
 
@@ -18,40 +20,57 @@ def standardize_column_names(df):
     else:
         df.columns = df.columns.map(lambda x: str(x).strip())
 
-    df.columns = (
-        pd.Index(df.columns)
-        .str.strip()
-        .str.lower()
-        .str.replace(r"\s+", "_", regex=True)
-        .str.replace(r"[^a-z0-9_]", "_", regex=True)
-        .str.replace(r"_+", "_", regex=True)
-        .str.strip("_")
-    )
+    df.columns = [standardize_name(col) for col in df.columns]
     return df
 
 
-# 🔥 NEW: Fixes "unhashable type: dict"
-def make_hashable(df: pd.DataFrame) -> pd.DataFrame:
+def _column_codes(col: pd.Series) -> np.ndarray:
+    """Integer codes with duplicated()'s equality; dict/list cells go through JSON."""
+    try:
+        codes, _ = pd.factorize(col)
+    except TypeError:
+        # unhashable cells: serialize this column only
+        codes, _ = pd.factorize(col.map(hashable))
+    return codes
+
+
+def row_hashes(df: pd.DataFrame, subset=None) -> pd.Series:
     """
-    Convert nested dicts/lists to JSON strings
-    so drop_duplicates() will not crash.
+    64-bit hash per row over all columns (or subset). Every column is
+    factorized once, and the codes are hashed together vectorized.
     """
-    return df.apply(
-        lambda col: col.map(
-            lambda x: json.dumps(x, sort_keys=True)
-            if isinstance(x, (dict, list))
-            else x
-        )
+    if subset is None:
+        positions = range(df.shape[1])
+    else:
+        positions = [df.columns.get_loc(col) for col in subset]
+    codes = pd.DataFrame(
+        {i: _column_codes(df.iloc[:, pos]) for i, pos in enumerate(positions)},
+        index=df.index,
     )
+    return pd.util.hash_pandas_object(codes, index=False)
+
+
+def drop_duplicate_rows(df: pd.DataFrame, subset=None):
+    """
+    Drop repeated rows (first one kept), comparing row hashes over all
+    columns or the subset key columns. Returns (df, number of rows dropped).
+    """
+    if df.empty:
+        return df, 0
+
+    mask = row_hashes(df, subset).duplicated().to_numpy()
+    dropped = int(mask.sum())
+    return (df[~mask] if dropped else df), dropped
 
 
-def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+def clean_dataframe(df: pd.DataFrame, dedupe_on=None) -> pd.DataFrame:
     """
     Full cleaning step for transform layer.
     - Standardizes column names
     - Drops fully empty rows
     - Fills remaining NaNs
-    - Removes duplicates safely (works with nested dict/list)
+    - Removes duplicates safely (works with nested dict/list), over all
+      columns or only the dedupe_on key columns
     """
     logger.info("Cleaning dataframe...")
 
@@ -63,11 +82,15 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     # Replace NaN with empty string
     df = df.fillna("")
 
-    # 🛡 SAFE duplicate removal (patched)
+    # 🛡 SAFE duplicate removal (row hashes; only dict/list columns serialized)
+    subset = [standardize_name(col) for col in dedupe_on] if dedupe_on else None
+    if subset:
+        missing = [col for col in subset if col not in df.columns]
+        if missing:
+            raise ValueError(f"dedupe_on columns not found: {missing}")
     try:
-        safe_df = make_hashable(df)
-        mask = safe_df.duplicated()
-        df = df[~mask]
+        df, dropped = drop_duplicate_rows(df, subset)
+        logger.info(f"Dropped {dropped} duplicate rows" + (f" on {subset}" if subset else ""))
     except Exception as e:
         logger.error(f"Duplicate removal failed: {e}")
         # fallback = keep original df without removing duplicates
@@ -10,22 +10,38 @@ Typical tasks:
 - Coerce data to safe formats expected by the destination
 
 Main public function:
-    convert_types(df: pd.DataFrame) -> pd.DataFrame
+    convert_types(df: pd.DataFrame, schema=None, source=None) -> pd.DataFrame
+
+Column types are declared in the schema files (see schema_registry); the
+helpers below are the kernels its plans run.
 """
 
 import logging
 import pandas as pd
 
+from . import arrow_strings
+from .datetimes import parse_datetimes
+from .utils import owned_copy
+
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------
+#  Boolean vocabulary
+# ---------------------------------------------------------
+
+# Matched after lowercasing; a schema can override it
+TRUE_VALUES = ("true", "1", "yes", "y", "t")
+FALSE_VALUES = ("false", "0", "no", "n", "f")
+
+
 # ---------------------------------------------------------
 #  Helper Conversion Functions
 # ---------------------------------------------------------
 
 def convert_to_int(df: pd.DataFrame, columns: list) -> pd.DataFrame:
     """Convert selected columns to integer (nullable int)."""
-    df = df.copy()
+    df = owned_copy(df)
     for col in columns:
         if col in df.columns:
             logger.debug(f"Converting '{col}' → int")
@@ -35,7 +51,7 @@ def convert_to_int(df: pd.DataFrame, columns: list) -> pd.DataFrame:
 
 def convert_to_float(df: pd.DataFrame, columns: list) -> pd.DataFrame:
     """Convert selected columns to float."""
-    df = df.copy()
+    df = owned_copy(df)
     for col in columns:
         if col in df.columns:
             logger.debug(f"Converting '{col}' → float")
@@ -43,48 +59,45 @@ def convert_to_float(df: pd.DataFrame, columns: list) -> pd.DataFrame:
     return df
 
 
-def convert_to_bool(df: pd.DataFrame, columns: list) -> pd.DataFrame:
-    """Convert selected columns to boolean."""
-    df = df.copy()
-    true_values = {"true", "1", "yes", "y", "t"}
-    false_values = {"false", "0", "no", "n", "f"}
+def convert_to_bool(df: pd.DataFrame, columns: list, true_values=None, false_values=None) -> pd.DataFrame:
+    """
+    Convert selected columns to boolean: lowercased text in true_values /
+    false_values (default TRUE_VALUES / FALSE_VALUES), anything else -> <NA>.
+    """
+    df = owned_copy(df)
+    true_values = TRUE_VALUES if true_values is None else true_values
+    false_values = FALSE_VALUES if false_values is None else false_values
 
     for col in columns:
         if col in df.columns:
             logger.debug(f"Converting '{col}' → bool")
-            df[col] = (
-                df[col]
-                .astype("string")
-                .str.lower()
-                .map(lambda v: True if v in true_values else False if v in false_values else pd.NA)
-                .astype("boolean")
-            )
+            df[col] = arrow_strings.parse_bool(df[col], true_values, false_values)
     return df
 
 
 def convert_to_string(df: pd.DataFrame, columns: list) -> pd.DataFrame:
-    """Convert selected columns to string dtype."""
-    df = df.copy()
+    """Convert selected columns to string dtype (Arrow-backed)."""
+    df = owned_copy(df)
     for col in columns:
         if col in df.columns:
             logger.debug(f"Converting '{col}' → string")
-            df[col] = df[col].astype("string")
+            df[col] = arrow_strings.to_arrow_string(df[col])
     return df
 
 
 def convert_to_datetime(df: pd.DataFrame, columns: list) -> pd.DataFrame:
     """Convert selected columns to pandas datetime with coercion."""
-    df = df.copy()
+    df = owned_copy(df)
     for col in columns:
         if col in df.columns:
             logger.debug(f"Converting '{col}' → datetime")
-            df[col] = pd.to_datetime(df[col], errors="coerce")
+            df[col] = parse_datetimes(df[col])
     return df
 
 
 def convert_to_category(df: pd.DataFrame, columns: list) -> pd.DataFrame:
     """Convert selected columns to category dtype."""
-    df = df.copy()
+    df = owned_copy(df)
     for col in columns:
         if col in df.columns:
             logger.debug(f"Converting '{col}' → category")
@@ -96,36 +109,16 @@ def convert_to_category(df: pd.DataFrame, columns: list) -> pd.DataFrame:
 #  Main Conversion Pipeline
 # ---------------------------------------------------------
 
-def convert_types(df: pd.DataFrame) -> pd.DataFrame:
+def convert_types(df: pd.DataFrame, schema=None, source=None) -> pd.DataFrame:
     """
-    Final authoritative type conversion for each column.
-    Modify the schema definition below to match your data model.
+    Final authoritative type conversion: the schema's full conversion plan.
+    schema / source pick the schema as in schema_registry.load_schema.
     """
+    from . import schema_registry
 
     logger.info("Running type conversion pipeline...")
-    df = df.copy()
-
-    # ----------------------------------------
-    # Schema definition (customize for your domain!)
-    # ----------------------------------------
-
-    int_columns = ["id", "age", "quantity"]
-    float_columns = ["price", "amount"]
-    bool_columns = ["is_active", "is_deleted"]
-    string_columns = ["name", "category", "country_code", "postal_code"]
-    datetime_columns = ["created_at", "updated_at", "dob"]
-    category_columns = ["age_group", "status"]
-
-    # ----------------------------------------
-    # Apply conversions
-    # ----------------------------------------
-
-    df = convert_to_int(df, int_columns)
-    df = convert_to_float(df, float_columns)
-    df = convert_to_bool(df, bool_columns)
-    df = convert_to_string(df, string_columns)
-    df = convert_to_datetime(df, datetime_columns)
-    df = convert_to_category(df, category_columns)
+    plan = schema_registry.compile_plan(schema_registry.load_schema(schema, source=source), df.columns)
+    df = plan.apply(owned_copy(df))
 
     logger.info("Type conversion pipeline complete")
     logger.debug(f"Final schema:\n{df.dtypes}")
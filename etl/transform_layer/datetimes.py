@@ -0,0 +1,138 @@
+"""
+Datetime parsing for the transform layer.
+
+pd.to_datetime(errors="coerce") without a format guesses one from the first
+value only. When that guess fails (a bad or unusual first value), pandas
+parses every element with dateutil, and when it succeeds, rows in any other
+format silently become NaT.
+
+parse_datetimes() instead:
+- infers a format from a sample of distinct values (the most common guess
+  that parses the whole sample, so 05/01 vs 25/01 settles day-first; ISO
+  8601 variants of differing precision parse as "ISO8601")
+- parses the column vectorized with that format, then infers a format for
+  the rows that failed and repeats (up to MAX_FORMATS formats)
+- falls back to per-element parsing only for the rows still unparsed
+- for low-cardinality columns, parses the distinct values once and maps
+  them back to the rows
+
+Main public function:
+    parse_datetimes(series: pd.Series) -> pd.Series
+"""
+
+import logging
+import warnings
+from collections import Counter
+
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_string_dtype
+from pandas.tseries.api import guess_datetime_format
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_SIZE = 20           # distinct values used to infer a format
+MAX_FORMATS = 3            # vectorized passes before per-element parsing
+UNIQUE_RATIO = 0.5         # parse distinct values only when nunique <= ratio * rows
+CARDINALITY_ROWS = 10_000  # leading rows used to estimate that ratio
+
+
+def infer_datetime_format(values, sample_size: int = SAMPLE_SIZE):
+    """strftime format (or "ISO8601") inferred from a sample of values, or None."""
+    values = pd.Series(values)
+    head = values.head(sample_size * 20).dropna()
+    if head.empty:
+        head = values.dropna().head(sample_size * 20)
+    sample = [value for value in pd.unique(head)[:sample_size] if isinstance(value, str)]
+    with warnings.catch_warnings():
+        # "Parsing dates in %d/%m/%Y format when dayfirst=False": the sample settles day-first below
+        warnings.filterwarnings("ignore", message="Parsing dates in")
+        guesses = Counter(fmt for fmt in map(guess_datetime_format, sample) if fmt)
+    if not guesses:
+        return None
+    if len(guesses) > 1 and all(fmt.startswith("%Y-%m-%d") for fmt in guesses):
+        return "ISO8601"
+
+    for fmt, _ in guesses.most_common():
+        parsed = pd.to_datetime(pd.Series(sample, dtype=object), format=fmt, errors="coerce")
+        if parsed.notna().all():
+            return fmt
+    return guesses.most_common(1)[0][0]
+
+
+def _coerce(values: pd.Series) -> pd.Series:
+    """The previous behaviour: pd.to_datetime without a format."""
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Could not infer format")
+        return pd.to_datetime(values, errors="coerce")
+
+
+def _per_element(values: pd.Series) -> pd.Series:
+    """Parse every value on its own (dateutil), whatever its format."""
+    return pd.to_datetime(values, format="mixed", errors="coerce")
+
+
+def _to_datetime(values: pd.Series, fmt: str):
+    """Vectorized parse with fmt, or None if the result is not a datetime64 column."""
+    try:
+        parsed = pd.to_datetime(values, format=fmt, errors="coerce")
+    except (ValueError, TypeError):
+        return None  # e.g. tz-aware and naive values in one column
+    return parsed if is_datetime64_any_dtype(parsed.dtype) else None
+
+
+def _parse(values: pd.Series, sample_size: int) -> pd.Series:
+    values = values.reset_index(drop=True)  # labels == positions below
+    fmt = infer_datetime_format(values, sample_size)
+    parsed = _to_datetime(values, fmt) if fmt else None
+    if parsed is None:
+        return _coerce(values)
+
+    formats = [fmt]
+    missing = parsed.isna().to_numpy()
+    pending = values[missing & values.notna().to_numpy()] if missing.any() else values.iloc[:0]
+    while not pending.empty and len(formats) < MAX_FORMATS:
+        fmt = infer_datetime_format(pending, sample_size)
+        chunk = _to_datetime(pending, fmt) if fmt else None
+        if chunk is None or chunk.dtype != parsed.dtype:
+            break
+        formats.append(fmt)
+        parsed[chunk.index[chunk.notna()]] = chunk.dropna()
+        pending = pending[chunk.isna()]
+
+    if not pending.empty:
+        rest = _per_element(pending).dropna()
+        if len(rest) and rest.dtype != parsed.dtype:
+            logger.debug(f"Mixed datetime kinds after formats {formats}; using pd.to_datetime defaults")
+            return _coerce(values)
+        parsed[rest.index] = rest
+
+    logger.debug(f"Parsed datetimes with formats {formats} ({len(pending)} rows per element)")
+    return parsed
+
+
+def parse_datetimes(
+    series: pd.Series,
+    sample_size: int = SAMPLE_SIZE,
+    unique_ratio: float = UNIQUE_RATIO
+) -> pd.Series:
+    """
+    Equivalent of pd.to_datetime(series, errors="coerce") that parses with
+    inferred formats and only falls back per element for the remaining rows.
+    Non-text columns are passed to pd.to_datetime unchanged.
+    """
+    if is_datetime64_any_dtype(series.dtype) or not is_string_dtype(series.dtype):
+        return pd.to_datetime(series, errors="coerce")
+    if pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+        return _coerce(series)
+
+    head = series.head(CARDINALITY_ROWS)
+    if head.nunique() > unique_ratio * len(head):
+        parsed = _parse(series, sample_size)
+        return pd.Series(parsed.array, index=series.index, name=series.name)
+
+    codes, uniques = pd.factorize(series)
+    parsed = _parse(pd.Series(uniques, dtype=object), sample_size)
+    if not is_datetime64_any_dtype(parsed.dtype):
+        return _coerce(series)
+    values = parsed.array.take(codes, allow_fill=True)  # -1 (missing) -> NaT
+    return pd.Series(values, index=series.index, name=series.name)
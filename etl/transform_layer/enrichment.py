@@ -14,8 +14,16 @@ Main public function:
 import logging
 import pandas as pd
 
+from .utils import owned_copy
+
 logger = logging.getLogger(__name__)
 
+# Input columns read by the enrichment steps below
+COLUMNS = ["first_name", "last_name", "age", "country_code", "updated_at"]
+
+# Columns the enrichment steps (re)create; typed after enrichment
+OUTPUT_COLUMNS = ["full_name", "age_group", "country_name", "is_active"]
+
 
 # ---------------------------------------------------------
 #  Example 1: Derived Fields
@@ -27,7 +35,7 @@ def add_full_name(df: pd.DataFrame) -> pd.DataFrame:
     """
     if {"first_name", "last_name"}.issubset(df.columns):
         logger.debug("Adding full_name field...")
-        df = df.copy()
+        df = owned_copy(df)
         df["full_name"] = (
             df["first_name"].astype("string").str.strip() + " " +
             df["last_name"].astype("string").str.strip()
@@ -50,7 +58,7 @@ def add_age_group(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     logger.debug("Adding age_group field...")
-    df = df.copy()
+    df = owned_copy(df)
     df["age_group"] = pd.cut(
         df["age"],
         bins=[0, 17, 29, 44, 59, 100, 200],
@@ -84,7 +92,7 @@ def enrich_country_name(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     logger.debug("Adding country_name based on country_code...")
-    df = df.copy()
+    df = owned_copy(df)
     df["country_name"] = df["country_code"].map(country_lookup).fillna("Unknown")
 
     return df
@@ -105,7 +113,7 @@ def add_is_active(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     logger.debug("Adding is_active field...")
-    df = df.copy()
+    df = owned_copy(df)
 
     # if updated_at is datetime
     if pd.api.types.is_datetime64_any_dtype(df["updated_at"]):
@@ -127,7 +135,7 @@ def enrich(df: pd.DataFrame) -> pd.DataFrame:
     """
 
     logger.info("Running enrichment pipeline...")
-    df = df.copy()
+    df = owned_copy(df)
 
     # 1. Derived name fields
     df = add_full_name(df)
@@ -0,0 +1,218 @@
+"""
+Schema registry for the transform layer.
+
+Column types are declared once per source in a TOML file (see
+schemas/default.toml); normalization and converters only provide the
+kernels. A schema is compiled against the columns of the frame into a
+ConversionPlan. The plan converts each present column exactly once,
+grouping columns by kernel, and skips columns that are absent.
+
+Parsed schemas and compiled plans are cached per process, keyed by the
+schema file's mtime and the column set. Batch and watch runs therefore
+compile a plan once per file layout, not once per file.
+
+Schema lookup, first match wins:
+    1. an explicit path to a .toml file
+    2. <name>.toml in $ETL_SCHEMA_DIR, then in schemas/
+    3. schemas/default.toml (only for optional per-source lookups)
+
+Main public functions:
+    load_schema(name_or_path=None, source=None) -> Schema
+    compile_plan(schema, columns, exclude=(), convert=True) -> ConversionPlan
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from functools import partial
+
+import pandas as pd
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11: the toml package pinned in requirements.txt
+    tomllib = None
+    import toml
+
+from . import converters
+from . import normalization
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_DIR = os.path.join(os.path.dirname(__file__), "schemas")
+DEFAULT_SCHEMA = "default"
+_EXTENSIONS = (".toml",)
+
+# type -> helper(df, columns) applying that conversion to a list of columns
+KERNELS = {
+    "int": converters.convert_to_int,
+    "float": converters.convert_to_float,
+    "bool": converters.convert_to_bool,
+    "string": converters.convert_to_string,
+    "text": normalization.standardize_string_columns,
+    "code": normalization.normalize_code_fields,
+    "datetime": converters.convert_to_datetime,
+    "category": converters.convert_to_category,
+}
+
+# convert=False (normalization only): numbers are coerced without forcing
+# Int64, and final-only types are left alone
+_NORMALIZE_ONLY = {"int": "numeric", "float": "numeric", "bool": None, "category": None, "string": None}
+_NORMALIZE_KERNELS = {"numeric": normalization.normalize_numeric_columns}
+
+_schemas = {}  # path -> (mtime_ns, Schema)
+_plans = {}    # (path, mtime_ns, columns, exclude, convert) -> ConversionPlan
+
+
+@dataclass(frozen=True)
+class Schema:
+    name: str
+    path: str
+    mtime_ns: int
+    columns: dict  # column -> type
+    true_values: tuple = None   # bool vocabulary; None = converters defaults
+    false_values: tuple = None
+
+    @property
+    def column_names(self):
+        return list(self.columns)
+
+
+# ---------------------------------------------------------
+#  Loading
+# ---------------------------------------------------------
+
+def _search_dirs():
+    custom = os.getenv("ETL_SCHEMA_DIR")
+    return [custom, SCHEMA_DIR] if custom else [SCHEMA_DIR]
+
+
+def find_schema(name):
+    """Path of the schema file for a name or path, or None."""
+    if os.path.splitext(name)[1].lower() in _EXTENSIONS and os.path.isfile(name):
+        return name
+    for directory in _search_dirs():
+        for ext in _EXTENSIONS:
+            path = os.path.join(directory, name + ext)
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+def _read_file(path):
+    if tomllib is None:
+        with open(path, "r", encoding="utf-8") as f:
+            return toml.load(f)
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _parse_columns(raw, path):
+    columns = {}
+    for column, spec in (raw.get("columns") or {}).items():
+        kind = spec.get("type") if isinstance(spec, dict) else spec
+        if kind not in KERNELS:
+            raise ValueError(f"{path}: column '{column}' has unknown type {kind!r} (expected one of {list(KERNELS)})")
+        columns[column] = kind
+    return columns
+
+
+def _parse_vocabulary(raw, path):
+    vocab = raw.get("bool") or {}
+    unknown = set(vocab) - {"true", "false"}
+    if unknown:
+        raise ValueError(f"{path}: [bool] accepts 'true' and 'false' lists, got {sorted(unknown)}")
+    return tuple(
+        tuple(str(v).lower() for v in vocab[side]) if side in vocab else None
+        for side in ("true", "false")
+    )
+
+
+def load_schema(name=None, source=None):
+    """
+    Load a schema by name or path (must exist), or the optional per-source
+    schema for `source` (falls back to the default). Cached until the file changes.
+    """
+    if name:
+        path = find_schema(name)
+        if path is None:
+            raise FileNotFoundError(f"Schema '{name}' not found in {_search_dirs()}")
+    else:
+        path = (source and find_schema(source)) or find_schema(DEFAULT_SCHEMA)
+
+    mtime = os.stat(path).st_mtime_ns
+    cached = _schemas.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    raw = _read_file(path)
+    true_values, false_values = _parse_vocabulary(raw, path)
+    schema = Schema(
+        name=os.path.splitext(os.path.basename(path))[0],
+        path=path,
+        mtime_ns=mtime,
+        columns=_parse_columns(raw, path),
+        true_values=true_values,
+        false_values=false_values,
+    )
+    _schemas[path] = (mtime, schema)
+    logger.debug(f"Loaded schema '{schema.name}' from {path} ({len(schema.columns)} columns)")
+    return schema
+
+
+# ---------------------------------------------------------
+#  Plans
+# ---------------------------------------------------------
+
+class ConversionPlan:
+    """Ordered (kernel, columns) steps; each column appears in exactly one step."""
+
+    def __init__(self, schema_name, steps):
+        self.schema_name = schema_name
+        self.steps = steps
+
+    @property
+    def columns(self):
+        return [col for _, _, cols in self.steps for col in cols]
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        for kind, kernel, cols in self.steps:
+            logger.debug(f"Plan '{self.schema_name}': {kind} -> {cols}")
+            df = kernel(df, cols)
+        return df
+
+    def __repr__(self):
+        steps = ", ".join(f"{kind}={cols}" for kind, _, cols in self.steps)
+        return f"ConversionPlan({self.schema_name}: {steps})"
+
+
+def compile_plan(schema, columns, exclude=(), convert=True):
+    """
+    Compile schema against the frame's columns. Columns not present, or in
+    exclude (e.g. converted already / produced later), are skipped.
+    convert=False keeps only the normalization part (numbers coerced, no Int64/bool/category).
+    """
+    key = (schema.path, schema.mtime_ns, tuple(columns), tuple(exclude), convert)
+    plan = _plans.get(key)
+    if plan is not None:
+        return plan
+
+    present = set(columns) - set(exclude)
+    grouped = {}
+    for column, kind in schema.columns.items():
+        if column not in present:
+            continue
+        if not convert and kind in _NORMALIZE_ONLY:
+            kind = _NORMALIZE_ONLY[kind]
+            if kind is None:
+                continue
+        grouped.setdefault(kind, []).append(column)
+
+    kernels = {**KERNELS, **_NORMALIZE_KERNELS}
+    if schema.true_values is not None or schema.false_values is not None:
+        kernels["bool"] = partial(
+            converters.convert_to_bool, true_values=schema.true_values, false_values=schema.false_values
+        )
+    plan = ConversionPlan(schema.name, [(kind, kernels[kind], cols) for kind, cols in grouped.items()])
+    _plans[key] = plan
+    return plan
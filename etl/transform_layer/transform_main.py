@@ -8,19 +8,23 @@ This module coordinates the sequential transformation steps:
 4. Enrichment
 5. Type conversions (if needed)
 
+Normalization and type conversion are driven by the source's schema (see
+schema_registry): columns read by enrichment are typed in step 3, the
+columns enrichment produces in step 5, so every column is converted once.
+
 It logs each step and returns the final processed DataFrame.
 """
 
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 import pandas as pd
 
 # Import individual step modules
 from . import cleaning
 from . import validators
-from . import normalization
 from . import enrichment
-from . import converters
+from . import schema_registry
+from .utils import owned_copy
 
 # ---------------------------------------------------------
 # Logging configuration
@@ -44,6 +48,27 @@ if not logger.handlers:
     logger.addHandler(console_handler)
 
 
+# ---------------------------------------------------------
+# Column Projection
+# ---------------------------------------------------------
+
+def projection_columns(
+    passthrough: Optional[Iterable[str]] = None,
+    schema: Optional[str] = None,
+    source: Optional[str] = None
+) -> set:
+    """
+    Columns the transform pipeline reads (the schema's columns and the
+    enrichment inputs), plus any passthrough columns to keep as-is.
+    Pass this to extract_data(columns=...) to skip everything else.
+    """
+    typed = schema_registry.load_schema(schema, source=source).column_names
+    columns = set(typed) | set(enrichment.COLUMNS)
+    if passthrough:
+        columns |= set(passthrough)
+    return columns
+
+
 # ---------------------------------------------------------
 # Main Orchestrator Function
 # ---------------------------------------------------------
@@ -51,7 +76,11 @@ if not logger.handlers:
 def run_transform_pipeline(
     raw_df: pd.DataFrame,
     enable_enrichment: bool = True,
-    enable_conversions: bool = True
+    enable_conversions: bool = True,
+    copy_free: bool = False,
+    schema: Optional[str] = None,
+    source: Optional[str] = None,
+    dedupe_on: Optional[Iterable[str]] = None
 ) -> pd.DataFrame:
     """
     Runs the full transformation pipeline on the extracted raw dataframe.
@@ -60,22 +89,43 @@ def run_transform_pipeline(
         raw_df (pd.DataFrame): Raw DataFrame from extract layer
         enable_enrichment (bool): Toggle enrichment step
         enable_conversions (bool): Toggle type conversion step
+        copy_free (bool): Run under pandas Copy-on-Write. Steps then take
+            shallow copies and only the columns they modify are duplicated.
+            The output is identical, and unchanged columns may share memory
+            with raw_df, so treat the result as read-only.
+        schema (str): Schema name or path; must exist
+        source (str): Source name (e.g. file stem) used to pick an optional
+            per-source schema, falling back to the default one
+        dedupe_on (list): Key columns for duplicate removal (default: all columns)
 
     Returns:
         pd.DataFrame: Fully processed DataFrame
     """
+    table = schema_registry.load_schema(schema, source=source)
+    if copy_free:
+        with pd.option_context("mode.copy_on_write", True):
+            return _run_steps(raw_df, enable_enrichment, enable_conversions, table, dedupe_on)
+    return _run_steps(raw_df, enable_enrichment, enable_conversions, table, dedupe_on)
+
 
+def _run_steps(
+    raw_df: pd.DataFrame,
+    enable_enrichment: bool,
+    enable_conversions: bool,
+    schema: schema_registry.Schema,
+    dedupe_on: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
     logger.info("======= START TRANSFORM LAYER =======")
-    logger.debug(f"Initial rows: {len(raw_df)} | Columns: {list(raw_df.columns)}")
+    logger.debug(f"Initial rows: {len(raw_df)} | Columns: {list(raw_df.columns)} | Schema: {schema.name}")
 
-    df = raw_df.copy()
+    df = owned_copy(raw_df)
 
     # ----------------------
     # 1. CLEANING
     # ----------------------
     logger.info("Step 1: Cleaning")
     try:
-        df = cleaning.clean_dataframe(df)
+        df = cleaning.clean_dataframe(df, dedupe_on=dedupe_on)
         logger.debug(f"After cleaning: rows={len(df)}, columns={df.columns.tolist()}")
     except Exception as e:
         logger.exception("Cleaning step failed")
@@ -97,7 +147,10 @@ def run_transform_pipeline(
     # ----------------------
     logger.info("Step 3: Normalization")
     try:
-        df = normalization.normalize(df)
+        plan = schema_registry.compile_plan(
+            schema, df.columns, exclude=enrichment.OUTPUT_COLUMNS, convert=enable_conversions
+        )
+        df = plan.apply(df)
         logger.debug(f"After normalization: rows={len(df)}, columns={df.columns.tolist()}")
     except Exception as e:
         logger.exception("Normalization step failed")
@@ -123,7 +176,8 @@ def run_transform_pipeline(
     if enable_conversions:
         logger.info("Step 5: Type Conversions")
         try:
-            df = converters.convert_types(df)
+            remaining = schema_registry.compile_plan(schema, df.columns, exclude=plan.columns)
+            df = remaining.apply(df)
             logger.debug(f"After type conversions: rows={len(df)}, columns={df.columns.tolist()}")
         except Exception as e:
             logger.exception("Type conversion step failed")
@@ -8,8 +8,10 @@ Used across:
 - enrichment.py
 - converters.py
 - transform_main.py
+- etl/load/bulk.py (hashable)
 """
 
+import json
 import logging
 import time
 import pandas as pd
@@ -89,6 +91,39 @@ def log_df_preview(df: pd.DataFrame, n=5):
     logger.debug(f"Preview first {n} rows:\n{df.head(n)}")
 
 
+# ---------------------------------------------------------
+#  Copy Helpers
+# ---------------------------------------------------------
+
+def copy_on_write_enabled() -> bool:
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def owned_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy a DataFrame before a step modifies it.
+    With pandas Copy-on-Write enabled (copy-free mode) a shallow copy is
+    enough: a column is only duplicated when it is actually written to.
+    Otherwise this is the usual deep copy.
+    """
+    return df.copy(deep=False) if copy_on_write_enabled() else df.copy()
+
+
+# ---------------------------------------------------------
+#  Hashing Helpers
+# ---------------------------------------------------------
+
+def hashable(value):
+    """
+    Hashable stand-in for a cell: nested dicts/lists become their canonical
+    JSON text (keys sorted), anything else is returned as is.
+    Shared by row-hash deduplication and upsert row hashes.
+    """
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
 # ---------------------------------------------------------
 #  Schema Helpers
 # ---------------------------------------------------------
@@ -98,7 +133,7 @@ def enforce_column_order(df: pd.DataFrame, ordered_cols: list) -> pd.DataFrame:
     Reorder DataFrame columns safely,
     leaving extra/unexpected columns at the end.
     """
-    df = df.copy()
+    df = owned_copy(df)
     final_cols = [c for c in ordered_cols if c in df.columns] + \
                  [c for c in df.columns if c not in ordered_cols]
     return df[final_cols]
@@ -0,0 +1,217 @@
+"""
+Continuous ingestion from a landing directory.
+
+watch_directory() monitors a directory with watchdog and hands new or
+changed files to a runner (run_etl's batch runner in the CLI) once they
+have stopped changing.
+
+- Debounce: a file is picked up only after `debounce` seconds without
+  events AND with the same size/mtime across one more quiet period, so
+  files that are still being copied are not read half-written.
+- Manifest: a JSON file of path -> (size, mtime, content hash, status)
+  survives restarts. Files whose content was already loaded are skipped;
+  failed files are retried.
+
+Configuration (environment):
+    ETL_MANIFEST   manifest path (default: .etl_manifest.json)
+"""
+
+import fnmatch
+import glob
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from etl.extract.cache import file_digest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST = ".etl_manifest.json"
+DEFAULT_DEBOUNCE = 2.0
+POLL_INTERVAL = 0.5
+
+# editors / downloaders write these first and rename them when done
+_IGNORED_SUFFIXES = (".tmp", ".part", ".partial", ".crdownload", ".swp", "~")
+
+
+# ---------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------
+class Manifest:
+    def __init__(self, path=None):
+        self.path = path or os.getenv("ETL_MANIFEST", DEFAULT_MANIFEST)
+        self.entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            return {}
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def fingerprint(self, path):
+        """(size, mtime, content hash); the hash is reused while size and mtime are unchanged."""
+        stat = os.stat(path)
+        entry = self.entries.get(os.path.abspath(path))
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+            digest = entry["digest"]
+        else:
+            digest = file_digest(path)
+        return {"size": stat.st_size, "mtime": stat.st_mtime_ns, "digest": digest}
+
+    def is_done(self, path, fingerprint):
+        """True when this exact content was already loaded successfully."""
+        key = os.path.abspath(path)
+        entry = self.entries.get(key)
+        if entry is None or entry["status"] == "failed" or entry["digest"] != fingerprint["digest"]:
+            return False
+        if entry["mtime"] != fingerprint["mtime"]:
+            # touched but identical: remember the new mtime to skip rehashing
+            entry.update(fingerprint)
+            self.save()
+        return True
+
+    def record(self, path, fingerprint, result):
+        self.entries[os.path.abspath(path)] = {
+            **fingerprint,
+            "status": result["status"],
+            "rows": result["raw_rows"],
+            "processed_at": datetime.utcnow().isoformat(timespec="seconds"),
+        }
+        self.save()
+
+
+# ---------------------------------------------------------
+# Debounce
+# ---------------------------------------------------------
+class Debouncer:
+    """Tracks files with recent events; hands them out once they are stable."""
+
+    def __init__(self, quiet=DEFAULT_DEBOUNCE):
+        self.quiet = quiet
+        self._pending = {}  # path -> (last change seen, (size, mtime) at last check)
+        self._lock = threading.Lock()
+
+    def touch(self, path):
+        with self._lock:
+            self._pending[path] = (time.monotonic(), None)
+
+    def ready(self):
+        now = time.monotonic()
+        stable = []
+        with self._lock:
+            for path, (seen, signature) in list(self._pending.items()):
+                if now - seen < self.quiet:
+                    continue
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    del self._pending[path]
+                    continue
+                current = (stat.st_size, stat.st_mtime_ns)
+                if current != signature:
+                    # still being written (or first check): wait another quiet period
+                    self._pending[path] = (now, current)
+                    continue
+                del self._pending[path]
+                stable.append(path)
+        return sorted(stable)
+
+
+# ---------------------------------------------------------
+# Watcher
+# ---------------------------------------------------------
+def _wanted(directory, path, pattern, manifest_path):
+    name = os.path.basename(path)
+    if name.startswith(".") or name.endswith(_IGNORED_SUFFIXES):
+        return False
+    if os.path.abspath(path) == os.path.abspath(manifest_path):
+        return False
+    relative = os.path.relpath(path, directory)
+    return fnmatch.fnmatch(relative, pattern) or fnmatch.fnmatch(name, pattern)
+
+
+def _make_handler(directory, pattern, debouncer, manifest_path):
+    from watchdog.events import FileSystemEventHandler
+
+    class LandingHandler(FileSystemEventHandler):
+        def _queue(self, path):
+            if _wanted(directory, path, pattern, manifest_path):
+                debouncer.touch(path)
+
+        def on_created(self, event):
+            if not event.is_directory:
+                self._queue(event.src_path)
+
+        def on_modified(self, event):
+            if not event.is_directory:
+                self._queue(event.src_path)
+
+        def on_moved(self, event):
+            if not event.is_directory:
+                self._queue(event.dest_path)
+
+    return LandingHandler()
+
+
+def watch_directory(directory, runner, pattern="*", manifest=None, debounce=DEFAULT_DEBOUNCE,
+                    stop_event=None):
+    """
+    Run `runner(list_of_paths) -> list_of_results` on new/changed files in
+    directory until interrupted (Ctrl+C) or stop_event is set. Files already
+    present at startup are checked against the manifest too.
+    """
+    from watchdog.observers import Observer
+
+    manifest = manifest if isinstance(manifest, Manifest) else Manifest(manifest)
+    debouncer = Debouncer(debounce)
+    stop_event = stop_event or threading.Event()
+    recursive = "**" in pattern or os.sep in pattern or "/" in pattern
+
+    for path in glob.glob(os.path.join(directory, pattern), recursive=recursive):
+        if os.path.isfile(path) and _wanted(directory, path, pattern, manifest.path):
+            debouncer.touch(path)
+
+    observer = Observer()
+    observer.schedule(_make_handler(directory, pattern, debouncer, manifest.path), directory,
+                      recursive=recursive)
+    observer.start()
+    logger.info(f"Watching {directory} for '{pattern}' (debounce {debounce}s, manifest {manifest.path})")
+
+    try:
+        while not stop_event.is_set():
+            todo = {}
+            for path in debouncer.ready():
+                try:
+                    fingerprint = manifest.fingerprint(path)
+                except FileNotFoundError:
+                    continue
+                if manifest.is_done(path, fingerprint):
+                    logger.info(f"Skipping {path}: already loaded (manifest)")
+                    continue
+                todo[path] = fingerprint
+
+            if todo:
+                for result in runner(list(todo)):
+                    manifest.record(result["file"], todo[result["file"]], result)
+            stop_event.wait(POLL_INTERVAL)
+    except KeyboardInterrupt:
+        logger.info("Watch mode stopped")
+    finally:
+        observer.stop()
+        observer.join()
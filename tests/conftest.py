@@ -0,0 +1,80 @@
+"""
+Shared fixtures: an in-memory MongoDB (mongomock), a throwaway extraction
+cache, and the sample files in data/.
+
+mongomock lags behind pymongo 4.15 and MongoDB in a few places the load layer
+relies on; they are patched here for the test run only:
+- pymongo's UpdateOne / ReplaceOne pass sort= to the bulk builder
+- create_index(unique=True, partialFilterExpression=...) checks existing
+  documents without applying the filter (inserts do apply it)
+- re-creating an index with other options raises without the server's
+  error code (85, IndexOptionsConflict)
+"""
+
+import os
+
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+from mongomock import collection as _mm_collection  # noqa: E402
+from pymongo.errors import DuplicateKeyError, OperationFailure  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+def _drop_sort(add):
+    def wrapper(self, *args, sort=None, **kwargs):
+        return add(self, *args, **kwargs)
+    return wrapper
+
+
+def _create_index(create):
+    def checked(self, key_or_list, **kwargs):
+        try:
+            return create(self, key_or_list, **kwargs)
+        except OperationFailure as e:
+            if e.code is None and "different options" in str(e):
+                raise OperationFailure(str(e), code=85) from e
+            raise
+
+    def wrapper(self, key_or_list, **kwargs):
+        partial = kwargs.get("partialFilterExpression")
+        if partial is None or not kwargs.get("unique"):
+            return checked(self, key_or_list, **kwargs)
+        fields = [key for key, _ in key_or_list]
+        seen = set()
+        for doc in self.find(partial):
+            value = tuple(repr(doc.get(field)) for field in fields)
+            if value in seen:
+                raise DuplicateKeyError("E11000 Duplicate Key Error", 11000)
+            seen.add(value)
+        name = checked(self, key_or_list, **dict(kwargs, unique=False))
+        self._store.indexes[name]["unique"] = True
+        return name
+    return wrapper
+
+
+_builder = _mm_collection.BulkOperationBuilder
+_builder.add_update = _drop_sort(_builder.add_update)
+_builder.add_replace = _drop_sort(_builder.add_replace)
+_mm_collection.Collection.create_index = _create_index(_mm_collection.Collection.create_index)
+
+
+@pytest.fixture(autouse=True)
+def _isolated(tmp_path, monkeypatch):
+    """Fresh extraction cache and per-process load caches for every test."""
+    from etl.load import bulk, schema_tracker
+
+    monkeypatch.setenv("ETL_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(bulk, "_indexed", set())
+    monkeypatch.setattr(schema_tracker, "_indexed", set())
+
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient()["etl_test"]
+
+
+@pytest.fixture
+def data_file():
+    return lambda name: os.path.join(DATA_DIR, name)
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from etl.transform_layer import arrow_strings
+from etl.transform_layer.converters import FALSE_VALUES, TRUE_VALUES
+
+
+TEXT = pd.Series(["  Alice  Smith ", "BOB\tjones", None, "carol  X"], index=[5, 6, 7, 8], name="t")
+
+
+def test_standardize_text_matches_the_str_accessors():
+    expected = TEXT.astype("string").str.strip().str.replace(r"\s+", " ", regex=True).str.lower()
+    result = arrow_strings.standardize_text(TEXT)
+    assert result.dtype == arrow_strings.ARROW_STRING
+    assert result.index.equals(TEXT.index) and result.name == "t"
+    assert result.astype(object).tolist() == expected.astype(object).tolist()
+
+
+def test_normalize_code():
+    result = arrow_strings.normalize_code(pd.Series([" us", "In ", None]))
+    assert result.astype(object).tolist() == ["US", "IN", pd.NA]
+
+
+def test_parse_bool_vocabulary():
+    values = pd.Series(["Yes", "no", "TRUE", "0", "maybe", None])
+    result = arrow_strings.parse_bool(values, TRUE_VALUES, FALSE_VALUES)
+    assert str(result.dtype) == "boolean"
+    assert result.tolist() == [True, False, True, False, pd.NA, pd.NA]
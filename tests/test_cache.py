@@ -0,0 +1,56 @@
+import pandas as pd
+
+from etl.extract import extract_data
+from etl.extract.cache import ExtractCache
+
+
+def people_csv(tmp_path, rows=7):
+    lines = ["id,name,city"] + [f"{i},name{i},city{i % 3}" for i in range(rows)]
+    path = tmp_path / "people.csv"
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def cache_files(tmp_path):
+    return sorted((tmp_path / "cache").glob("*.parquet"))
+
+
+def test_second_extraction_is_served_from_the_cache(tmp_path, capsys):
+    path = people_csv(tmp_path)
+    first = extract_data(path)
+    assert len(cache_files(tmp_path)) == 1
+    capsys.readouterr()
+
+    second = extract_data(path)
+    assert "Cache hit" in capsys.readouterr().out
+    pd.testing.assert_frame_equal(second, first)
+
+
+def test_cache_key_follows_content_and_options(tmp_path, capsys):
+    path = people_csv(tmp_path)
+    extract_data(path)
+    extract_data(path, columns=["id"])
+    assert len(cache_files(tmp_path)) == 2
+
+    people_csv(tmp_path, rows=8)  # same path, new content
+    capsys.readouterr()
+    assert len(extract_data(path)) == 8
+    assert "Cache hit" not in capsys.readouterr().out
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = ExtractCache(str(tmp_path / "lru"), max_bytes=0)
+    df = pd.DataFrame({"a": range(100)})
+    assert cache.put("k1", df)
+    assert cache.get("k1") is None  # over the limit straight away
+    cache.max_bytes = 10**9
+    cache.put("k1", df)
+    cache.put("k2", df)
+    pd.testing.assert_frame_equal(cache.get("k2"), df)
+    assert cache.clear() == 2
+
+
+def test_frames_parquet_cannot_store_are_not_cached(tmp_path):
+    cache = ExtractCache(str(tmp_path / "c"))
+    assert not cache.put("k", pd.DataFrame({0: [1]}))
+    assert cache.get("k") is None
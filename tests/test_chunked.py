@@ -0,0 +1,27 @@
+import pandas as pd
+
+from etl.extract import extract_data
+
+
+def people_csv(tmp_path, rows=7):
+    lines = ["id,name,city"] + [f"{i},name{i},city{i % 3}" for i in range(rows)]
+    path = tmp_path / "people.csv"
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_chunks_add_up_to_the_whole_file(tmp_path):
+    path = people_csv(tmp_path)
+    whole = extract_data(path, use_cache=False)
+    chunks = list(extract_data(path, chunksize=3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), whole)
+
+
+def test_chunked_run_loads_every_chunk(db, tmp_path):
+    from etl.run_etl import run_etl
+
+    result = run_etl(people_csv(tmp_path), chunksize=2, db=db, use_cache=False)
+    assert result["status"] == "ok"
+    assert result["raw_rows"] == result["processed_rows"] == 7
+    assert db.raw_data.count_documents({}) == 7
@@ -0,0 +1,51 @@
+import pandas as pd
+
+from etl.extract.projection import make_projection, standardize_name
+from etl.load.bulk import resolve_key
+from etl.transform_layer import cleaning
+
+RAW_NAMES = ["  First Name ", "E-mail", "Zip__Code_", "ID"]
+
+
+def test_one_column_name_rule_everywhere():
+    df = pd.DataFrame([[1, 2, 3, 4]], columns=RAW_NAMES)
+    standardized = list(cleaning.standardize_column_names(df.copy()).columns)
+    assert standardized == ["first_name", "e_mail", "zip_code", "id"]
+    assert standardized == [standardize_name(name) for name in RAW_NAMES]
+
+    projection = make_projection(["first_name", "zip_code"])
+    assert [projection(name) for name in RAW_NAMES] == [True, False, True, False]
+    assert resolve_key(df, ["first_name", "id"]) == ["  First Name ", "ID"]
+
+
+def test_multiindex_columns_are_joined_then_standardized():
+    columns = pd.MultiIndex.from_tuples([("Contact", "Phone No"), ("", "")])
+    df = pd.DataFrame([[1, 2]], columns=columns)
+    assert list(cleaning.standardize_column_names(df).columns) == ["contact_phone_no", "unnamed"]
+
+
+def test_row_hash_dedupe_handles_nested_values():
+    df = pd.DataFrame({
+        "id": [1, 1, 2, 1],
+        "tags": [["a"], ["a"], ["a"], ["b"]],
+        "meta": [{"k": 1, "j": 2}, {"j": 2, "k": 1}, {"k": 1}, {"k": 1}],
+    }, index=[10, 11, 12, 13])
+    kept, dropped = cleaning.drop_duplicate_rows(df)
+    assert dropped == 1 and kept.index.tolist() == [10, 12, 13]
+
+    kept, dropped = cleaning.drop_duplicate_rows(df, subset=["id"])
+    assert dropped == 2 and kept.index.tolist() == [10, 12]
+
+
+def test_row_hash_dedupe_matches_duplicated():
+    df = pd.DataFrame({"a": [1, 1, 2, None, None], "b": ["x", "x", "y", None, None], "c": [0.5, 0.5, 1.0, 2.0, 2.0]})
+    kept, dropped = cleaning.drop_duplicate_rows(df)
+    pd.testing.assert_frame_equal(kept, df.drop_duplicates())
+    assert dropped == 2
+
+
+def test_dedupe_hashes_nested_values_json_cannot_encode():
+    stamp = pd.Timestamp("2024-01-05")
+    df = pd.DataFrame({"id": [1, 1], "meta": [{"at": stamp}, {"at": stamp}]})
+    kept, dropped = cleaning.drop_duplicate_rows(df)
+    assert dropped == 1 and kept.index.tolist() == [0]
@@ -0,0 +1,22 @@
+import pandas as pd
+import pytest
+
+from etl.extract import extract_data
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.mark.parametrize("name", ["frame.parquet", "frame.feather"])
+def test_columnar_files_with_projection_and_chunks(tmp_path, name):
+    frame = pd.DataFrame({"Id": range(5), "First Name": list("abcde"), "skip": [0.5] * 5})
+    path = tmp_path / name
+    if name.endswith(".parquet"):
+        frame.to_parquet(path)
+    else:
+        frame.to_feather(path)
+
+    pd.testing.assert_frame_equal(extract_data(str(path)), frame)
+    projected = extract_data(str(path), columns=["id", "first_name"])
+    assert list(projected.columns) == ["Id", "First Name"]
+    chunks = list(extract_data(str(path), chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
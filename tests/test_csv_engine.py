@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from etl.extract import extract_data
+
+pytest.importorskip("pyarrow")
+
+
+def people_csv(tmp_path, rows=7):
+    lines = ["id,First Name,city"] + [f"{i},name{i},city{i % 3}" for i in range(rows)]
+    path = tmp_path / "people.csv"
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+def test_pyarrow_engine_matches_pandas(tmp_path):
+    path = people_csv(tmp_path)
+    expected = extract_data(path, use_cache=False)
+    pd.testing.assert_frame_equal(extract_data(path, use_cache=False, csv_engine="pyarrow"), expected)
+
+
+def test_pyarrow_chunks_add_up_to_the_whole_file(tmp_path):
+    path = people_csv(tmp_path)
+    whole = extract_data(path, use_cache=False, csv_engine="pyarrow")
+    chunks = list(extract_data(path, chunksize=3, csv_engine="pyarrow"))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), whole)
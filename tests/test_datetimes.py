@@ -0,0 +1,50 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl.transform_layer.datetimes import infer_datetime_format, parse_datetimes
+
+
+def test_day_first_is_settled_by_the_sample():
+    values = pd.Series(["05/01/2024", "25/01/2024", "13/02/2024"])
+    assert infer_datetime_format(values) == "%d/%m/%Y"
+    assert parse_datetimes(values).tolist() == [
+        pd.Timestamp("2024-01-05"), pd.Timestamp("2024-01-25"), pd.Timestamp("2024-02-13")
+    ]
+
+
+def test_bad_first_value_does_not_break_the_column():
+    values = pd.Series(["not a date", "2024-01-05", "2024-03-09"])
+    parsed = parse_datetimes(values)
+    assert pd.isna(parsed.iloc[0])
+    assert parsed.iloc[1:].tolist() == [pd.Timestamp("2024-01-05"), pd.Timestamp("2024-03-09")]
+
+
+def test_mixed_formats_are_parsed_per_format():
+    values = pd.Series(["2024-01-05", "2024-01-06", "2024-01-07", "Jan 8 2024", "09 Jan 2024"])
+    parsed = parse_datetimes(values)
+    assert parsed.tolist() == list(pd.date_range("2024-01-05", periods=5))
+
+
+def test_iso_variants_of_differing_precision():
+    values = pd.Series(["2024-01-05", "2024-01-05T10:30:00", "2024-01-05 10:30:00.250"])
+    assert infer_datetime_format(values) == "ISO8601"
+    assert parse_datetimes(values).notna().all()
+
+
+@pytest.mark.parametrize("rows", [10, 5000])
+def test_matches_pandas_on_a_single_format_column(rows):
+    rng = np.random.default_rng(0)
+    days = pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 40, rows), unit="D")
+    values = pd.Series(days.strftime("%Y-%m-%d"), index=range(100, 100 + rows), name="d", dtype=object)
+    values.iloc[3] = None
+    pd.testing.assert_series_equal(parse_datetimes(values), pd.to_datetime(values, errors="coerce"))
+
+
+def test_format_inference_does_not_warn():
+    values = pd.Series(["05/01/2024", "25/01/2024", "13/02/2024"])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert infer_datetime_format(values) == "%d/%m/%Y"
@@ -0,0 +1,50 @@
+import datetime as dt
+
+import bson
+import numpy as np
+import pandas as pd
+
+from etl.load.encoder import encode_column, to_documents, to_raw_bson
+
+
+def typed_frame():
+    return pd.DataFrame({
+        "int": np.array([1, 2], dtype=np.int64),
+        "float": [1.5, np.nan],
+        "Int64": pd.array([7, None], dtype="Int64"),
+        "bool": pd.array([True, None], dtype="boolean"),
+        "when": pd.to_datetime(["2024-01-05 10:00", None]),
+        "when_tz": pd.to_datetime(["2024-01-05 10:00", None]).tz_localize("UTC"),
+        "gap": pd.to_timedelta(["90s", None]),
+        "cat": pd.Categorical(["a", None]),
+        "text": pd.array(["x", None], dtype="string[pyarrow]"),
+        "nested": [{"k": np.int64(3), "at": pd.Timestamp("2024-01-05")}, [np.float64("nan"), pd.NA]],
+        1: ["name", "is int"],
+    })
+
+
+def test_every_dtype_becomes_plain_python():
+    docs = to_documents(typed_frame())
+    assert docs[0] == {
+        "int": 1, "float": 1.5, "Int64": 7, "bool": True,
+        "when": dt.datetime(2024, 1, 5, 10), "when_tz": dt.datetime(2024, 1, 5, 10, tzinfo=dt.timezone.utc),
+        "gap": 90.0, "cat": "a", "text": "x",
+        "nested": {"k": 3, "at": dt.datetime(2024, 1, 5)}, "1": "name",
+    }
+    assert docs[1] == {
+        "int": 2, "float": None, "Int64": None, "bool": None, "when": None, "when_tz": None,
+        "gap": None, "cat": None, "text": None, "nested": [None, None], "1": "is int",
+    }
+    assert type(docs[0]["int"]) is int and type(docs[0]["Int64"]) is int
+
+
+def test_documents_encode_to_bson():
+    docs = to_documents(typed_frame())
+    raw = to_raw_bson(typed_frame())
+    assert [bson.decode(doc.raw) for doc in raw] == [bson.decode(bson.encode(doc)) for doc in docs]
+
+
+def test_encode_column_matches_the_python_values():
+    series = pd.Series([3, None, 5], dtype="float64")
+    assert encode_column(series) == [3.0, None, 5.0]
+    assert encode_column(pd.Series(["a", None], dtype=object)) == ["a", None]
@@ -0,0 +1,64 @@
+import datetime as dt
+
+import pandas as pd
+import pytest
+
+from etl.extract import extract_data
+from etl.extract.excel_stream import SHEET_COLUMN
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    wb = openpyxl.Workbook()
+    people = wb.active
+    people.title = "people"
+    people.append(["id", "code", "joined", "active"])
+    people.append([1, "00123", dt.datetime(2024, 1, 5), True])
+    people.append([2, "00456", dt.datetime(2024, 2, 1), False])
+    people.append([3, "00789", dt.datetime(2024, 3, 9), True, None, ""])  # padded width
+    orders = wb.create_sheet("orders")
+    orders.append(["id", "total"])
+    orders.append([10, 9.5])
+    path = tmp_path / "book.xlsx"
+    wb.save(path)
+    return str(path)
+
+
+def test_xlsx_cells_keep_their_excel_types(workbook):
+    df = extract_data(workbook, use_cache=False)
+    assert list(df.columns) == ["id", "code", "joined", "active"]
+    assert df["id"].tolist() == [1, 2, 3]
+    assert df["code"].tolist() == ["00123", "00456", "00789"]  # text stays text
+    assert str(df["joined"].dtype).startswith("datetime64")
+    assert df["active"].tolist() == [True, False, True]
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_all_sheets_are_tagged_with_their_name(workbook, chunksize):
+    result = extract_data(workbook, use_cache=False, sheets="all", chunksize=chunksize)
+    df = result if chunksize is None else pd.concat(result, ignore_index=True)
+    assert df[SHEET_COLUMN].tolist() == ["people"] * 3 + ["orders"]
+    assert df["total"].tolist()[-1] == 9.5
+
+
+def test_sheets_by_name_and_index(workbook):
+    df = extract_data(workbook, use_cache=False, sheets=[-1])
+    assert df.to_dict("list") == {"id": [10], "total": [9.5], SHEET_COLUMN: ["orders"]}
+    with pytest.raises(ValueError, match="not found"):
+        extract_data(workbook, use_cache=False, sheets=["nope"], raise_errors=True)
+
+
+def test_sample_workbook(data_file):
+    df = extract_data(data_file("day5.xlsx"), use_cache=False)
+    assert len(df) == 9
+    assert {"First Name", "Country", "Age", "Id"} <= set(df.columns)
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_projection_keeps_the_sheet_tag(workbook, chunksize):
+    result = extract_data(workbook, use_cache=False, sheets="all", columns=["id"], chunksize=chunksize)
+    df = result if chunksize is None else pd.concat(result, ignore_index=True)
+    assert list(df.columns) == ["id", SHEET_COLUMN]
+    assert df[SHEET_COLUMN].tolist() == ["people"] * 3 + ["orders"]
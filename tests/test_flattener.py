@@ -0,0 +1,35 @@
+import pandas as pd
+
+from etl.extract.extractor import flatten_json
+from etl.extract.flattener import ColumnarFlattener, flatten_records
+
+RECORDS = [
+    {"id": 1, "user": {"name": "a", "langs": ["py", "go"]}},
+    {"id": 2, "user": {"name": "b"}, "extra": None},
+    {"id": 3, "user": {"name": "c", "langs": [{"v": 1}]}},
+]
+
+
+def test_columnar_flattener_matches_the_recursive_one():
+    expected = pd.DataFrame([flatten_json(record) for record in RECORDS])
+    actual = flatten_records(iter(RECORDS))
+    assert sorted(actual.columns) == sorted(expected.columns)
+    pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
+
+
+def test_arrow_output_has_the_same_columns():
+    arrow = flatten_records(iter(RECORDS), output="arrow")
+    assert arrow.num_rows == 3
+    assert set(arrow.column_names) == set(flatten_records(iter(RECORDS)).columns)
+
+
+def test_keep_skips_unwanted_leaves():
+    kept = flatten_records(iter(RECORDS), keep=lambda name: name in ("id", "user_name"))
+    assert kept.to_dict("list") == {"id": [1, 2, 3], "user_name": ["a", "b", "c"]}
+
+
+def test_context_is_attached_to_every_row():
+    flattener = ColumnarFlattener()
+    for record in RECORDS[:2]:
+        flattener.append(record, {"source": "api"})
+    assert flattener.to_frame()["source"].tolist() == ["api", "api"]
@@ -0,0 +1,46 @@
+from io import StringIO
+
+import pandas as pd
+import pytest
+
+from etl.extract import extract_data
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+TABLES = """<html><body>
+<table><tr><th>k</th></tr><tr><td>first</td></tr></table>
+<div><table>
+  <tr><th>name</th><th>age</th></tr>
+  <tr><td>Asha</td><td>31</td></tr>
+  <tr><td>Ravi</td><td>40</td></tr>
+</table></div>
+</body></html>
+"""
+
+
+def test_sample_html_matches_pandas(data_file):
+    path = data_file("day3.html")
+    pd.testing.assert_frame_equal(extract_data(path, use_cache=False), pd.read_html(path)[0])
+
+
+@pytest.mark.parametrize("table", [1, "Ravi"])
+def test_html_table_by_index_or_match(tmp_path, table):
+    path = write(tmp_path, "tables.html", TABLES)
+    df = extract_data(path, use_cache=False, html_table=table)
+    pd.testing.assert_frame_equal(df, pd.read_html(StringIO(TABLES))[1])
+
+
+def test_malformed_html_falls_back_to_html5lib(tmp_path):
+    path = write(tmp_path, "broken.html", "<table><tr><th>a<th>b<tr><td>1<td>2<tr><td>3<td>4")
+    assert extract_data(path, use_cache=False).to_dict("list") == {"a": [1, 3], "b": [2, 4]}
+
+
+def test_missing_html_table_fails(tmp_path):
+    path = write(tmp_path, "tables.html", TABLES)
+    with pytest.raises(ValueError):
+        extract_data(path, use_cache=False, html_table=5, raise_errors=True)
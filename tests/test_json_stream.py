@@ -0,0 +1,69 @@
+import json
+
+import pandas as pd
+import pytest
+
+from etl.extract import extract_data
+from etl.extract.json_stream import JsonStream, iter_json_items
+
+NESTED = {
+    "source": "api",
+    "meta": {"page": 1},
+    "tags": ["x"],
+    "items": [
+        {"id": 1, "user": {"name": "a", "langs": ["py", "go"]}},
+        {"id": 2, "user": {"name": "b"}, "extra": None},
+        {"id": 3, "user": {"name": "c", "langs": []}},
+    ],
+}
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def test_largest_root_list_becomes_rows_with_root_fields_as_context(tmp_path):
+    path = write(tmp_path, "nested.json", json.dumps(NESTED))
+    df = extract_data(path, use_cache=False)
+    assert df["id"].tolist() == [1, 2, 3]
+    assert df["user_name"].tolist() == ["a", "b", "c"]
+    assert df["source"].tolist() == ["api"] * 3
+    assert df["meta"].tolist() == [{"page": 1}] * 3
+    assert df["user_langs_0"].tolist()[0] == "py"
+    assert pd.isna(df["user_langs_0"].tolist()[1])
+
+    chunks = list(extract_data(path, chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks, ignore_index=True)["user_name"].tolist() == ["a", "b", "c"]
+
+
+def test_ndjson_streams_one_row_per_line(tmp_path):
+    lines = [json.dumps({"id": i, "pos": {"x": i * 10}}) for i in range(5)]
+    path = write(tmp_path, "events.ndjson", "\n".join(lines[:3]) + "\n\n" + "\n".join(lines[3:]) + "\n")
+    df = extract_data(path, use_cache=False)
+    assert df["id"].tolist() == list(range(5))
+    assert df["pos_x"].tolist() == [0, 10, 20, 30, 40]
+    assert [len(chunk) for chunk in extract_data(path, chunksize=2)] == [2, 2, 1]
+
+
+def test_invalid_ndjson_line_is_reported_with_its_number(tmp_path):
+    path = write(tmp_path, "events.jsonl", '{"id": 1}\n{"id": 2\n')
+    items, _ = iter_json_items(path, lines=True)
+    with pytest.raises(ValueError, match="line 2"):
+        list(items)
+
+
+def test_root_dict_without_lists_is_one_row(tmp_path):
+    path = write(tmp_path, "config.json", json.dumps({"a": 1, "b": {"c": "x"}}))
+    assert extract_data(path, use_cache=False).to_dict("records") == [{"a": 1, "b_c": "x"}]
+
+
+def test_small_blocks_split_values_safely(tmp_path):
+    path = write(tmp_path, "numbers.json", json.dumps([{"n": 1234567890, "s": "x" * 50} for _ in range(20)]))
+    items, _ = iter_json_items(path)
+    assert len(list(items)) == 20
+    with open(path) as f:
+        stream = JsonStream(f, block_size=7)
+        assert [item["n"] for item in stream.iter_array()] == [1234567890] * 20
@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from etl.extract.extractor import normalize_list_columns
+
+
+def lists():
+    return pd.DataFrame({"id": [1, 2, 3], "tags": [["a", "b"], "c", []], "n": [1.0, 2.0, 3.0]})
+
+
+def test_pad_makes_list_columns_rectangular():
+    df = normalize_list_columns(lists(), mode="pad")
+    assert df["tags"].tolist() == [["a", "b"], ["c", None], [None, None]]
+    assert df["n"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_explode_gives_one_row_per_element():
+    df = normalize_list_columns(lists(), mode="explode")
+    assert df["id"].tolist() == [1, 1, 2, 3]  # an empty list keeps its row
+    assert df["tags"].tolist()[:3] == ["a", "b", "c"] and pd.isna(df["tags"].iloc[3])
+
+
+def test_frames_without_lists_are_returned_as_is():
+    df = pd.DataFrame({"a": [1, 2]})
+    assert normalize_list_columns(df, mode="explode") is df
+
+
+def test_unknown_list_mode_is_rejected():
+    with pytest.raises(ValueError):
+        normalize_list_columns(lists(), mode="split")
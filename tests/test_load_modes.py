@@ -0,0 +1,96 @@
+import pandas as pd
+import pytest
+from pymongo.errors import OperationFailure
+
+from etl.load import bulk
+from etl.run_etl import run_etl
+
+
+def frame():
+    return pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+
+
+def test_upsert_is_idempotent_on_row_hash(db):
+    assert bulk.write_frame(frame(), db.c, mode="upsert") == 3
+    assert bulk.write_frame(frame(), db.c, mode="upsert") == 3
+    assert db.c.count_documents({}) == 3
+
+
+def test_upsert_on_natural_key_replaces_changed_rows(db):
+    bulk.write_frame(frame(), db.c, mode="upsert", key=["id"])
+    changed = frame().assign(name=["a", "B", "c"])
+    bulk.write_frame(changed, db.c, mode="upsert", key=["ID"])  # standardized key lookup
+    assert db.c.count_documents({}) == 3
+    assert db.c.find_one({"id": 2})["name"] == "B"
+
+
+def test_rows_with_a_null_natural_key_are_rejected(db):
+    df = pd.DataFrame({"id": [1, None, None], "name": ["a", "b", "c"]})
+    with pytest.raises(bulk.RejectedDocumentsError) as info:
+        bulk.write_frame(df, db.c, mode="upsert", key=["id"])
+    assert (info.value.written, info.value.rejected) == (1, 2)
+    assert db.c.count_documents({}) == 1
+
+
+def test_unknown_upsert_key_is_rejected(db):
+    with pytest.raises(ValueError):
+        bulk.write_frame(frame(), db.c, mode="upsert", key=["nope"])
+
+
+@pytest.mark.parametrize("first, second", [("insert", "upsert"), ("upsert", "insert")])
+def test_insert_and_upsert_runs_share_a_collection(db, data_file, first, second):
+    files = ["day1.json", "day2.csv", "day3.html", "day4.txt", "day5.xlsx", "day6.xml"]
+    expected = {}
+    for mode in (first, second):
+        for name in files:
+            result = run_etl(data_file(name), db=db, use_cache=False, load_options={"mode": mode})
+            assert result["status"] == "ok", (mode, name, result["error"])
+            assert result["raw_rows"] == result["processed_rows"] > 0
+            expected[name] = result["raw_rows"]
+
+    # plain inserts carry no row hash, so neither run blocks the other
+    total = sum(expected.values())
+    assert db.raw_data.count_documents({}) == 2 * total
+    assert db.raw_data.count_documents({bulk.ROW_HASH_FIELD: {"$exists": True}}) == total
+
+
+def test_non_partial_index_from_earlier_runs_is_replaced_on_request(db):
+    db.c.insert_many([{"id": 0}, {"id": -1}])
+    db.c.create_index([(bulk.ROW_HASH_FIELD, 1)], unique=True, sparse=True)
+    with pytest.raises(OperationFailure):
+        bulk.write_frame(frame(), db.c, mode="upsert")
+    assert "partialFilterExpression" not in db.c.index_information()[f"{bulk.ROW_HASH_FIELD}_1"]
+
+    assert bulk.write_frame(frame(), db.c, mode="upsert", rebuild_index=True) == 3
+    index = db.c.index_information()[f"{bulk.ROW_HASH_FIELD}_1"]
+    assert index["partialFilterExpression"] == {bulk.ROW_HASH_FIELD: {"$exists": True}}
+
+
+def test_rejected_documents_are_reported_after_all_batches(db):
+    db.c.create_index("id", unique=True)
+    df = pd.DataFrame({"id": [1, 1, 2, 3, 3], "name": list("abcde")})
+    with pytest.raises(bulk.RejectedDocumentsError) as info:
+        bulk.write_frame(df, db.c, batch_size=2)
+    assert (info.value.written, info.value.rejected) == (3, 2)
+    assert db.c.count_documents({}) == 3
+
+
+@pytest.mark.parametrize("options", [{}, {"concurrent_load": True}, {"chunksize": 1}])
+def test_rejected_rows_fail_the_file(db, data_file, options):
+    db.raw_data.create_index("name", unique=True)
+    db.raw_data.insert_one({"name": "Bob"})
+    result = run_etl(data_file("day2.csv"), db=db, use_cache=False, **options)
+    assert (result["status"], result["stage"]) == ("failed", "Load")
+    assert (result["raw_rows"], result["processed_rows"], result["rejected_rows"]) == (1, 2, 1)
+    assert "IncompleteLoadError" in result["error"]
+
+
+def test_projection_uses_the_per_source_schema(db, data_file, tmp_path, monkeypatch):
+    run_etl(data_file("day2.csv"), db=db, use_cache=False, project=True)
+    assert "city" not in db.raw_data.find_one()
+
+    monkeypatch.setenv("ETL_SCHEMA_DIR", str(tmp_path))
+    (tmp_path / "day2.toml").write_text('[columns]\nname = "text"\ncity = "code"\n')
+    result = run_etl(data_file("day2.csv"), db=db, use_cache=False, project=True, keep_columns=["age"])
+    assert result["status"] == "ok"
+    assert sorted(db.processed_data.find_one({"city": "PUNE"}, {"_id": 0})) == ["age", "age_group", "city", "name"]
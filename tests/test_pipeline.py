@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from etl.transform_layer import run_transform_pipeline
+
+
+def raw():
+    return pd.DataFrame({
+        "ID": ["1", "2", "2"],
+        "First Name": ["  Asha ", "Ravi", "Ravi"],
+        "Last Name": ["K", "M", "M"],
+        "Age": ["31", "x", "x"],
+        "Country Code": [" in", "us", "us"],
+        "Updated At": ["2024-01-05", "2024-02-01", "2024-02-01"],
+    })
+
+
+@pytest.mark.parametrize("copy_free", [False, True])
+def test_pipeline_types_each_column_from_the_schema(copy_free):
+    source = raw()
+    df = run_transform_pipeline(source, copy_free=copy_free)
+    assert len(df) == 2  # exact duplicate dropped
+    assert str(df["id"].dtype) == "Int64"
+    assert df["country_code"].tolist() == ["IN", "US"]
+    assert str(df["updated_at"].dtype).startswith("datetime64")
+    assert {"full_name", "age_group"} <= set(df.columns)
+    pd.testing.assert_frame_equal(source, raw())  # input left untouched
+
+
+def test_dedupe_on_key_columns():
+    df = raw()
+    df.loc[2, "Age"] = "40"
+    assert len(run_transform_pipeline(df)) == 3
+    assert len(run_transform_pipeline(df, dedupe_on=["ID"])) == 2
+    with pytest.raises(ValueError, match="dedupe_on"):
+        run_transform_pipeline(df, dedupe_on=["nope"])
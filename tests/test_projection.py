@@ -0,0 +1,20 @@
+import pandas as pd
+import pytest
+
+from etl.extract import extract_data
+
+
+def people_csv(tmp_path, rows=7):
+    lines = ["id,First Name,city"] + [f"{i},name{i},city{i % 3}" for i in range(rows)]
+    path = tmp_path / "people.csv"
+    path.write_text("\n".join(lines) + "\n")
+    return str(path)
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_projection_keeps_standardized_matches(tmp_path, chunksize):
+    path = people_csv(tmp_path)
+    result = extract_data(path, use_cache=False, chunksize=chunksize, columns=["first_name"])
+    df = result if chunksize is None else pd.concat(result, ignore_index=True)
+    assert list(df.columns) == ["First Name"]
+    assert len(df) == 7
@@ -0,0 +1,46 @@
+import pytest
+
+from etl.extract import extract_data
+from etl.run_etl import run_etl
+
+CORRUPT = {
+    "bad.json": b'{"a": [1, 2,, oops',
+    "bad.jsonl": b'{"id": 1}\n{"id": 2\n',
+    "trailing.json": b'[{"id": 1}] {"id": 2}',
+    "bad.xlsx": b"PK\x03\x04garbage",
+    "bad.xml": b"<root><r><a>1</a></r><r>",
+    "bad.html": b"\x00\x01\x02binary",
+}
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+@pytest.mark.parametrize("name", sorted(CORRUPT))
+def test_corrupt_files_fail_extraction(db, tmp_path, name, chunksize):
+    path = tmp_path / name
+    path.write_bytes(CORRUPT[name])
+    result = run_etl(str(path), db=db, use_cache=False, chunksize=chunksize)
+    assert (result["status"], result["stage"]) == ("failed", "Extraction")
+    assert result["error"]
+    assert db.raw_data.count_documents({}) == 0
+
+
+def test_missing_file_fails_extraction(db, tmp_path):
+    result = run_etl(str(tmp_path / "nope.csv"), db=db)
+    assert (result["status"], result["stage"]) == ("failed", "Extraction")
+    assert result["error"].startswith("FileNotFoundError")
+
+
+def test_extract_data_stays_lenient_by_default(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_bytes(CORRUPT["bad.json"])
+    assert extract_data(str(path), use_cache=False).empty
+    with pytest.raises(ValueError):
+        extract_data(str(path), use_cache=False, raise_errors=True)
+
+
+@pytest.mark.parametrize("chunksize", [None, 1])
+def test_header_only_file_is_empty(db, tmp_path, chunksize):
+    path = tmp_path / "header.csv"
+    path.write_text("name,age\n")
+    result = run_etl(str(path), db=db, use_cache=False, chunksize=chunksize)
+    assert (result["status"], result["stage"]) == ("empty", "Extraction")
@@ -0,0 +1,61 @@
+import pandas as pd
+
+from etl.transform_layer import converters, normalization, schema_registry
+
+
+def write_schema(directory, name, body):
+    path = directory / f"{name}.toml"
+    path.write_text(body)
+    return path
+
+
+def frame():
+    return pd.DataFrame({
+        "id": ["1", "x"],
+        "name": ["  Alice  Smith ", "BOB"],
+        "country": [" in", "us "],
+        "flag": ["on", "no"],
+        "joined": ["2024-01-05", "not a date"],
+        "note": ["keep", "as is"],
+    })
+
+
+def test_wrappers_follow_the_schema_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("ETL_SCHEMA_DIR", str(tmp_path))
+    write_schema(tmp_path, "people", """
+[columns]
+id = "int"
+name = "text"
+country = "code"
+flag = "bool"
+joined = "datetime"
+
+[bool]
+true = ["on"]
+false = ["no"]
+""")
+    normalized = normalization.normalize(frame(), schema="people")
+    assert normalized["id"].tolist()[0] == 1 and pd.isna(normalized["id"].tolist()[1])
+    assert normalized["name"].tolist() == ["alice smith", "bob"]
+    assert normalized["country"].tolist() == ["IN", "US"]
+    assert normalized["flag"].tolist() == ["on", "no"]  # bool is a final-only type
+    assert normalized["note"].tolist() == ["keep", "as is"]
+
+    converted = converters.convert_types(frame(), schema="people")
+    assert str(converted["id"].dtype) == "Int64"
+    assert converted["flag"].tolist() == [True, False]
+    assert pd.isna(converted["joined"].iloc[1]) and converted["joined"].iloc[0] == pd.Timestamp("2024-01-05")
+
+
+def test_per_source_schema_falls_back_to_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("ETL_SCHEMA_DIR", str(tmp_path))
+    write_schema(tmp_path, "day9", '[columns]\nnote = "code"\n')
+    assert converters.convert_types(frame(), source="day9")["note"].tolist() == ["KEEP", "AS IS"]
+    assert converters.convert_types(frame(), source="unknown")["note"].tolist() == ["keep", "as is"]
+
+
+def test_plan_converts_each_column_once_and_skips_absent_ones():
+    schema = schema_registry.load_schema()
+    plan = schema_registry.compile_plan(schema, ["id", "name", "age_group", "extra"], exclude=["age_group"])
+    assert sorted(plan.columns) == ["id", "name"]
+    assert schema_registry.compile_plan(schema, ["id", "name", "age_group", "extra"], exclude=["age_group"]) is plan
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from etl.load.schema_tracker import diff_schemas, save_schema
+
+
+def test_diff_lists_added_removed_and_retyped_columns():
+    old = {"id": "int64", "name": "object", "gone": "float64"}
+    new = {"id": "Int64", "name": "object", "age": "int64"}
+    assert diff_schemas(old, new) == {
+        "added": {"age": "int64"},
+        "removed": {"gone": "float64"},
+        "retyped": {"id": ["int64", "Int64"]},
+    }
+    assert diff_schemas(None, {"a": "int64"})["added"] == {"a": "int64"}
+
+
+def test_schema_is_saved_only_when_it_changes(db):
+    first = save_schema(db, "people", pd.DataFrame({"id": [1], "name": ["a"]}))
+    assert first["diff"] is None and first["row_count"] == 1
+
+    assert save_schema(db, "people", pd.DataFrame({"id": [2], "name": ["b"]})) is None
+
+    changed = save_schema(db, "people", pd.DataFrame({"id": [1.5], "age": [3]}))
+    assert changed["diff"] == {
+        "added": {"age": "int64"},
+        "removed": {"name": "object"},
+        "retyped": {"id": ["int64", "float64"]},
+    }
+    assert db.schema_logs.count_documents({"collection_name": "people"}) == 2
+
+
+def test_previous_schema_is_read_back_from_the_database(db):
+    save_schema(db, "people", pd.DataFrame({"id": [1]}))
+    # another process (e.g. a batch worker) logs a change behind our back
+    db.schema_logs.insert_one({"collection_name": "people", "schema": {"id": "float64"},
+                               "timestamp": datetime.utcnow() + timedelta(seconds=1)})
+    assert save_schema(db, "people", pd.DataFrame({"id": [2.5]})) is None
+    assert save_schema(db, "people", pd.DataFrame({"id": [2]}))["diff"]["retyped"] == {"id": ["float64", "int64"]}
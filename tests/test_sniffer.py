@@ -0,0 +1,62 @@
+import json
+
+import pandas as pd
+import pytest
+
+from etl.extract import detect_file_type, extract_data
+from etl.extract.sniffer import sniff_delimiter, sniff_file_type
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def people(tmp_path, sep, name):
+    lines = [sep.join(["id", "First Name", "city"])]
+    lines += [sep.join([str(i), f"name{i}", f"city{i % 3}"]) for i in range(5)]
+    return write(tmp_path, name, "\n".join(lines) + "\n")
+
+
+@pytest.mark.parametrize("sep", [",", "\t", ";", "|"])
+def test_delimiter_is_sniffed_from_content(tmp_path, sep):
+    path = people(tmp_path, sep, "people.txt")
+    assert sniff_delimiter(path) == sep
+    assert list(extract_data(path, use_cache=False).columns) == ["id", "First Name", "city"]
+
+
+def test_quoted_separators_do_not_fool_the_sniffer(tmp_path):
+    path = write(tmp_path, "quoted.csv", 'a;b\n"x,y";1\n"z,w";2\n')
+    assert sniff_delimiter(path) == ";"
+
+
+def test_content_wins_over_a_wrong_extension(tmp_path):
+    json_txt = write(tmp_path, "export.txt", json.dumps([{"id": 1}, {"id": 2}]))
+    ndjson_csv = write(tmp_path, "export.csv", '{"id": 1}\n{"id": 2}\n')
+    html_xls = write(tmp_path, "export.xls", "<html><body><table><tr><th>id</th></tr><tr><td>1</td></tr></table></body></html>")
+    pd.DataFrame({"id": [1]}).to_parquet(tmp_path / "export.dat")
+
+    assert detect_file_type(json_txt) == "json"
+    assert sniff_file_type(ndjson_csv) == "ndjson"
+    assert detect_file_type(html_xls) == "html"
+    assert detect_file_type(str(tmp_path / "export.dat")) == "parquet"
+    assert extract_data(json_txt, use_cache=False)["id"].tolist() == [1, 2]
+    assert extract_data(html_xls, use_cache=False)["id"].tolist() == [1]
+
+
+def test_delimited_text_keeps_its_extension(tmp_path):
+    assert detect_file_type(people(tmp_path, "\t", "people.tsv")) == "tsv"
+
+
+@pytest.mark.parametrize("text, expected", [("42", {"value": 42}), ('"hello"', {"value": "hello"})])
+def test_scalar_json_root_is_not_read_as_csv(tmp_path, text, expected):
+    path = write(tmp_path, "scalar.json", text)
+    assert detect_file_type(path) == "json"
+    assert extract_data(path, use_cache=False).to_dict("records") == [expected]
+
+
+def test_xml_feed_with_table_elements_stays_xml(tmp_path):
+    feed = '<?xml version="1.0"?>\n<rows><table>t1</table><table>t2</table></rows>\n'
+    assert sniff_file_type(write(tmp_path, "feed.dat", feed)) == "xml"
+    assert sniff_file_type(write(tmp_path, "frag.dat", "<table><tr><td>1</td></tr></table>")) == "html"
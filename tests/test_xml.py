@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from etl.extract import extract_data
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+FEED = """<?xml version="1.0"?>
+<feed xmlns:x="urn:x">
+  <meta><title>ignored</title></meta>
+  <items>
+    <x:item id="1"><name>a</name><price>1.5</price></x:item>
+    <x:item id="2"><name>b</name><price>2</price><!-- note --></x:item>
+    <x:item id="3"><name>c</name></x:item>
+  </items>
+</feed>
+"""
+
+
+def test_sample_xml_matches_pandas(data_file):
+    path = data_file("day6.xml")
+    pd.testing.assert_frame_equal(extract_data(path, use_cache=False), pd.read_xml(path))
+
+
+@pytest.mark.parametrize("record", ["item", "//item", "/feed/items/item", "//items/*"])
+def test_xml_record_paths(tmp_path, record):
+    path = write(tmp_path, "feed.xml", FEED)
+    df = extract_data(path, use_cache=False, xml_record=record)
+    assert df["id"].tolist() == [1, 2, 3]
+    assert df["name"].tolist() == ["a", "b", "c"]
+    assert df["price"].tolist()[:2] == [1.5, 2.0] and pd.isna(df["price"].iloc[2])
+
+
+def test_xml_chunks_match_the_whole_read(tmp_path):
+    path = write(tmp_path, "feed.xml", FEED)
+    chunks = list(extract_data(path, chunksize=2, xml_record="item"))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks, ignore_index=True)["name"].tolist() == ["a", "b", "c"]
+
+
+def test_xml_predicates_are_not_streamable(tmp_path):
+    path = write(tmp_path, "feed.xml", FEED)
+    with pytest.raises(ValueError, match="not streamable"):
+        extract_data(path, use_cache=False, xml_record="//item[@id='1']", raise_errors=True)